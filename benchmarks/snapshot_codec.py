@@ -0,0 +1,175 @@
+"""Benchmark per-record snapshot decode cost.
+
+Compares the shared codec in `adapters.snapshot_codec` with the per-field
+decoder the JSON adapters used before it, on a synthetic snapshot payload,
+then compares file size and parse-plus-decode cost of the row and columnar
+layouts for both schema versions.
+
+Run with `uv run python benchmarks/snapshot_codec.py [--records N]`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from dataclasses import replace
+from datetime import datetime, timedelta
+from typing import cast
+
+from python_learning_orchestrated.adapters.snapshot_codec import (
+    snapshot_from_payload,
+    snapshot_to_payload,
+)
+from python_learning_orchestrated.domain.practice import (
+    Attempt,
+    AttemptOutcome,
+    LearningItem,
+)
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    snapshot = _snapshot(args.records)
+    payload = json.loads(json.dumps(snapshot_to_payload(snapshot)))
+    record_count = len(payload["items"]) + len(payload["attempts"])
+    assert _legacy_snapshot_from_payload(payload) == snapshot_from_payload(payload)
+
+    for name, decode in (
+        ("legacy per-field decoder", _legacy_snapshot_from_payload),
+        ("shared snapshot codec", snapshot_from_payload),
+    ):
+        seconds = _best_of(args.repeat, decode, payload)
+        print(f"{name:<26} {seconds * 1e9 / record_count:8.1f} ns/record")
+
+    print()
+    for version in (1, 2):
+        for columnar in (False, True):
+            document = json.dumps(
+                snapshot_to_payload(
+                    replace(snapshot, version=version), columnar=columnar
+                )
+            )
+            seconds = _best_of(
+                args.repeat,
+                lambda text: snapshot_from_payload(json.loads(text)),
+                document,
+            )
+            layout = "columnar" if columnar else "row"
+            print(
+                f"v{version} {layout:<9} {len(document) / 1e6:7.2f} MB "
+                f"{seconds * 1e9 / record_count:8.1f} ns/record (parse + decode)"
+            )
+
+
+def _best_of[T](
+    repeat: int, decode: Callable[[T], ProgressSnapshot], payload: T
+) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        decode(payload)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def _snapshot(record_count: int) -> ProgressSnapshot:
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    item_count = max(1, record_count // 10)
+    items = [
+        LearningItem(
+            id=f"item-{index}",
+            prompt=f"Prompt {index}",
+            status="review" if index % 2 else "new",
+            order=index,
+            due_at=start + timedelta(days=index % 30) if index % 2 else None,
+            review_level=index % 5,
+            interval_minutes=(index % 5) * 1440,
+        )
+        for index in range(item_count)
+    ]
+    outcomes: list[AttemptOutcome] = ["correct", "incorrect", "skip"]
+    attempts = [
+        Attempt(
+            item_id=f"item-{index % item_count}",
+            timestamp=start + timedelta(seconds=index),
+            outcome=outcomes[index % 3],
+        )
+        for index in range(record_count - item_count)
+    ]
+    return ProgressSnapshot(
+        version=1, exported_at=start, items=items, attempts=attempts
+    )
+
+
+def _legacy_snapshot_from_payload(payload: dict[str, object]) -> ProgressSnapshot:
+    raw_items = payload.get("items", [])
+    raw_attempts = payload.get("attempts", [])
+    item_entries = raw_items if isinstance(raw_items, list) else []
+    attempt_entries = raw_attempts if isinstance(raw_attempts, list) else []
+    exported_at_raw = payload.get("exported_at")
+    return ProgressSnapshot(
+        version=_legacy_to_int(payload.get("version"), 1),
+        exported_at=(
+            datetime.fromisoformat(exported_at_raw)
+            if isinstance(exported_at_raw, str)
+            else datetime.fromtimestamp(0)
+        ),
+        items=[
+            _legacy_item_from_dict(entry)
+            for entry in item_entries
+            if isinstance(entry, dict)
+        ],
+        attempts=[
+            _legacy_attempt_from_dict(entry)
+            for entry in attempt_entries
+            if isinstance(entry, dict)
+            and isinstance(entry.get("item_id"), str)
+            and isinstance(entry.get("timestamp"), str)
+        ],
+    )
+
+
+def _legacy_item_from_dict(payload: dict[str, object]) -> LearningItem:
+    due_at_raw = payload.get("due_at")
+    due_at = datetime.fromisoformat(due_at_raw) if isinstance(due_at_raw, str) else None
+    return LearningItem(
+        id=str(payload.get("id", "")),
+        prompt=str(payload.get("prompt", "")),
+        status="review" if payload.get("status") == "review" else "new",
+        order=_legacy_to_int(payload.get("order"), 0),
+        due_at=due_at,
+        review_level=_legacy_to_int(payload.get("review_level"), 0),
+        interval_minutes=_legacy_to_int(payload.get("interval_minutes"), 0),
+    )
+
+
+def _legacy_attempt_from_dict(payload: dict[str, object]) -> Attempt:
+    outcome = str(payload.get("outcome", "skip"))
+    normalized = outcome if outcome in {"correct", "incorrect", "skip"} else "skip"
+    return Attempt(
+        item_id=str(payload.get("item_id", "")),
+        timestamp=datetime.fromisoformat(str(payload.get("timestamp"))),
+        outcome=cast(AttemptOutcome, normalized),
+    )
+
+
+def _legacy_to_int(value: object, default: int) -> int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return default
+    return default
+
+
+if __name__ == "__main__":
+    main()
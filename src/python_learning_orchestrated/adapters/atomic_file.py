@@ -0,0 +1,75 @@
+"""Atomic file replacement shared by the file-backed adapters.
+
+Contents are written to a temporary file next to the target, flushed and
+fsynced, then moved over the target with `os.replace`, so readers see either
+the old file or the complete new one. The temporary file is removed if any
+step fails.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+from collections.abc import Callable
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from typing import IO
+
+type BinaryWriter = Callable[[IO[bytes]], None]
+
+
+def replace_file(target: Path, write: BinaryWriter) -> None:
+    """Atomically replace `target` with what `write` writes."""
+    temp_path = write_temp_file(target, write)
+    try:
+        os.replace(temp_path, target)
+    finally:
+        temp_path.unlink(missing_ok=True)
+
+
+def write_bytes(target: Path, data: bytes) -> None:
+    """Atomically replace `target` with `data`."""
+
+    def write(temp_file: IO[bytes]) -> None:
+        temp_file.write(data)
+
+    replace_file(target, write)
+
+
+def write_temp_file(target: Path, write: BinaryWriter) -> Path:
+    """Write and fsync a temporary file next to `target` and return its path.
+
+    Callers that replace several files together rename the returned paths
+    themselves and must unlink them if a rename fails.
+    """
+    with NamedTemporaryFile(
+        mode="wb",
+        dir=target.parent,
+        prefix=f"{target.name}.",
+        suffix=".tmp",
+        delete=False,
+    ) as temp_file:
+        temp_path = Path(temp_file.name)
+        try:
+            write(temp_file)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+        except BaseException:
+            temp_file.close()
+            temp_path.unlink(missing_ok=True)
+            raise
+    return temp_path
+
+
+def text_writer(write: Callable[[IO[str]], None]) -> BinaryWriter:
+    """Adapt a UTF-8 text writer, such as `json.dump`, to `replace_file`."""
+
+    def write_text(raw_file: IO[bytes]) -> None:
+        text_file = io.TextIOWrapper(raw_file, encoding="utf-8")
+        try:
+            write(text_file)
+        finally:
+            text_file.flush()
+            text_file.detach()
+
+    return write_text
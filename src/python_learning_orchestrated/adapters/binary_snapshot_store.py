@@ -0,0 +1,386 @@
+"""Versioned binary progress snapshot format readable through `mmap`.
+
+Layout (little-endian):
+
+- header: magic, format version, snapshot version, `exported_at`, then the
+  string/item/attempt counts and section offsets;
+- string table: `string_count + 1` uint64 offsets followed by UTF-8 data
+  holding every interned item id and prompt once;
+- items: fixed-width records of string indexes, status byte, `order`,
+  `due_at`, `review_level` and `interval_minutes`;
+- attempts: fixed-width records of item id index, outcome byte and timestamp.
+
+Timestamps are integer microseconds since the Unix epoch, a flag byte that
+records whether the original datetime was naive (stored as UTC wall time) or
+timezone-aware (normalized to UTC), and an int16 UTC offset in minutes for
+aware values. Aware timestamps come back with their original fixed offset;
+offsets that are not whole minutes, and time zone names, keep only the
+instant and come back in UTC. Files written before the offset field have
+zeros there and read back in UTC. Because
+every record has a fixed width, the header and counts are available without
+touching the body and any record can be decoded on demand.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta, timezone
+from pathlib import Path
+from types import TracebackType
+from typing import IO
+
+from python_learning_orchestrated.adapters.atomic_file import replace_file
+from python_learning_orchestrated.adapters.json_file_progress_snapshot_store import (
+    progress_snapshot_from_payload,
+    progress_snapshot_to_payload,
+)
+from python_learning_orchestrated.domain.practice import (
+    Attempt,
+    AttemptOutcome,
+    LearningItem,
+)
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+from python_learning_orchestrated.ports.progress_snapshot_store import (
+    ProgressSnapshotStore,
+    SnapshotRecord,
+)
+
+BINARY_SNAPSHOT_MAGIC = b"PLOSNAP\x00"
+BINARY_SNAPSHOT_FORMAT_VERSION = 1
+BINARY_SNAPSHOT_SUFFIX = ".plsnap"
+
+_HEADER = struct.Struct("<8sH2xiqBxh4xQQQQQQ")
+_OFFSET = struct.Struct("<Q")
+_ITEM = struct.Struct("<IIBBhqqqq")
+_ATTEMPT = struct.Struct("<IBBhq")
+
+_NO_TIMESTAMP = 0
+_NAIVE_TIMESTAMP = 1
+_AWARE_TIMESTAMP = 2
+
+_OUTCOMES: tuple[AttemptOutcome, ...] = ("correct", "incorrect", "skip")
+_OUTCOME_CODES = {outcome: code for code, outcome in enumerate(_OUTCOMES)}
+
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+_AWARE_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_MINUTE = timedelta(minutes=1)
+
+
+class BinarySnapshotReader:
+    """Lazily read a binary snapshot file through a read-only memory map."""
+
+    def __init__(self, file_path: str | Path) -> None:
+        self._file_path = Path(file_path)
+        with self._file_path.open("rb") as snapshot_file:
+            if os.fstat(snapshot_file.fileno()).st_size < _HEADER.size:
+                raise ValueError(f"Binary snapshot {self._file_path} is truncated")
+            self._mmap = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+        (
+            magic,
+            format_version,
+            version,
+            exported_at_micros,
+            exported_at_flag,
+            exported_at_offset,
+            string_count,
+            item_count,
+            attempt_count,
+            strings_position,
+            items_position,
+            attempts_position,
+        ) = _HEADER.unpack_from(self._mmap, 0)
+        if magic != BINARY_SNAPSHOT_MAGIC:
+            self.close()
+            raise ValueError(f"{self._file_path} is not a binary progress snapshot")
+        if format_version != BINARY_SNAPSHOT_FORMAT_VERSION:
+            self.close()
+            raise ValueError(
+                f"Unsupported binary snapshot format version {format_version}"
+            )
+        exported_at = _decode_timestamp(
+            exported_at_micros, exported_at_flag, exported_at_offset
+        )
+        self._version: int = version
+        self._exported_at = exported_at or datetime.fromtimestamp(0)
+        self._string_count: int = string_count
+        self._item_count: int = item_count
+        self._attempt_count: int = attempt_count
+        self._strings_position: int = strings_position
+        self._items_position: int = items_position
+        self._attempts_position: int = attempts_position
+        self._string_data_position = (
+            strings_position + (string_count + 1) * _OFFSET.size
+        )
+
+    def __enter__(self) -> BinarySnapshotReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Release the memory map."""
+        self._mmap.close()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def exported_at(self) -> datetime:
+        return self._exported_at
+
+    @property
+    def item_count(self) -> int:
+        return self._item_count
+
+    @property
+    def attempt_count(self) -> int:
+        return self._attempt_count
+
+    def string(self, index: int) -> str:
+        """Decode one entry of the interned string table."""
+        start, end = self._string_bounds(index)
+        return str(self._mmap[start:end], "utf-8")
+
+    def item(self, index: int) -> LearningItem:
+        """Decode the item record at `index`."""
+        if not 0 <= index < self._item_count:
+            raise IndexError(index)
+        return self._item_at(self._items_position + index * _ITEM.size)
+
+    def attempt(self, index: int) -> Attempt:
+        """Decode the attempt record at `index`."""
+        if not 0 <= index < self._attempt_count:
+            raise IndexError(index)
+        return self._attempt_at(self._attempts_position + index * _ATTEMPT.size)
+
+    def iter_items(self) -> Iterator[LearningItem]:
+        """Yield items in stored order, decoding one record at a time."""
+        for index in range(self._item_count):
+            yield self._item_at(self._items_position + index * _ITEM.size)
+
+    def iter_attempts(self) -> Iterator[Attempt]:
+        """Yield attempts in stored order, decoding one record at a time."""
+        for index in range(self._attempt_count):
+            yield self._attempt_at(self._attempts_position + index * _ATTEMPT.size)
+
+    def to_snapshot(self) -> ProgressSnapshot:
+        """Decode the whole file into a `ProgressSnapshot`."""
+        return ProgressSnapshot(
+            version=self._version,
+            exported_at=self._exported_at,
+            items=list(self.iter_items()),
+            attempts=list(self.iter_attempts()),
+        )
+
+    def _string_bounds(self, index: int) -> tuple[int, int]:
+        if not 0 <= index < self._string_count:
+            raise IndexError(index)
+        offsets_position = self._strings_position + index * _OFFSET.size
+        start = _OFFSET.unpack_from(self._mmap, offsets_position)[0]
+        end = _OFFSET.unpack_from(self._mmap, offsets_position + _OFFSET.size)[0]
+        return self._string_data_position + start, self._string_data_position + end
+
+    def _item_at(self, position: int) -> LearningItem:
+        (
+            id_index,
+            prompt_index,
+            status,
+            due_at_flag,
+            due_at_offset,
+            order,
+            due_at_micros,
+            review_level,
+            interval_minutes,
+        ) = _ITEM.unpack_from(self._mmap, position)
+        return LearningItem(
+            id=self.string(id_index),
+            prompt=self.string(prompt_index),
+            status="review" if status == 1 else "new",
+            order=order,
+            due_at=_decode_timestamp(due_at_micros, due_at_flag, due_at_offset),
+            review_level=review_level,
+            interval_minutes=interval_minutes,
+        )
+
+    def _attempt_at(self, position: int) -> Attempt:
+        item_index, outcome, timestamp_flag, timestamp_offset, timestamp_micros = (
+            _ATTEMPT.unpack_from(self._mmap, position)
+        )
+        timestamp = _decode_timestamp(
+            timestamp_micros, timestamp_flag, timestamp_offset
+        )
+        return Attempt(
+            item_id=self.string(item_index),
+            timestamp=timestamp or datetime.fromtimestamp(0),
+            outcome=_OUTCOMES[outcome] if outcome < len(_OUTCOMES) else "skip",
+        )
+
+
+class BinaryProgressSnapshotStore(ProgressSnapshotStore):
+    """Read and write progress snapshots in the binary snapshot format."""
+
+    def __init__(self, file_path: str | Path) -> None:
+        self._file_path = Path(file_path)
+        self._file_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def open(self) -> BinarySnapshotReader:
+        """Open the snapshot for lazy, record-at-a-time reads."""
+        return BinarySnapshotReader(self._file_path)
+
+    def load(self) -> ProgressSnapshot:
+        with self.open() as reader:
+            return reader.to_snapshot()
+
+    def save(self, snapshot: ProgressSnapshot) -> None:
+        write_binary_snapshot(self._file_path, snapshot)
+
+    def read_exported_at(self) -> datetime:
+        """Return the export time from the header without reading records."""
+        with self.open() as reader:
+            return reader.exported_at
+
+    def iter_records(self) -> Iterator[SnapshotRecord]:
+        with self.open() as reader:
+            yield from reader.iter_items()
+            yield from reader.iter_attempts()
+
+
+def write_binary_snapshot(file_path: str | Path, snapshot: ProgressSnapshot) -> None:
+    """Atomically write `snapshot` to `file_path` in the binary format.
+
+    Delta snapshots are rejected because the format has no watermark field.
+    """
+    if snapshot.delta_since is not None:
+        raise ValueError("Binary snapshots cannot store delta exports")
+    replace_file(
+        Path(file_path), lambda temp_file: _write_snapshot(temp_file, snapshot)
+    )
+
+
+def payload_to_binary_snapshot(
+    payload: dict[str, object], file_path: str | Path
+) -> None:
+    """Convert a `progress_snapshot_to_payload` JSON payload to a binary file."""
+    write_binary_snapshot(file_path, progress_snapshot_from_payload(payload))
+
+
+def binary_snapshot_to_payload(file_path: str | Path) -> dict[str, object]:
+    """Convert a binary snapshot file to the stable JSON payload shape."""
+    with BinarySnapshotReader(file_path) as reader:
+        return progress_snapshot_to_payload(reader.to_snapshot())
+
+
+def _write_snapshot(output: IO[bytes], snapshot: ProgressSnapshot) -> None:
+    string_indexes: dict[str, int] = {}
+    encoded_strings: list[bytes] = []
+
+    def intern(value: str) -> int:
+        index = string_indexes.get(value)
+        if index is None:
+            index = len(encoded_strings)
+            string_indexes[value] = index
+            encoded_strings.append(value.encode("utf-8"))
+        return index
+
+    item_records = []
+    for item in snapshot.items:
+        due_at_micros, due_at_flag, due_at_offset = _encode_timestamp(item.due_at)
+        item_records.append(
+            _ITEM.pack(
+                intern(item.id),
+                intern(item.prompt),
+                1 if item.status == "review" else 0,
+                due_at_flag,
+                due_at_offset,
+                item.order,
+                due_at_micros,
+                item.review_level,
+                item.interval_minutes,
+            )
+        )
+    attempt_records = []
+    for attempt in snapshot.attempts:
+        timestamp_micros, timestamp_flag, timestamp_offset = _encode_timestamp(
+            attempt.timestamp
+        )
+        attempt_records.append(
+            _ATTEMPT.pack(
+                intern(attempt.item_id),
+                _OUTCOME_CODES.get(attempt.outcome, _OUTCOME_CODES["skip"]),
+                timestamp_flag,
+                timestamp_offset,
+                timestamp_micros,
+            )
+        )
+
+    strings_position = _HEADER.size
+    string_data_size = sum(len(encoded) for encoded in encoded_strings)
+    items_position = (
+        strings_position + (len(encoded_strings) + 1) * _OFFSET.size + string_data_size
+    )
+    attempts_position = items_position + len(item_records) * _ITEM.size
+    exported_at_micros, exported_at_flag, exported_at_offset = _encode_timestamp(
+        snapshot.exported_at
+    )
+
+    output.write(
+        _HEADER.pack(
+            BINARY_SNAPSHOT_MAGIC,
+            BINARY_SNAPSHOT_FORMAT_VERSION,
+            snapshot.version,
+            exported_at_micros,
+            exported_at_flag,
+            exported_at_offset,
+            len(encoded_strings),
+            len(item_records),
+            len(attempt_records),
+            strings_position,
+            items_position,
+            attempts_position,
+        )
+    )
+    offset = 0
+    output.write(_OFFSET.pack(offset))
+    for encoded in encoded_strings:
+        offset += len(encoded)
+        output.write(_OFFSET.pack(offset))
+    output.writelines(encoded_strings)
+    output.writelines(item_records)
+    output.writelines(attempt_records)
+
+
+def _encode_timestamp(value: datetime | None) -> tuple[int, int, int]:
+    """Return microseconds, flag and UTC offset in minutes for `value`."""
+    if value is None:
+        return 0, _NO_TIMESTAMP, 0
+    if value.tzinfo is None:
+        return (value - _NAIVE_EPOCH) // _MICROSECOND, _NAIVE_TIMESTAMP, 0
+    utc_offset = value.utcoffset() or timedelta()
+    offset_minutes, remainder = divmod(utc_offset, _MINUTE)
+    return (
+        (value - _AWARE_EPOCH) // _MICROSECOND,
+        _AWARE_TIMESTAMP,
+        0 if remainder else offset_minutes,
+    )
+
+
+def _decode_timestamp(micros: int, flag: int, offset_minutes: int) -> datetime | None:
+    if flag == _NAIVE_TIMESTAMP:
+        return _NAIVE_EPOCH + timedelta(microseconds=micros)
+    if flag == _AWARE_TIMESTAMP:
+        value = _AWARE_EPOCH + timedelta(microseconds=micros)
+        if offset_minutes:
+            return value.astimezone(timezone(offset_minutes * _MINUTE))
+        return value
+    return None
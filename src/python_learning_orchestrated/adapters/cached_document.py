@@ -0,0 +1,79 @@
+"""Read-through cache for JSON documents backed by a single file."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+FileSignature = tuple[int, int, int]
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    """Hit/miss counters for a cached document."""
+
+    hits: int
+    misses: int
+
+
+class CachedDocument[T]:
+    """Keep the decoded content of a file in memory until the file changes.
+
+    The cached value is revalidated on every `load` by comparing the file's
+    `(st_mtime_ns, st_size, st_ino)` with the signature recorded when it was
+    read, so an unchanged file costs one `stat` instead of a read and parse.
+    Writers call `store` right after replacing the file so their own writes
+    refresh the cache without a re-read. Cached values are shared; callers
+    must copy before mutating them.
+    """
+
+    def __init__(self, file_path: Path, read: Callable[[], T]) -> None:
+        self._file_path = file_path
+        self._read = read
+        self._value: T | None = None
+        self._signature: FileSignature | None = None
+        self._loaded = False
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> CacheStats:
+        """Return hit/miss counters for monitoring."""
+        return CacheStats(hits=self._hits, misses=self._misses)
+
+    def load(self) -> T:
+        """Return the cached value, re-reading the file only if it changed."""
+        signature = _file_signature(self._file_path)
+        if self._loaded and signature == self._signature:
+            self._hits += 1
+            return self._value  # type: ignore[return-value]
+
+        self._misses += 1
+        value = self._read()
+        self._remember(value, signature)
+        return value
+
+    def store(self, value: T) -> None:
+        """Cache a value that was just written to the file."""
+        self._remember(value, _file_signature(self._file_path))
+
+    def invalidate(self) -> None:
+        """Drop the cached value so the next load re-reads the file."""
+        self._value = None
+        self._signature = None
+        self._loaded = False
+
+    def _remember(self, value: T, signature: FileSignature | None) -> None:
+        self._value = value
+        self._signature = signature
+        self._loaded = True
+
+
+def _file_signature(file_path: Path) -> FileSignature | None:
+    try:
+        stat_result = os.stat(file_path)
+    except FileNotFoundError:
+        return None
+    return (stat_result.st_mtime_ns, stat_result.st_size, stat_result.st_ino)
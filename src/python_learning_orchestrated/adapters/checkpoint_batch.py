@@ -0,0 +1,310 @@
+"""Batch checkpoint loading and verification.
+
+Checkpoint files and chunks are read on a thread pool and decoded on a
+process pool, or in the calling process when there is only one worker or
+one checkpoint, so callers without a `__main__` guard still work there.
+`decode_chunk` and `decode_inline_progress` take raw bytes read by the
+caller and return picklable results, so they can run in worker processes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Callable
+from concurrent.futures import (
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+)
+from dataclasses import dataclass, replace
+from multiprocessing import get_context
+
+from python_learning_orchestrated.adapters.checkpoint_manifest import (
+    CheckpointRecord,
+    checkpoint_metadata,
+    chunk_digests,
+    content_hash,
+    to_count,
+)
+from python_learning_orchestrated.adapters.snapshot_codec import (
+    attempts_from_payload,
+    items_from_payload,
+    snapshot_from_payload,
+)
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+
+_READ_WORKERS = 8
+
+
+@dataclass(frozen=True)
+class CheckpointStatus:
+    """Outcome of loading or verifying one checkpoint."""
+
+    name: str
+    error: str | None
+    item_count: int = 0
+    attempt_count: int = 0
+    content_hash: str | None = None
+    record: CheckpointRecord | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedChunk:
+    """Verification result for one chunk, with its entries if requested."""
+
+    error: str | None
+    item_count: int = 0
+    attempt_count: int = 0
+    items: list[LearningItem] | None = None
+    attempts: list[Attempt] | None = None
+
+
+@dataclass(frozen=True, slots=True)
+class DecodedInlineProgress:
+    """Verification result for a checkpoint with inline progress."""
+
+    error: str | None
+    item_count: int = 0
+    attempt_count: int = 0
+    progress: ProgressSnapshot | None = None
+
+
+def decode_chunk(digest: str, data: bytes, keep_entries: bool) -> DecodedChunk:
+    """Check a chunk against its digest and decode its items or attempts."""
+    if hashlib.sha256(data).hexdigest() != digest:
+        return DecodedChunk(error="does not match its digest")
+    try:
+        parsed = json.loads(data)
+    except ValueError:
+        return DecodedChunk(error="is not valid JSON")
+    payload = parsed if isinstance(parsed, dict) else {}
+    try:
+        items = items_from_payload(payload.get("items", []))
+        attempts = attempts_from_payload(payload.get("attempts", []))
+    except (TypeError, ValueError) as exc:
+        return DecodedChunk(error=f"cannot be decoded: {exc}")
+    return DecodedChunk(
+        error=None,
+        item_count=len(items),
+        attempt_count=len(attempts),
+        items=items if keep_entries else None,
+        attempts=attempts if keep_entries else None,
+    )
+
+
+def decode_inline_progress(data: bytes, keep_progress: bool) -> DecodedInlineProgress:
+    """Decode the inline `progress` of a checkpoint file."""
+    try:
+        parsed = json.loads(data)
+    except ValueError:
+        return DecodedInlineProgress(error="is not valid JSON")
+    payload = parsed if isinstance(parsed, dict) else {}
+    progress_payload = payload.get("progress")
+    if not isinstance(progress_payload, dict):
+        return DecodedInlineProgress(error="has no progress")
+    try:
+        progress = snapshot_from_payload(progress_payload)
+    except (TypeError, ValueError) as exc:
+        return DecodedInlineProgress(error=f"cannot be decoded: {exc}")
+    return DecodedInlineProgress(
+        error=None,
+        item_count=len(progress.items),
+        attempt_count=len(progress.attempts),
+        progress=progress if keep_progress else None,
+    )
+
+
+def load_checkpoint_batch(
+    names: list[str],
+    *,
+    read_checkpoint: Callable[[str], bytes],
+    read_chunk: Callable[[str], bytes],
+    keep_records: bool,
+    max_workers: int | None,
+) -> list[CheckpointStatus]:
+    """Load or verify the named checkpoints, one status per name.
+
+    `read_checkpoint` returns a checkpoint file's bytes by name and
+    `read_chunk` a chunk's bytes by digest; both run on a thread pool. Each
+    distinct chunk is read and decoded once.
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(names))
+    with (
+        ThreadPoolExecutor(max_workers=_READ_WORKERS) as readers,
+        (
+            ProcessPoolExecutor(max_workers=workers, mp_context=get_context("spawn"))
+            if workers > 1
+            else _InProcessExecutor()
+        ) as decoders,
+    ):
+        file_reads = [readers.submit(read_checkpoint, name) for name in names]
+        files: list[bytes | str] = []
+        chunk_reads: dict[str, Future[bytes]] = {}
+        inline_decodes: dict[int, Future[DecodedInlineProgress]] = {}
+        for position, file_read in enumerate(file_reads):
+            try:
+                data = file_read.result()
+            except FileNotFoundError:
+                files.append("checkpoint not found")
+                continue
+            except (OSError, ValueError) as exc:
+                files.append(str(exc))
+                continue
+            files.append(data)
+            payload = _parse_checkpoint(data)
+            if isinstance(payload.get("chunks"), dict):
+                for digest in chunk_digests(payload):
+                    if digest not in chunk_reads:
+                        chunk_reads[digest] = readers.submit(read_chunk, digest)
+            elif payload:
+                inline_decodes[position] = decoders.submit(
+                    decode_inline_progress, data, keep_records
+                )
+        chunk_decodes: dict[str, Future[DecodedChunk] | None] = {}
+        for digest, chunk_read in chunk_reads.items():
+            try:
+                chunk_data = chunk_read.result()
+            except OSError:
+                chunk_decodes[digest] = None
+                continue
+            chunk_decodes[digest] = decoders.submit(
+                decode_chunk, digest, chunk_data, keep_records
+            )
+        chunks = {
+            digest: (
+                decode.result()
+                if decode is not None
+                else DecodedChunk(error="is missing")
+            )
+            for digest, decode in chunk_decodes.items()
+        }
+        inline = {
+            position: decode.result() for position, decode in inline_decodes.items()
+        }
+    return [
+        _batch_status(name, data, chunks, inline.get(position), keep_records)
+        for position, (name, data) in enumerate(zip(names, files, strict=True))
+    ]
+
+
+class _InProcessExecutor(Executor):
+    """Run each submitted call right away in the calling thread."""
+
+    def submit[**P, T](
+        self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs
+    ) -> Future[T]:
+        future: Future[T] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _parse_checkpoint(data: bytes) -> dict[str, object]:
+    try:
+        parsed = json.loads(data)
+    except ValueError:
+        return {}
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def _batch_status(
+    name: str,
+    data: bytes | str,
+    chunks: dict[str, DecodedChunk],
+    inline: DecodedInlineProgress | None,
+    keep_records: bool,
+) -> CheckpointStatus:
+    """Combine a checkpoint file and its decoded chunks into a status."""
+    if isinstance(data, str):
+        return CheckpointStatus(name=name, error=data)
+    data_hash = content_hash(data)
+    payload = _parse_checkpoint(data)
+    try:
+        metadata = checkpoint_metadata(payload, name)
+    except ValueError:
+        return CheckpointStatus(
+            name=name, error="checkpoint file is not valid", content_hash=data_hash
+        )
+    progress_payload = payload.get("progress")
+    raw_chunks = payload.get("chunks")
+    if not isinstance(raw_chunks, dict):
+        if inline is None or inline.error is not None:
+            error = inline.error if inline is not None else "has no progress"
+            return CheckpointStatus(
+                name=name, error=f"progress {error}", content_hash=data_hash
+            )
+        return CheckpointStatus(
+            name=name,
+            error=None,
+            item_count=inline.item_count,
+            attempt_count=inline.attempt_count,
+            content_hash=data_hash,
+            record=(
+                CheckpointRecord(metadata=metadata, progress=inline.progress)
+                if inline.progress is not None
+                else None
+            ),
+        )
+    items: list[LearningItem] = []
+    attempts: list[Attempt] = []
+    item_count = 0
+    attempt_count = 0
+    for digest in chunk_digests(payload):
+        decoded = chunks[digest]
+        if decoded.error is not None:
+            return CheckpointStatus(
+                name=name,
+                error=f"chunk {digest[:12]} {decoded.error}",
+                content_hash=data_hash,
+            )
+        item_count += decoded.item_count
+        attempt_count += decoded.attempt_count
+        items.extend(decoded.items or [])
+        attempts.extend(decoded.attempts or [])
+    expected = (
+        to_count(raw_chunks.get("item_count")),
+        to_count(raw_chunks.get("attempt_count")),
+    )
+    if (item_count, attempt_count) != expected:
+        return CheckpointStatus(
+            name=name,
+            error=(
+                f"chunks hold {item_count} items and {attempt_count} attempts, "
+                f"expected {expected[0]} and {expected[1]}"
+            ),
+            content_hash=data_hash,
+        )
+    try:
+        header = snapshot_from_payload(
+            progress_payload if isinstance(progress_payload, dict) else {}
+        )
+    except (TypeError, ValueError) as exc:
+        return CheckpointStatus(
+            name=name,
+            error=f"progress cannot be decoded: {exc}",
+            content_hash=data_hash,
+        )
+    record = None
+    if keep_records:
+        record = CheckpointRecord(
+            metadata=metadata,
+            progress=replace(header, items=items, attempts=attempts),
+        )
+    return CheckpointStatus(
+        name=name,
+        error=None,
+        item_count=item_count,
+        attempt_count=attempt_count,
+        content_hash=data_hash,
+        record=record,
+    )
@@ -0,0 +1,284 @@
+"""Checkpoint metadata, checkpoint file helpers and the manifest index.
+
+The manifest is a `manifest.json` next to the checkpoint files holding one
+row of metadata, counts and content hash per checkpoint, so listing and
+pruning do not parse every checkpoint. Rows whose file size or modification
+time no longer match, and files missing from the manifest, are re-read; a
+missing or unreadable manifest is rebuilt from scratch. Checkpoint files
+that cannot be read are left out of the manifest and re-read next time.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from python_learning_orchestrated.adapters.atomic_file import write_bytes
+from python_learning_orchestrated.adapters.snapshot_codec import (
+    snapshot_from_payload,
+)
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+
+CHECKPOINT_FILENAME_SUFFIX = ".checkpoint.json"
+MAX_CHECKPOINT_BYTES = 10 * 1024 * 1024
+_MANIFEST_FILENAME = "manifest.json"
+_MANIFEST_VERSION = 1
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """Lightweight metadata for a stored progress checkpoint."""
+
+    name: str
+    created_at: datetime
+    description: str | None = None
+
+
+@dataclass(frozen=True)
+class CheckpointRecord:
+    """Checkpoint metadata paired with an exported progress snapshot."""
+
+    metadata: Checkpoint
+    progress: ProgressSnapshot
+
+
+@dataclass(frozen=True)
+class CheckpointIndexEntry:
+    """Manifest row describing one checkpoint file without its progress."""
+
+    name: str
+    slug: str
+    created_at: datetime
+    description: str | None
+    size: int
+    item_count: int
+    attempt_count: int
+    content_hash: str
+    mtime_ns: int
+    data_size: int = 0
+
+    @property
+    def total_size(self) -> int:
+        """Return the checkpoint file size plus the size of its chunks."""
+        return self.size + self.data_size
+
+    @property
+    def checkpoint(self) -> Checkpoint:
+        return Checkpoint(
+            name=self.name,
+            created_at=self.created_at,
+            description=self.description,
+        )
+
+
+class CheckpointManifest:
+    """The manifest of the checkpoint files in one directory."""
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    @property
+    def _path(self) -> Path:
+        return self._directory / _MANIFEST_FILENAME
+
+    def refresh(self) -> dict[str, CheckpointIndexEntry]:
+        """Reconcile the manifest with the checkpoint files on disk.
+
+        Files that are not valid checkpoints are skipped; `checkpoint_slugs`
+        still lists them.
+        """
+        manifest = _read_manifest(self._path)
+        known = manifest or {}
+        entries: dict[str, CheckpointIndexEntry] = {}
+        changed = manifest is None
+        for file_path in self._checkpoint_files():
+            slug = slug_from_path(file_path)
+            try:
+                stat = file_path.stat()
+                entry = known.get(slug)
+                if (
+                    entry is None
+                    or entry.size != stat.st_size
+                    or entry.mtime_ns != stat.st_mtime_ns
+                ):
+                    entry = _index_entry(file_path, stat)
+                    changed = True
+            except (OSError, ValueError):
+                continue
+            entries[slug] = entry
+        if changed or entries.keys() != known.keys():
+            _write_manifest(self._path, entries)
+        return entries
+
+    def checkpoint_slugs(self) -> list[str]:
+        """Return the slugs of all checkpoint files, readable or not, sorted."""
+        return sorted(slug_from_path(path) for path in self._checkpoint_files())
+
+    def update(self, changes: dict[str, CheckpointIndexEntry | None]) -> None:
+        """Apply manifest updates by slug; `None` removes an entry."""
+        entries = _read_manifest(self._path)
+        if entries is None:
+            self.refresh()
+            return
+        for slug, entry in changes.items():
+            if entry is None:
+                entries.pop(slug, None)
+            else:
+                entries[slug] = entry
+        _write_manifest(self._path, entries)
+
+    def _checkpoint_files(self) -> Iterator[Path]:
+        return self._directory.glob(f"*{CHECKPOINT_FILENAME_SUFFIX}")
+
+
+def checkpoint_metadata(payload: dict[str, object], name: str) -> Checkpoint:
+    """Return the metadata of a parsed checkpoint file.
+
+    Raises `ValueError` if `created_at` is missing or not ISO-8601.
+    """
+    return Checkpoint(
+        name=str(payload.get("name", name)),
+        created_at=datetime.fromisoformat(str(payload.get("created_at"))),
+        description=_optional_str(payload.get("description")),
+    )
+
+
+def read_checkpoint_json(path: Path) -> dict[str, object]:
+    """Parse a checkpoint file, or return `{}` if it does not exist."""
+    if not path.exists():
+        return {}
+    if path.stat().st_size > MAX_CHECKPOINT_BYTES:
+        raise ValueError(f"Checkpoint file {path} exceeds 10MB size limit")
+    parsed = json.loads(path.read_text(encoding="utf-8"))
+    return parsed if isinstance(parsed, dict) else {}
+
+
+def chunk_digests(payload: dict[str, object]) -> Iterator[str]:
+    """Yield the item then attempt chunk digests a checkpoint refers to."""
+    chunks = payload.get("chunks")
+    if isinstance(chunks, dict):
+        yield from str_list(chunks.get("items"))
+        yield from str_list(chunks.get("attempts"))
+
+
+def str_list(value: object) -> list[str]:
+    if not isinstance(value, list):
+        return []
+    return [digest for digest in value if isinstance(digest, str)]
+
+
+def to_count(value: object) -> int:
+    return value if isinstance(value, int) and value >= 0 else 0
+
+
+def content_hash(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def slug_from_path(path: Path) -> str:
+    return path.name.removesuffix(CHECKPOINT_FILENAME_SUFFIX)
+
+
+def _optional_str(value: object) -> str | None:
+    return value if isinstance(value, str) else None
+
+
+def _index_entry(path: Path, stat: os.stat_result) -> CheckpointIndexEntry:
+    """Build a manifest entry by reading one checkpoint file."""
+    if stat.st_size > MAX_CHECKPOINT_BYTES:
+        raise ValueError(f"Checkpoint file {path} exceeds 10MB size limit")
+    data = path.read_bytes()
+    parsed = json.loads(data)
+    payload = parsed if isinstance(parsed, dict) else {}
+    chunks = payload.get("chunks")
+    if isinstance(chunks, dict):
+        item_count = to_count(chunks.get("item_count"))
+        attempt_count = to_count(chunks.get("attempt_count"))
+        data_size = to_count(chunks.get("data_size"))
+    else:
+        progress_payload = payload.get("progress")
+        progress = snapshot_from_payload(
+            progress_payload if isinstance(progress_payload, dict) else {}
+        )
+        item_count = len(progress.items)
+        attempt_count = len(progress.attempts)
+        data_size = 0
+    metadata = checkpoint_metadata(payload, slug_from_path(path))
+    return CheckpointIndexEntry(
+        name=metadata.name,
+        slug=slug_from_path(path),
+        created_at=metadata.created_at,
+        description=metadata.description,
+        size=stat.st_size,
+        item_count=item_count,
+        attempt_count=attempt_count,
+        content_hash=content_hash(data),
+        mtime_ns=stat.st_mtime_ns,
+        data_size=data_size,
+    )
+
+
+def _read_manifest(path: Path) -> dict[str, CheckpointIndexEntry] | None:
+    """Return manifest entries by slug, or None if the manifest needs a rebuild."""
+    try:
+        parsed = json.loads(path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+    if not isinstance(parsed, dict) or parsed.get("version") != _MANIFEST_VERSION:
+        return None
+    raw_entries = parsed.get("checkpoints")
+    if not isinstance(raw_entries, list):
+        return None
+    entries: dict[str, CheckpointIndexEntry] = {}
+    for raw_entry in raw_entries:
+        entry = _manifest_entry_from_dict(raw_entry)
+        if entry is not None:
+            entries[entry.slug] = entry
+    return entries
+
+
+def _manifest_entry_from_dict(raw_entry: object) -> CheckpointIndexEntry | None:
+    if not isinstance(raw_entry, dict):
+        return None
+    try:
+        return CheckpointIndexEntry(
+            name=str(raw_entry["name"]),
+            slug=str(raw_entry["slug"]),
+            created_at=datetime.fromisoformat(str(raw_entry["created_at"])),
+            description=_optional_str(raw_entry.get("description")),
+            size=int(raw_entry["size"]),
+            item_count=int(raw_entry["item_count"]),
+            attempt_count=int(raw_entry["attempt_count"]),
+            content_hash=str(raw_entry["content_hash"]),
+            mtime_ns=int(raw_entry["mtime_ns"]),
+            data_size=int(raw_entry["data_size"]),
+        )
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+def _write_manifest(path: Path, entries: dict[str, CheckpointIndexEntry]) -> None:
+    payload = {
+        "version": _MANIFEST_VERSION,
+        "checkpoints": [
+            {
+                "name": entry.name,
+                "slug": entry.slug,
+                "created_at": entry.created_at.isoformat(),
+                "description": entry.description,
+                "size": entry.size,
+                "item_count": entry.item_count,
+                "attempt_count": entry.attempt_count,
+                "content_hash": entry.content_hash,
+                "mtime_ns": entry.mtime_ns,
+                "data_size": entry.data_size,
+            }
+            for entry in (entries[slug] for slug in sorted(entries))
+        ],
+    }
+    write_bytes(path, json.dumps(payload).encode("utf-8"))
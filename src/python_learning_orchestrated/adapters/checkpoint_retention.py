@@ -0,0 +1,125 @@
+"""Retention rules deciding which checkpoints to prune."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Protocol
+
+BucketKey = Callable[[datetime], Hashable]
+
+
+class RetentionCandidate(Protocol):
+    """Checkpoint metadata a retention decision is based on."""
+
+    @property
+    def slug(self) -> str: ...
+
+    @property
+    def created_at(self) -> datetime: ...
+
+    @property
+    def total_size(self) -> int: ...
+
+
+@dataclass(frozen=True)
+class RetentionPolicy:
+    """Grandfather-father-son retention rules for checkpoints.
+
+    A checkpoint is kept if any `keep_*` rule keeps it: `keep_last` keeps the
+    newest checkpoints, and `keep_daily`/`keep_weekly`/`keep_monthly` keep the
+    newest checkpoint of each of the most recent days, ISO weeks and months
+    that have one. Without `keep_*` rules every checkpoint is kept. Then, if
+    `max_total_bytes` is set, the oldest kept checkpoints are dropped until
+    their total size fits; the newest checkpoint is always kept.
+    """
+
+    keep_last: int = 0
+    keep_daily: int = 0
+    keep_weekly: int = 0
+    keep_monthly: int = 0
+    max_total_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        counts = (self.keep_last, self.keep_daily, self.keep_weekly, self.keep_monthly)
+        if any(count < 0 for count in counts):
+            raise ValueError("retention counts must not be negative")
+        if self.max_total_bytes is not None and self.max_total_bytes < 0:
+            raise ValueError("max_total_bytes must not be negative")
+
+    @property
+    def has_keep_rules(self) -> bool:
+        return any(
+            (self.keep_last, self.keep_daily, self.keep_weekly, self.keep_monthly)
+        )
+
+    @property
+    def keeps_everything(self) -> bool:
+        """Return whether the policy never prunes anything."""
+        return not self.has_keep_rules and self.max_total_bytes is None
+
+
+def select_prunable[E: RetentionCandidate](
+    entries: Iterable[E], policy: RetentionPolicy
+) -> list[E]:
+    """Return the checkpoints `policy` does not keep, oldest first.
+
+    Only metadata is used. For `CheckpointStore` entries `total_size` counts
+    chunks shared between checkpoints once per checkpoint, so the byte limit
+    never underestimates disk use.
+    """
+    newest_first = sorted(
+        entries, key=lambda entry: (entry.created_at, entry.slug), reverse=True
+    )
+    if policy.keeps_everything:
+        return []
+    if policy.has_keep_rules:
+        kept = {entry.slug for entry in newest_first[: policy.keep_last]}
+        for count, bucket in (
+            (policy.keep_daily, _day),
+            (policy.keep_weekly, _iso_week),
+            (policy.keep_monthly, _month),
+        ):
+            kept.update(_newest_per_bucket(newest_first, bucket, count))
+    else:
+        kept = {entry.slug for entry in newest_first}
+    if policy.max_total_bytes is not None:
+        kept_newest_first = [entry for entry in newest_first if entry.slug in kept]
+        total = 0
+        for position, entry in enumerate(kept_newest_first):
+            total += entry.total_size
+            if position > 0 and total > policy.max_total_bytes:
+                kept.difference_update(
+                    dropped.slug for dropped in kept_newest_first[position:]
+                )
+                break
+    return [entry for entry in reversed(newest_first) if entry.slug not in kept]
+
+
+def _newest_per_bucket(
+    newest_first: Sequence[RetentionCandidate], bucket: BucketKey, count: int
+) -> list[str]:
+    seen: set[Hashable] = set()
+    slugs: list[str] = []
+    for entry in newest_first:
+        if len(seen) >= count:
+            break
+        key = bucket(entry.created_at)
+        if key not in seen:
+            seen.add(key)
+            slugs.append(entry.slug)
+    return slugs
+
+
+def _day(value: datetime) -> Hashable:
+    return value.date()
+
+
+def _iso_week(value: datetime) -> Hashable:
+    year, week, _ = value.isocalendar()
+    return (year, week)
+
+
+def _month(value: datetime) -> Hashable:
+    return (value.year, value.month)
@@ -1,49 +1,109 @@
-"""Checkpoint metadata and file-based storage helpers."""
+"""Filesystem checkpoint storage with content-addressed, shared chunks."""
 
 from __future__ import annotations
 
 import json
-import os
 import re
-from dataclasses import dataclass
-from datetime import datetime
+import zlib
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import replace
+from itertools import pairwise
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import cast
+from typing import Any
 
-from python_learning_orchestrated.domain.practice import (
-    Attempt,
-    AttemptOutcome,
-    LearningItem,
+from python_learning_orchestrated.adapters.atomic_file import write_bytes
+from python_learning_orchestrated.adapters.checkpoint_batch import (
+    CheckpointStatus,
+    load_checkpoint_batch,
 )
+from python_learning_orchestrated.adapters.checkpoint_manifest import (
+    CHECKPOINT_FILENAME_SUFFIX,
+    MAX_CHECKPOINT_BYTES,
+    Checkpoint,
+    CheckpointIndexEntry,
+    CheckpointManifest,
+    CheckpointRecord,
+    checkpoint_metadata,
+    chunk_digests,
+    content_hash,
+    read_checkpoint_json,
+    slug_from_path,
+    str_list,
+)
+from python_learning_orchestrated.adapters.checkpoint_retention import (
+    RetentionPolicy,
+    select_prunable,
+)
+from python_learning_orchestrated.adapters.chunk_store import ChunkStore
+from python_learning_orchestrated.adapters.external_sort import (
+    DEFAULT_RUN_SIZE,
+    iter_sorted,
+)
+from python_learning_orchestrated.adapters.snapshot_codec import (
+    EPOCH_TIMESTAMPS_VERSION,
+    attempt_from_dict,
+    attempt_to_dict,
+    attempts_from_payload,
+    attempts_to_payload,
+    item_from_dict,
+    item_to_dict,
+    items_from_payload,
+    items_to_payload,
+    snapshot_from_payload,
+    snapshot_to_payload,
+)
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+from python_learning_orchestrated.domain.progress_diff import (
+    AttemptChange,
+    ItemChange,
+    attempt_sort_key,
+    diff_attempts,
+    diff_items,
+    item_sort_key,
+)
 
-_CHECKPOINT_FILENAME_SUFFIX = ".checkpoint.json"
-
-
-@dataclass(frozen=True)
-class Checkpoint:
-    """Lightweight metadata for a stored progress checkpoint."""
+_CHUNKS_DIRNAME = "chunks"
+_CHUNK_BOUNDARY_MODULUS = 256
+_MAX_CHUNK_ENTRIES = 1024
 
-    name: str
-    created_at: datetime
-    description: str | None = None
 
+class CheckpointStore:
+    """Simple filesystem-backed checkpoint storage.
 
-@dataclass(frozen=True)
-class CheckpointRecord:
-    """Checkpoint metadata paired with an exported progress snapshot."""
+    With `columnar=True` checkpoint progress is saved in the columnar snapshot
+    layout; both layouts are detected on load.
 
-    metadata: Checkpoint
-    progress: ProgressSnapshot
+    Checkpoint metadata is indexed in a `manifest.json` next to the checkpoint
+    files (see `checkpoint_manifest`), updated atomically on save and delete,
+    so listing does not parse every checkpoint.
 
+    Items and attempts are stored as content-addressed chunks in a shared
+    `chunks/` directory and the checkpoint file only lists their digests, so
+    checkpoints of a mostly unchanged history share most of their data. Chunk
+    boundaries follow a hash of each item id or attempt key (about 256 entries
+    per chunk), so an edited or appended entry only changes its own chunk.
+    Chunks are reference counted and deleted with their last checkpoint.
+    Checkpoint files with inline progress are still loaded.
 
-class CheckpointStore:
-    """Simple filesystem-backed checkpoint storage."""
+    With a `retention` policy, `prune` runs after every `save_checkpoint`.
+    """
 
-    def __init__(self, directory: Path | None = None) -> None:
+    def __init__(
+        self,
+        directory: Path | None = None,
+        *,
+        columnar: bool = False,
+        retention: RetentionPolicy | None = None,
+    ) -> None:
         self._directory = directory or default_checkpoint_directory()
         self._directory.mkdir(parents=True, exist_ok=True)
+        self._columnar = columnar
+        self._retention = retention
+        self._manifest = CheckpointManifest(self._directory)
+        self._chunks = ChunkStore(
+            self._directory / _CHUNKS_DIRNAME, self._chunk_references
+        )
 
     def save_checkpoint(
         self,
@@ -57,48 +117,188 @@ class CheckpointStore:
             created_at=progress.exported_at,
             description=description,
         )
+        epoch = progress.version >= EPOCH_TIMESTAMPS_VERSION
+        item_chunks = [
+            self._put_chunk(
+                "items",
+                items_to_payload(
+                    block, columnar=self._columnar, epoch_timestamps=epoch
+                ),
+            )
+            for block in _split_chunks(progress.items, _item_chunk_key)
+        ]
+        attempt_chunks = [
+            self._put_chunk(
+                "attempts",
+                attempts_to_payload(
+                    block, columnar=self._columnar, epoch_timestamps=epoch
+                ),
+            )
+            for block in _split_chunks(progress.attempts, _attempt_chunk_key)
+        ]
+        item_digests = [digest for digest, _ in item_chunks]
+        attempt_digests = [digest for digest, _ in attempt_chunks]
+        data_size = sum(size for _, size in (*item_chunks, *attempt_chunks))
+        header = snapshot_to_payload(
+            replace(progress, items=[], attempts=[]), columnar=self._columnar
+        )
+        del header["items"], header["attempts"]
         payload: dict[str, object] = {
             "name": metadata.name,
             "created_at": metadata.created_at.isoformat(),
             "description": metadata.description,
-            "progress": _snapshot_to_dict(progress),
+            "progress": header,
+            "chunks": {
+                "items": item_digests,
+                "attempts": attempt_digests,
+                "item_count": len(progress.items),
+                "attempt_count": len(progress.attempts),
+                "data_size": data_size,
+                "sorted": [
+                    key
+                    for key, is_sorted in (
+                        ("items", _is_sorted(progress.items, item_sort_key)),
+                        ("attempts", _is_sorted(progress.attempts, attempt_sort_key)),
+                    )
+                    if is_sorted
+                ],
+            },
         }
-        _write_json(self._path_for_name(name), payload)
+        path = self._path_for_name(name)
+        previous_digests = list(chunk_digests(read_checkpoint_json(path)))
+        data = json.dumps(payload).encode("utf-8")
+        new_digests = [*item_digests, *attempt_digests]
+        # Retain before the file refers to the chunks, so a refcount rebuild
+        # never counts them twice; hand the references back if the write fails.
+        self._chunks.retain(new_digests)
+        try:
+            write_bytes(path, data)
+        except BaseException:
+            self._chunks.release(new_digests)
+            raise
+        self._chunks.release(previous_digests)
+        stat = path.stat()
+        slug = slug_from_path(path)
+        self._manifest.update(
+            {
+                slug: CheckpointIndexEntry(
+                    name=metadata.name,
+                    slug=slug,
+                    created_at=metadata.created_at,
+                    description=metadata.description,
+                    size=stat.st_size,
+                    item_count=len(progress.items),
+                    attempt_count=len(progress.attempts),
+                    content_hash=content_hash(data),
+                    mtime_ns=stat.st_mtime_ns,
+                    data_size=data_size,
+                )
+            }
+        )
+        if self._retention is not None:
+            self.prune(self._retention)
         return metadata
 
     def load_checkpoint(self, name: str) -> CheckpointRecord:
-        payload = _read_json(self._path_for_name(name))
-        progress_payload = payload.get("progress")
-        parsed_progress_payload = (
-            progress_payload if isinstance(progress_payload, dict) else {}
-        )
-        metadata = Checkpoint(
-            name=str(payload.get("name", name)),
-            created_at=datetime.fromisoformat(str(payload.get("created_at"))),
-            description=_optional_str(payload.get("description")),
+        payload = read_checkpoint_json(self._path_for_name(name))
+        metadata = checkpoint_metadata(payload, name)
+        return CheckpointRecord(metadata=metadata, progress=self._progress(payload))
+
+    def iter_checkpoint_items(self, name: str) -> Iterator[LearningItem]:
+        """Stream a checkpoint's items one chunk at a time."""
+        payload = read_checkpoint_json(self._path_for_name(name))
+        return self._iter_section(payload, "items", items_from_payload)
+
+    def iter_checkpoint_attempts(self, name: str) -> Iterator[Attempt]:
+        """Stream a checkpoint's attempts one chunk at a time."""
+        payload = read_checkpoint_json(self._path_for_name(name))
+        return self._iter_section(payload, "attempts", attempts_from_payload)
+
+    def diff_checkpoints(
+        self, before: str, after: str, *, run_size: int = DEFAULT_RUN_SIZE
+    ) -> Iterator[ItemChange | AttemptChange]:
+        """Yield item changes, then attempt changes, from `before` to `after`.
+
+        Both checkpoints are streamed, sorted by item id and by
+        `(timestamp, item_id)` with at most `run_size` records per side in
+        memory, and compared in a single merge pass. Sections recorded as
+        already in that order when saved (usually the attempts) skip the sort.
+        """
+        yield from diff_items(
+            self._iter_sorted_items(before, run_size),
+            self._iter_sorted_items(after, run_size),
         )
-        return CheckpointRecord(
-            metadata=metadata,
-            progress=_snapshot_from_dict(parsed_progress_payload),
+        yield from diff_attempts(
+            self._iter_sorted_attempts(before, run_size),
+            self._iter_sorted_attempts(after, run_size),
         )
 
     def list_checkpoints(self) -> list[Checkpoint]:
-        checkpoints: list[Checkpoint] = []
-        for file_path in sorted(
-            self._directory.glob(f"*{_CHECKPOINT_FILENAME_SUFFIX}")
-        ):
-            payload = _read_json(file_path)
-            checkpoints.append(
-                Checkpoint(
-                    name=str(payload.get("name", _name_from_path(file_path))),
-                    created_at=datetime.fromisoformat(str(payload.get("created_at"))),
-                    description=_optional_str(payload.get("description")),
-                )
-            )
-        return checkpoints
+        return [entry.checkpoint for entry in self.checkpoint_index()]
+
+    def checkpoint_index(self) -> list[CheckpointIndexEntry]:
+        """Return manifest entries for all checkpoints, ordered by slug."""
+        entries = self._manifest.refresh()
+        return [entries[slug] for slug in sorted(entries)]
 
     def delete_checkpoint(self, name: str) -> None:
-        self._path_for_name(name).unlink(missing_ok=True)
+        path = self._path_for_name(name)
+        digests = list(chunk_digests(read_checkpoint_json(path)))
+        path.unlink(missing_ok=True)
+        self._chunks.release(digests)
+        self._manifest.update({slug_from_path(path): None})
+
+    def load_checkpoints(
+        self, names: Iterable[str], *, max_workers: int | None = None
+    ) -> list[CheckpointStatus]:
+        """Load several checkpoints in parallel, one status per name.
+
+        Files are read on a thread pool; chunks are checked against their
+        digests and decoded on a process pool of `max_workers` processes
+        (default: one per CPU), or in this process when there is one worker
+        or one checkpoint. A chunk shared by several checkpoints is read and
+        decoded once. Failures are reported in the status, not raised.
+        """
+        return self._load_batch(list(names), keep_records=True, max_workers=max_workers)
+
+    def verify_checkpoints(
+        self, names: Iterable[str] | None = None, *, max_workers: int | None = None
+    ) -> list[CheckpointStatus]:
+        """Check checkpoints (all by default) like `load_checkpoints`.
+
+        Statuses carry counts and content hashes but no records. Checking all
+        checkpoints includes files the manifest could not index, reported
+        under their slug.
+        """
+        if names is None:
+            entries = self._manifest.refresh()
+            names = [
+                entries[slug].name if slug in entries else slug
+                for slug in self._manifest.checkpoint_slugs()
+            ]
+        return self._load_batch(
+            list(names), keep_records=False, max_workers=max_workers
+        )
+
+    def prune(
+        self, policy: RetentionPolicy, *, dry_run: bool = False
+    ) -> list[CheckpointIndexEntry]:
+        """Delete checkpoints `policy` does not keep and return them.
+
+        Decisions use manifest metadata only. With `dry_run` nothing is
+        deleted.
+        """
+        prunable = select_prunable(self.checkpoint_index(), policy)
+        if dry_run or not prunable:
+            return prunable
+        digests: list[str] = []
+        for entry in prunable:
+            path = self._directory / f"{entry.slug}{CHECKPOINT_FILENAME_SUFFIX}"
+            digests.extend(chunk_digests(read_checkpoint_json(path)))
+            path.unlink(missing_ok=True)
+        self._chunks.release(digests)
+        self._manifest.update({entry.slug: None for entry in prunable})
+        return prunable
 
     def has_checkpoint(self, name: str) -> bool:
         """Return whether a checkpoint filename slot already exists."""
@@ -106,7 +306,95 @@ class CheckpointStore:
         return self._path_for_name(name).exists()
 
     def _path_for_name(self, name: str) -> Path:
-        return self._directory / f"{_slugify(name)}{_CHECKPOINT_FILENAME_SUFFIX}"
+        return self._directory / f"{_slugify(name)}{CHECKPOINT_FILENAME_SUFFIX}"
+
+    def _put_chunk(self, key: str, value: object) -> tuple[str, int]:
+        """Store one chunk and return its digest and size in bytes."""
+        data = json.dumps({key: value}, separators=(",", ":")).encode("utf-8")
+        return self._chunks.put(data), len(data)
+
+    def _progress(self, payload: dict[str, object]) -> ProgressSnapshot:
+        """Decode checkpoint progress, reassembling chunked items and attempts."""
+        progress_payload = payload.get("progress")
+        progress = snapshot_from_payload(
+            progress_payload if isinstance(progress_payload, dict) else {}
+        )
+        if not isinstance(payload.get("chunks"), dict):
+            return progress
+        return replace(
+            progress,
+            items=list(self._iter_section(payload, "items", items_from_payload)),
+            attempts=list(
+                self._iter_section(payload, "attempts", attempts_from_payload)
+            ),
+        )
+
+    def _iter_section[T](
+        self,
+        payload: dict[str, object],
+        key: str,
+        decode: Callable[[object], list[T]],
+    ) -> Iterator[T]:
+        """Yield the decoded `items` or `attempts` of a checkpoint payload."""
+        chunks = payload.get("chunks")
+        if isinstance(chunks, dict):
+            for digest in str_list(chunks.get(key)):
+                yield from decode(self._chunk(digest).get(key))
+            return
+        progress_payload = payload.get("progress")
+        if isinstance(progress_payload, dict):
+            yield from decode(progress_payload.get(key, []))
+
+    def _iter_sorted_items(self, name: str, run_size: int) -> Iterator[LearningItem]:
+        payload = read_checkpoint_json(self._path_for_name(name))
+        items = self._iter_section(payload, "items", items_from_payload)
+        if "items" in _sorted_sections(payload):
+            return items
+        return iter_sorted(
+            items,
+            item_sort_key,
+            encode=item_to_dict,
+            decode=item_from_dict,
+            run_size=run_size,
+        )
+
+    def _iter_sorted_attempts(self, name: str, run_size: int) -> Iterator[Attempt]:
+        payload = read_checkpoint_json(self._path_for_name(name))
+        attempts = self._iter_section(payload, "attempts", attempts_from_payload)
+        if "attempts" in _sorted_sections(payload):
+            return attempts
+        return iter_sorted(
+            attempts,
+            attempt_sort_key,
+            encode=attempt_to_dict,
+            decode=attempt_from_dict,
+            run_size=run_size,
+        )
+
+    def _load_batch(
+        self, names: list[str], *, keep_records: bool, max_workers: int | None
+    ) -> list[CheckpointStatus]:
+        return load_checkpoint_batch(
+            names,
+            read_checkpoint=self._read_checkpoint_bytes,
+            read_chunk=self._chunks.get,
+            keep_records=keep_records,
+            max_workers=max_workers,
+        )
+
+    def _read_checkpoint_bytes(self, name: str) -> bytes:
+        path = self._path_for_name(name)
+        if path.stat().st_size > MAX_CHECKPOINT_BYTES:
+            raise ValueError(f"Checkpoint file {path} exceeds 10MB size limit")
+        return path.read_bytes()
+
+    def _chunk(self, digest: str) -> dict[str, Any]:
+        parsed = json.loads(self._chunks.get(digest))
+        return parsed if isinstance(parsed, dict) else {}
+
+    def _chunk_references(self) -> Iterator[str]:
+        for file_path in self._directory.glob(f"*{CHECKPOINT_FILENAME_SUFFIX}"):
+            yield from chunk_digests(read_checkpoint_json(file_path))
 
 
 def default_checkpoint_directory() -> Path:
@@ -121,140 +409,39 @@ def _slugify(value: str) -> str:
     return normalized or "checkpoint"
 
 
-def _name_from_path(path: Path) -> str:
-    return path.name.removesuffix(_CHECKPOINT_FILENAME_SUFFIX)
-
-
-def _optional_str(value: object) -> str | None:
-    return value if isinstance(value, str) else None
-
-
-def _snapshot_to_dict(snapshot: ProgressSnapshot) -> dict[str, object]:
-    return {
-        "version": snapshot.version,
-        "exported_at": snapshot.exported_at.isoformat(),
-        "items": [_item_to_dict(item) for item in snapshot.items],
-        "attempts": [_attempt_to_dict(attempt) for attempt in snapshot.attempts],
-    }
-
-
-def _snapshot_from_dict(payload: dict[str, object]) -> ProgressSnapshot:
-    raw_items = payload.get("items", [])
-    raw_attempts = payload.get("attempts", [])
-
-    item_entries = raw_items if isinstance(raw_items, list) else []
-    attempt_entries = raw_attempts if isinstance(raw_attempts, list) else []
-
-    items = [
-        _item_from_dict(entry) for entry in item_entries if isinstance(entry, dict)
-    ]
-    attempts = [
-        _attempt_from_dict(entry)
-        for entry in attempt_entries
-        if isinstance(entry, dict) and _has_attempt_required_fields(entry)
-    ]
-
-    exported_at_raw = payload.get("exported_at")
-    exported_at = (
-        datetime.fromisoformat(exported_at_raw)
-        if isinstance(exported_at_raw, str)
-        else datetime.fromtimestamp(0)
-    )
-
-    return ProgressSnapshot(
-        version=_to_int(payload.get("version"), 1),
-        exported_at=exported_at,
-        items=items,
-        attempts=attempts,
-    )
-
-
-def _item_to_dict(item: LearningItem) -> dict[str, object]:
-    return {
-        "id": item.id,
-        "prompt": item.prompt,
-        "status": item.status,
-        "order": item.order,
-        "due_at": item.due_at.isoformat() if item.due_at else None,
-        "review_level": item.review_level,
-        "interval_minutes": item.interval_minutes,
-    }
-
-
-def _item_from_dict(payload: dict[str, object]) -> LearningItem:
-    due_at_raw = payload.get("due_at")
-    due_at = datetime.fromisoformat(due_at_raw) if isinstance(due_at_raw, str) else None
-    return LearningItem(
-        id=str(payload.get("id", "")),
-        prompt=str(payload.get("prompt", "")),
-        status="review" if payload.get("status") == "review" else "new",
-        order=_to_int(payload.get("order"), 0),
-        due_at=due_at,
-        review_level=_to_int(payload.get("review_level"), 0),
-        interval_minutes=_to_int(payload.get("interval_minutes"), 0),
-    )
-
-
-def _attempt_to_dict(attempt: Attempt) -> dict[str, str]:
-    return {
-        "item_id": attempt.item_id,
-        "timestamp": attempt.timestamp.isoformat(),
-        "outcome": attempt.outcome,
-    }
-
-
-def _attempt_from_dict(payload: dict[str, object]) -> Attempt:
-    outcome = str(payload.get("outcome", "skip"))
-    normalized = outcome if outcome in {"correct", "incorrect", "skip"} else "skip"
-    return Attempt(
-        item_id=str(payload.get("item_id", "")),
-        timestamp=datetime.fromisoformat(str(payload.get("timestamp"))),
-        outcome=cast(AttemptOutcome, normalized),
-    )
-
-
-def _has_attempt_required_fields(payload: dict[str, object]) -> bool:
-    return isinstance(payload.get("item_id"), str) and isinstance(
-        payload.get("timestamp"), str
-    )
-
-
-def _to_int(value: object, default: int) -> int:
-    if isinstance(value, int):
-        return value
-    if isinstance(value, str):
-        try:
-            return int(value)
-        except ValueError:
-            return default
-    return default
-
-
-def _read_json(path: Path) -> dict[str, object]:
-    if not path.exists():
-        return {}
-    if path.stat().st_size > 10 * 1024 * 1024:
-        raise ValueError(f"Checkpoint file {path} exceeds 10MB size limit")
-    parsed = json.loads(path.read_text(encoding="utf-8"))
-    return parsed if isinstance(parsed, dict) else {}
-
-
-def _write_json(path: Path, payload: dict[str, object]) -> None:
-    temp_path: Path | None = None
-    try:
-        with NamedTemporaryFile(
-            mode="w",
-            encoding="utf-8",
-            dir=path.parent,
-            prefix=f"{path.name}.",
-            suffix=".tmp",
-            delete=False,
-        ) as temp_file:
-            json.dump(payload, temp_file)
-            temp_file.flush()
-            os.fsync(temp_file.fileno())
-            temp_path = Path(temp_file.name)
-        os.replace(temp_path, path)
-    finally:
-        if temp_path is not None and temp_path.exists():
-            temp_path.unlink()
+def _split_chunks[T](entries: list[T], key: Callable[[T], str]) -> list[list[T]]:
+    """Split entries into chunks at content-defined boundaries.
+
+    A chunk ends after an entry whose key hashes to a boundary, or once it
+    holds `_MAX_CHUNK_ENTRIES` entries.
+    """
+    chunks: list[list[T]] = []
+    chunk: list[T] = []
+    for entry in entries:
+        chunk.append(entry)
+        if (
+            len(chunk) >= _MAX_CHUNK_ENTRIES
+            or zlib.crc32(key(entry).encode("utf-8")) % _CHUNK_BOUNDARY_MODULUS == 0
+        ):
+            chunks.append(chunk)
+            chunk = []
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def _item_chunk_key(item: LearningItem) -> str:
+    return item.id
+
+
+def _attempt_chunk_key(attempt: Attempt) -> str:
+    return f"{attempt.item_id}\x00{attempt.timestamp.isoformat()}"
+
+
+def _is_sorted[T](entries: list[T], key: Callable[[T], Any]) -> bool:
+    return all(key(first) <= key(second) for first, second in pairwise(entries))
+
+
+def _sorted_sections(payload: dict[str, object]) -> list[str]:
+    chunks = payload.get("chunks")
+    return str_list(chunks.get("sorted")) if isinstance(chunks, dict) else []
@@ -0,0 +1,111 @@
+"""Content-addressed, reference-counted chunk storage."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from collections import Counter
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from python_learning_orchestrated.adapters.atomic_file import write_bytes
+
+_CHUNK_SUFFIX = ".chunk"
+_REFCOUNTS_FILENAME = "refcounts.json"
+
+
+class ChunkStore:
+    """Store immutable byte chunks under their sha256 digest.
+
+    Identical chunks are written once and shared. Reference counts live in a
+    `refcounts.json` next to the chunks; `retain` and `release` adjust them and
+    `release` deletes chunks whose count drops to zero. When the counts file is
+    missing or unreadable it is rebuilt from `references`, which must return
+    every digest referenced by stored data (once per reference); callers
+    therefore retain before storing a new reference and release after
+    removing one.
+    """
+
+    def __init__(
+        self, directory: Path, references: Callable[[], Iterable[str]]
+    ) -> None:
+        self._directory = directory
+        self._references = references
+
+    def put(self, data: bytes) -> str:
+        """Store `data` if it is not already present and return its digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._path_for_digest(digest)
+        if not path.exists():
+            self._directory.mkdir(parents=True, exist_ok=True)
+            write_bytes(path, data)
+        return digest
+
+    def get(self, digest: str) -> bytes:
+        """Return the chunk stored under `digest`.
+
+        Raises `FileNotFoundError` if the chunk is missing.
+        """
+        return self._path_for_digest(digest).read_bytes()
+
+    def has(self, digest: str) -> bool:
+        return self._path_for_digest(digest).exists()
+
+    def digests(self) -> list[str]:
+        """Return the digests of all stored chunks."""
+        return sorted(
+            path.name.removesuffix(_CHUNK_SUFFIX)
+            for path in self._directory.glob(f"*{_CHUNK_SUFFIX}")
+        )
+
+    def refcounts(self) -> dict[str, int]:
+        """Return the current reference count of every referenced chunk."""
+        refcounts, _ = self._load_refcounts()
+        return dict(refcounts)
+
+    def retain(self, digests: Iterable[str]) -> None:
+        """Add one reference per digest in `digests`."""
+        refcounts, _ = self._load_refcounts()
+        refcounts.update(digests)
+        self._save_refcounts(refcounts)
+
+    def release(self, digests: Iterable[str]) -> list[str]:
+        """Drop one reference per digest and delete unreferenced chunks.
+
+        Returns the digests of the deleted chunks.
+        """
+        refcounts, rebuilt = self._load_refcounts()
+        released = Counter(digests)
+        if not rebuilt:
+            refcounts.subtract(released)
+        removed = sorted(digest for digest in released if refcounts[digest] <= 0)
+        for digest in removed:
+            del refcounts[digest]
+        self._save_refcounts(refcounts)
+        for digest in removed:
+            self._path_for_digest(digest).unlink(missing_ok=True)
+        return removed
+
+    def _path_for_digest(self, digest: str) -> Path:
+        return self._directory / f"{digest}{_CHUNK_SUFFIX}"
+
+    @property
+    def _refcounts_path(self) -> Path:
+        return self._directory / _REFCOUNTS_FILENAME
+
+    def _load_refcounts(self) -> tuple[Counter[str], bool]:
+        """Return the counts and whether they were rebuilt from `references`."""
+        try:
+            parsed = json.loads(self._refcounts_path.read_bytes())
+        except (OSError, json.JSONDecodeError):
+            parsed = None
+        if not isinstance(parsed, dict) or not all(
+            isinstance(count, int) for count in parsed.values()
+        ):
+            return Counter(self._references()), True
+        return Counter({str(digest): count for digest, count in parsed.items()}), False
+
+    def _save_refcounts(self, refcounts: Counter[str]) -> None:
+        self._directory.mkdir(parents=True, exist_ok=True)
+        payload = {digest: refcounts[digest] for digest in sorted(refcounts)}
+        write_bytes(self._refcounts_path, json.dumps(payload).encode("utf-8"))
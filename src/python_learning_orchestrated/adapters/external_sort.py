@@ -0,0 +1,54 @@
+"""Bounded-memory sorting of record streams through temporary files."""
+
+from __future__ import annotations
+
+import heapq
+import json
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import ExitStack
+from itertools import islice
+from tempfile import TemporaryFile
+from typing import IO, Any
+
+DEFAULT_RUN_SIZE = 100_000
+
+
+def iter_sorted[T](
+    records: Iterable[T],
+    key: Callable[[T], Any],
+    *,
+    encode: Callable[[T], object],
+    decode: Callable[[dict[str, Any]], T | None],
+    run_size: int = DEFAULT_RUN_SIZE,
+) -> Iterator[T]:
+    """Yield `records` ordered by `key` holding at most `run_size` in memory.
+
+    Input that fits in one run is sorted in memory. Longer input is cut into
+    sorted runs that are spilled to temporary JSON-lines files with `encode`
+    and merged back with `heapq.merge`, decoding each line with `decode`.
+    The sort is stable.
+    """
+    entries = iter(records)
+    run = sorted(islice(entries, run_size), key=key)
+    if len(run) < run_size:
+        yield from run
+        return
+    with ExitStack() as stack:
+        runs: list[Iterator[T]] = []
+        while run:
+            run_file = stack.enter_context(TemporaryFile(mode="w+", encoding="utf-8"))
+            for record in run:
+                run_file.write(json.dumps(encode(record)) + "\n")
+            run_file.seek(0)
+            runs.append(_read_run(run_file, decode))
+            run = sorted(islice(entries, run_size), key=key)
+        yield from heapq.merge(*runs, key=key)
+
+
+def _read_run[T](
+    run_file: IO[str], decode: Callable[[dict[str, Any]], T | None]
+) -> Iterator[T]:
+    for line in run_file:
+        record = decode(json.loads(line))
+        if record is not None:
+            yield record
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
+
 from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 from python_learning_orchestrated.ports.practice_repository import PracticeRepository
 
@@ -30,6 +32,20 @@ class InMemoryPracticeRepository(PracticeRepository):
     def record_attempts(self, attempts: list[Attempt]) -> None:
         self._attempts.extend(attempts)
 
+    @property
+    def appends_attempts(self) -> bool:
+        return True
+
+    def apply_changes(self, items: list[LearningItem], attempts: list[Attempt]) -> None:
+        self._attempts.extend(attempts)
+        self.save_items(items)
+
+    def replace_contents(
+        self, items: list[LearningItem], attempts: Iterable[Attempt]
+    ) -> None:
+        self._items = {item.id: item for item in items}
+        self._attempts = list(attempts)
+
     def list_attempts(self) -> list[Attempt]:
         """Testing helper for verifying recorded attempts."""
         return [*self._attempts]
@@ -4,103 +4,271 @@ from __future__ import annotations
 
 import json
 import os
-from datetime import datetime
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import cast
+from typing import IO
 
-from python_learning_orchestrated.domain.practice import (
-    Attempt,
-    AttemptOutcome,
-    LearningItem,
+from python_learning_orchestrated.adapters.atomic_file import (
+    BinaryWriter,
+    replace_file,
+    text_writer,
+    write_temp_file,
 )
+from python_learning_orchestrated.adapters.cached_document import (
+    CachedDocument,
+    CacheStats,
+)
+from python_learning_orchestrated.adapters.snapshot_codec import (
+    EPOCH_TIMESTAMPS_VERSION,
+    attempt_to_dict,
+    decode_attempts,
+    decode_items,
+    decode_timestamp,
+    item_to_dict,
+    to_int,
+)
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 from python_learning_orchestrated.ports.practice_repository import PracticeRepository
 
 
 class JsonFilePracticeRepository(PracticeRepository):
-    """Persist practice items and attempts in a JSON document."""
+    """Persist practice items and attempts in a JSON document.
+
+    With `attempts_log` set, attempts are appended to a separate
+    newline-delimited JSON log instead of the document, which then only holds
+    items. Attempts still embedded in an existing document are moved into the
+    log when the repository is opened.
+
+    The parsed and decoded document is cached in memory and only re-read when
+    the file's modification signature changes.
+
+    Documents without a `schema_version` store timestamps as ISO-8601 strings
+    (schema 1). `upgrade_schema()` rewrites them as epoch microseconds
+    (schema 2); later writes keep the document's schema.
+    """
 
-    def __init__(self, file_path: str | Path, seed_items: list[LearningItem]) -> None:
+    def __init__(
+        self,
+        file_path: str | Path,
+        seed_items: list[LearningItem],
+        *,
+        attempts_log: str | Path | None = None,
+    ) -> None:
         self._file_path = Path(file_path)
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._attempts_log = Path(attempts_log) if attempts_log is not None else None
+        if self._attempts_log is not None:
+            self._attempts_log.parent.mkdir(parents=True, exist_ok=True)
+        self._cache = CachedDocument(self._file_path, self._read_document)
         if not self._file_path.exists():
-            self._save_storage(
-                {"items": [_item_to_dict(item) for item in seed_items], "attempts": []}
-            )
+            storage: dict[str, object] = {
+                "items": [item_to_dict(item) for item in seed_items]
+            }
+            if self._attempts_log is None:
+                storage["attempts"] = []
+            self._save_document(_PracticeDocument(storage, items=list(seed_items)))
+        elif self._attempts_log is not None:
+            self._migrate_attempts_to_log(self._attempts_log)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Return document cache hit/miss counters."""
+        return self._cache.stats
 
     def list_items(self) -> list[LearningItem]:
-        storage = self._load_storage()
-        raw_items = storage.get("items", [])
-        if not isinstance(raw_items, list):
-            return []
-        return [
-            _item_from_dict(entry) for entry in raw_items if isinstance(entry, dict)
-        ]
+        return list(self._cache.load().items())
 
     def save_item(self, item: LearningItem) -> None:
         self.save_items([item])
 
     def save_items(self, items: list[LearningItem]) -> None:
-        if not items:
+        self.apply_changes(items, [])
+
+    def list_attempts(self) -> list[Attempt]:
+        return list(self.iter_attempts())
+
+    def iter_attempts(self) -> Iterator[Attempt]:
+        if self._attempts_log is not None:
+            return decode_attempts(_iter_log_entries(self._attempts_log))
+        return iter(self._cache.load().attempts())
+
+    def record_attempt(self, attempt: Attempt) -> None:
+        self.record_attempts([attempt])
+
+    def record_attempts(self, attempts: list[Attempt]) -> None:
+        self.apply_changes([], attempts)
+
+    @property
+    def appends_attempts(self) -> bool:
+        """Only the attempts log is appended to; the document is rewritten."""
+        return self._attempts_log is not None
+
+    def apply_changes(self, items: list[LearningItem], attempts: list[Attempt]) -> None:
+        if not items and not attempts:
             return
 
-        storage = self._load_storage()
-        raw_items = storage.get("items", [])
-        existing_items = []
-        if isinstance(raw_items, list):
-            existing_items = [
-                _item_from_dict(entry) for entry in raw_items if isinstance(entry, dict)
-            ]
-        by_id = {existing.id: existing for existing in existing_items}
-        for item in items:
-            by_id[item.id] = item
-        storage["items"] = [_item_to_dict(entry) for entry in by_id.values()]
-        self._save_storage(storage)
+        document = self._cache.load()
+        epoch = document.epoch_timestamps
+        if self._attempts_log is not None:
+            if attempts:
+                _append_log_entries(
+                    self._attempts_log,
+                    [
+                        attempt_to_dict(attempt, epoch_timestamps=epoch)
+                        for attempt in attempts
+                    ],
+                )
+            if not items:
+                return
+            attempts = []
 
-    def list_attempts(self) -> list[Attempt]:
-        storage = self._load_storage()
-        raw_attempts = storage.get("attempts", [])
-        if not isinstance(raw_attempts, list):
-            return []
-        attempts: list[Attempt] = []
-        for entry in raw_attempts:
-            if not isinstance(entry, dict):
-                continue
-            item_id = entry.get("item_id")
-            timestamp = entry.get("timestamp")
-            outcome = entry.get("outcome")
-            if not isinstance(item_id, str) or not isinstance(timestamp, str):
-                continue
-            try:
-                parsed_timestamp = datetime.fromisoformat(timestamp)
-            except ValueError:
-                continue
-            normalized_outcome = (
-                outcome if outcome in {"correct", "incorrect", "skip"} else "skip"
+        storage = dict(document.storage)
+        merged_items: list[LearningItem] | None = None
+        if items:
+            by_id = {existing.id: existing for existing in document.items()}
+            for item in items:
+                by_id[item.id] = item
+            merged_items = list(by_id.values())
+            storage["items"] = [
+                item_to_dict(entry, epoch_timestamps=epoch) for entry in merged_items
+            ]
+        merged_attempts: list[Attempt] | None = None
+        if attempts:
+            raw_attempts = storage.get("attempts", [])
+            existing_attempts = raw_attempts if isinstance(raw_attempts, list) else []
+            storage["attempts"] = [
+                *existing_attempts,
+                *(
+                    attempt_to_dict(attempt, epoch_timestamps=epoch)
+                    for attempt in attempts
+                ),
+            ]
+            merged_attempts = document.extended_attempts(attempts)
+        self._save_document(
+            _PracticeDocument(
+                storage,
+                items=merged_items if merged_items is not None else document.items(),
+                attempts=merged_attempts,
             )
-            attempts.append(
-                Attempt(
-                    item_id=item_id,
-                    timestamp=parsed_timestamp,
-                    outcome=cast(AttemptOutcome, normalized_outcome),
+        )
+
+    def replace_contents(
+        self, items: list[LearningItem], attempts: Iterable[Attempt]
+    ) -> None:
+        """Write a new document (and attempts log) and rename it into place.
+
+        Each file is written once to a temporary file, and nothing is renamed
+        until every write has succeeded, so a failed write leaves the
+        repository untouched. With an attempts log the two renames are not
+        atomic together: a crash between them leaves the new log beside the
+        old document.
+        """
+        document = self._cache.load()
+        epoch = document.epoch_timestamps
+        storage = {
+            key: value
+            for key, value in document.storage.items()
+            if key not in ("items", "attempts")
+        }
+        storage["items"] = [
+            item_to_dict(item, epoch_timestamps=epoch) for item in items
+        ]
+        replaced_attempts: list[Attempt] | None = None
+        renames: list[tuple[Path, Path]] = []
+        try:
+            if self._attempts_log is not None:
+                log_temp = _write_log_temp(
+                    self._attempts_log,
+                    (
+                        attempt_to_dict(attempt, epoch_timestamps=epoch)
+                        for attempt in attempts
+                    ),
                 )
+                renames.append((log_temp, self._attempts_log))
+            else:
+                replaced_attempts = list(attempts)
+                storage["attempts"] = [
+                    attempt_to_dict(attempt, epoch_timestamps=epoch)
+                    for attempt in replaced_attempts
+                ]
+            renames.append((self._write_storage(storage), self._file_path))
+            for temp_path, target in renames:
+                os.replace(temp_path, target)
+        finally:
+            for temp_path, _ in renames:
+                temp_path.unlink(missing_ok=True)
+        self._cache.store(
+            _PracticeDocument(storage, items=list(items), attempts=replaced_attempts)
+        )
+
+    def upgrade_schema(self) -> None:
+        """Rewrite stored timestamps as epoch microseconds (schema version 2).
+
+        The attempts log, if any, is replaced before the document. Readers
+        accept both encodings, so an interrupted upgrade can simply be re-run.
+        """
+        if self._attempts_log is not None:
+            log_temp = _write_log_temp(
+                self._attempts_log,
+                (
+                    attempt_to_dict(attempt, epoch_timestamps=True)
+                    for attempt in decode_attempts(
+                        _iter_log_entries(self._attempts_log)
+                    )
+                ),
             )
-        return attempts
+            try:
+                os.replace(log_temp, self._attempts_log)
+            finally:
+                log_temp.unlink(missing_ok=True)
+        document = self._cache.load()
+        storage = {
+            **document.storage,
+            "schema_version": EPOCH_TIMESTAMPS_VERSION,
+            "items": [
+                item_to_dict(item, epoch_timestamps=True) for item in document.items()
+            ],
+        }
+        attempts: list[Attempt] | None = None
+        if self._attempts_log is None:
+            attempts = document.attempts()
+            storage["attempts"] = [
+                attempt_to_dict(attempt, epoch_timestamps=True) for attempt in attempts
+            ]
+        self._save_document(
+            _PracticeDocument(storage, items=document.items(), attempts=attempts)
+        )
 
-    def record_attempt(self, attempt: Attempt) -> None:
-        self.record_attempts([attempt])
+    def _migrate_attempts_to_log(self, log_path: Path) -> None:
+        """Move attempts embedded in the document into the attempts log.
 
-    def record_attempts(self, attempts: list[Attempt]) -> None:
-        if not attempts:
+        Entries already present in the log are skipped so an interrupted
+        migration can be re-run without duplicating attempts.
+        """
+        document = self._cache.load()
+        raw_attempts = document.storage.get("attempts")
+        if not isinstance(raw_attempts, list) or not raw_attempts:
             return
+        logged_keys = {
+            _attempt_entry_key(entry) for entry in _iter_log_entries(log_path)
+        }
+        missing_entries = [
+            entry
+            for entry in raw_attempts
+            if isinstance(entry, dict) and _attempt_entry_key(entry) not in logged_keys
+        ]
+        _append_log_entries(log_path, missing_entries)
+        storage = {
+            key: value for key, value in document.storage.items() if key != "attempts"
+        }
+        self._save_document(_PracticeDocument(storage, items=document.items()))
+
+    def _read_document(self) -> _PracticeDocument:
+        return _PracticeDocument(self._load_storage())
 
-        storage = self._load_storage()
-        raw_attempts = storage.get("attempts", [])
-        existing_attempts = raw_attempts if isinstance(raw_attempts, list) else []
-        for attempt in attempts:
-            existing_attempts.append(_attempt_to_dict(attempt))
-        storage["attempts"] = existing_attempts
-        self._save_storage(storage)
+    def _save_document(self, document: _PracticeDocument) -> None:
+        self._save_storage(document.storage)
+        self._cache.store(document)
 
     def _load_storage(self) -> dict[str, object]:
         if not self._file_path.exists():
@@ -120,67 +288,111 @@ class JsonFilePracticeRepository(PracticeRepository):
             return {"items": [], "attempts": []}
 
     def _save_storage(self, storage: dict[str, object]) -> None:
-        temp_path: Path | None = None
-        try:
-            with NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=self._file_path.parent,
-                prefix=f"{self._file_path.name}.",
-                suffix=".tmp",
-                delete=False,
-            ) as temp_file:
-                json.dump(storage, temp_file)
-                temp_file.flush()
-                os.fsync(temp_file.fileno())
-                temp_path = Path(temp_file.name)
-
-            os.replace(temp_path, self._file_path)
-        finally:
-            if temp_path is not None and temp_path.exists():
-                temp_path.unlink()
-
-
-def _item_to_dict(item: LearningItem) -> dict[str, object]:
-    return {
-        "id": item.id,
-        "prompt": item.prompt,
-        "status": item.status,
-        "order": item.order,
-        "due_at": item.due_at.isoformat() if item.due_at is not None else None,
-        "review_level": item.review_level,
-        "interval_minutes": item.interval_minutes,
-    }
-
-
-def _item_from_dict(payload: dict[str, object]) -> LearningItem:
-    due_at_raw = payload.get("due_at")
-    due_at = datetime.fromisoformat(due_at_raw) if isinstance(due_at_raw, str) else None
-    return LearningItem(
-        id=str(payload.get("id", "")),
-        prompt=str(payload.get("prompt", "")),
-        status="review" if payload.get("status") == "review" else "new",
-        order=_to_int(payload.get("order"), 0),
-        due_at=due_at,
-        review_level=_to_int(payload.get("review_level"), 0),
-        interval_minutes=_to_int(payload.get("interval_minutes"), 0),
-    )
-
-
-def _attempt_to_dict(attempt: Attempt) -> dict[str, str]:
-    return {
-        "item_id": attempt.item_id,
-        "timestamp": attempt.timestamp.isoformat(),
-        "outcome": attempt.outcome,
-    }
-
-
-def _to_int(value: object, default: int) -> int:
-    if isinstance(value, int):
-        return value
-    if isinstance(value, str):
-        try:
-            return int(value)
-        except ValueError:
-            return default
-    return default
+        replace_file(self._file_path, _storage_writer(storage))
+
+    def _write_storage(self, storage: dict[str, object]) -> Path:
+        """Write `storage` to a synced temporary file next to the document."""
+        return write_temp_file(self._file_path, _storage_writer(storage))
+
+
+class _PracticeDocument:
+    """Parsed practice document with lazily decoded items and attempts."""
+
+    def __init__(
+        self,
+        storage: dict[str, object],
+        *,
+        items: list[LearningItem] | None = None,
+        attempts: list[Attempt] | None = None,
+    ) -> None:
+        self.storage = storage
+        self._items = items
+        self._attempts = attempts
+
+    @property
+    def epoch_timestamps(self) -> bool:
+        """Return whether the document stores epoch-microsecond timestamps."""
+        schema_version = to_int(self.storage.get("schema_version"), 1)
+        return schema_version >= EPOCH_TIMESTAMPS_VERSION
+
+    def items(self) -> list[LearningItem]:
+        if self._items is None:
+            raw_items = self.storage.get("items", [])
+            entries = raw_items if isinstance(raw_items, list) else []
+            self._items = decode_items(entries)
+        return self._items
+
+    def attempts(self) -> list[Attempt]:
+        if self._attempts is None:
+            raw_attempts = self.storage.get("attempts", [])
+            entries = raw_attempts if isinstance(raw_attempts, list) else []
+            self._attempts = list(decode_attempts(entries))
+        return self._attempts
+
+    def extended_attempts(self, attempts: list[Attempt]) -> list[Attempt] | None:
+        """Return decoded attempts plus new ones, if already decoded."""
+        if self._attempts is None:
+            return None
+        return [*self._attempts, *attempts]
+
+
+def _attempt_entry_key(entry: dict[str, object]) -> tuple[str, object]:
+    timestamp = entry.get("timestamp")
+    try:
+        decoded = decode_timestamp(timestamp)
+    except ValueError:
+        decoded = None
+    return (str(entry.get("item_id")), decoded or str(timestamp))
+
+
+def _iter_log_entries(log_path: Path) -> Iterator[dict[str, object]]:
+    """Stream decoded entries from a newline-delimited JSON log.
+
+    Blank lines and lines that do not decode (such as a record torn by a crash
+    mid-append) are skipped.
+    """
+    try:
+        log_file = log_path.open(encoding="utf-8")
+    except FileNotFoundError:
+        return
+    with log_file:
+        for line in log_file:
+            if not line.strip():
+                continue
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if isinstance(entry, dict):
+                yield entry
+
+
+def _append_log_entries(
+    log_path: Path, entries: Sequence[Mapping[str, object]]
+) -> None:
+    """Append entries to a newline-delimited JSON log with a single fsync."""
+    if not entries:
+        return
+    lines = "".join(json.dumps(entry) + "\n" for entry in entries)
+    with log_path.open("a+b") as log_file:
+        if log_file.tell() > 0:
+            log_file.seek(-1, os.SEEK_END)
+            if log_file.read(1) != b"\n":
+                lines = "\n" + lines
+        log_file.write(lines.encode("utf-8"))
+        log_file.flush()
+        os.fsync(log_file.fileno())
+
+
+def _write_log_temp(log_path: Path, entries: Iterable[Mapping[str, object]]) -> Path:
+    """Write `entries` as a newline-delimited JSON log to a temporary file."""
+
+    def write(temp_file: IO[str]) -> None:
+        for entry in entries:
+            temp_file.write(json.dumps(entry) + "\n")
+
+    return write_temp_file(log_path, text_writer(write))
+
+
+def _storage_writer(storage: dict[str, object]) -> BinaryWriter:
+    return text_writer(lambda temp_file: json.dump(storage, temp_file))
@@ -2,42 +2,76 @@
 
 from __future__ import annotations
 
+import copy
 import json
-import os
+from collections.abc import Mapping
 from pathlib import Path
-from tempfile import NamedTemporaryFile
 from typing import cast
 
+from python_learning_orchestrated.adapters.atomic_file import (
+    replace_file,
+    text_writer,
+)
+from python_learning_orchestrated.adapters.cached_document import (
+    CachedDocument,
+    CacheStats,
+)
 from python_learning_orchestrated.domain.progress import LessonProgress
 from python_learning_orchestrated.ports.progress_repository import ProgressRepository
 
 
 class JsonFileProgressRepository(ProgressRepository):
-    """Persist progress payloads to a JSON file on disk."""
+    """Persist progress payloads to a JSON file on disk.
+
+    The parsed document is cached in memory and only re-read when the file's
+    modification signature changes.
+    """
 
     def __init__(self, file_path: str | Path) -> None:
         self._file_path = Path(file_path)
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._cache = CachedDocument(self._file_path, self._load_storage)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Return document cache hit/miss counters."""
+        return self._cache.stats
 
     def get_progress(self, user_id: str) -> LessonProgress:
         """Return stored progress for user_id, or empty progress."""
-        storage = self._load_storage()
+        storage = self._cache.load()
         progress = storage.get(user_id, {})
-        return progress.copy() if isinstance(progress, dict) else {}
+        return copy.deepcopy(progress) if isinstance(progress, dict) else {}
 
     def save_progress(self, user_id: str, progress: LessonProgress) -> None:
         """Persist progress for user_id using an atomic replace."""
-        storage = self._load_storage()
-        storage[user_id] = progress.copy()
+        storage = dict(self._cache.load())
+        storage[user_id] = copy.deepcopy(progress)
         self._save_storage(storage)
 
     def reset_progress(self, user_id: str) -> None:
         """Delete persisted progress for user_id while keeping other users."""
-        storage = self._load_storage()
+        storage = dict(self._cache.load())
         if user_id in storage:
             del storage[user_id]
             self._save_storage(storage)
 
+    def all_progress(self) -> dict[str, LessonProgress]:
+        """Return a copy of every user's stored progress."""
+        return copy.deepcopy(self._cache.load())
+
+    def apply_changes(self, changes: Mapping[str, LessonProgress | None]) -> None:
+        """Apply saves and resets for several users with one atomic replace."""
+        if not changes:
+            return
+        storage = dict(self._cache.load())
+        for user_id, progress in changes.items():
+            if progress is None:
+                storage.pop(user_id, None)
+            else:
+                storage[user_id] = copy.deepcopy(progress)
+        self._save_storage(storage)
+
     def _load_storage(self) -> dict[str, LessonProgress]:
         """Load all persisted progress payloads."""
         if not self._file_path.exists():
@@ -65,23 +99,9 @@ class JsonFileProgressRepository(ProgressRepository):
             return {}
 
     def _save_storage(self, storage: dict[str, LessonProgress]) -> None:
-        """Persist the full storage document to disk."""
-        temp_path: Path | None = None
-        try:
-            with NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=self._file_path.parent,
-                prefix=f"{self._file_path.name}.",
-                suffix=".tmp",
-                delete=False,
-            ) as temp_file:
-                json.dump(storage, temp_file)
-                temp_file.flush()
-                os.fsync(temp_file.fileno())
-                temp_path = Path(temp_file.name)
-
-            os.replace(temp_path, self._file_path)
-        finally:
-            if temp_path is not None and temp_path.exists():
-                temp_path.unlink()
+        """Persist the full storage document to disk and refresh the cache."""
+        replace_file(
+            self._file_path,
+            text_writer(lambda temp_file: json.dump(storage, temp_file)),
+        )
+        self._cache.store(storage)
@@ -2,171 +2,297 @@
 
 from __future__ import annotations
 
+import bz2
+import gzip
+import io
 import json
-import os
+import lzma
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import replace
 from datetime import datetime
 from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import cast
+from typing import IO, Literal, NoReturn
 
-from python_learning_orchestrated.domain.practice import (
-    Attempt,
-    AttemptOutcome,
-    LearningItem,
+from python_learning_orchestrated.adapters.atomic_file import replace_file
+from python_learning_orchestrated.adapters.cached_document import (
+    CachedDocument,
+    CacheStats,
 )
+from python_learning_orchestrated.adapters.json_stream import iter_object_members
+from python_learning_orchestrated.adapters.snapshot_codec import (
+    attempt_from_dict,
+    decode_attempt_columns,
+    decode_item_columns,
+    decode_timestamp,
+    item_from_dict,
+    snapshot_from_payload,
+    snapshot_to_payload,
+)
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
 from python_learning_orchestrated.ports.progress_snapshot_store import (
     ProgressSnapshotStore,
+    SnapshotRecord,
 )
 
+DEFAULT_MAX_SNAPSHOT_BYTES = 10 * 1024 * 1024
 
-class JsonFileProgressSnapshotStore(ProgressSnapshotStore):
-    """Read and write progress snapshots at a JSON file path."""
 
-    def __init__(self, file_path: str | Path) -> None:
+class JsonFileProgressSnapshotStore(ProgressSnapshotStore):
+    """Read and write progress snapshots at a JSON file path.
+
+    The decoded snapshot is cached in memory and only re-read when the file's
+    modification signature changes. `max_bytes` guards `load()`, which
+    materializes the whole snapshot; `None` disables the guard.
+    `iter_records()` streams the file and is not size limited, and neither is
+    `load_streamed()`, which builds the snapshot from that stream. With
+    `columnar=True` snapshots are saved in the columnar layout; both layouts
+    are detected on load.
+
+    Paths ending in `.gz`, `.bz2`, `.xz` or `.lzma` are compressed with the
+    matching stdlib codec; the JSON is encoded into and decoded from the
+    compressed stream incrementally.
+    """
+
+    def __init__(
+        self,
+        file_path: str | Path,
+        *,
+        max_bytes: int | None = DEFAULT_MAX_SNAPSHOT_BYTES,
+        columnar: bool = False,
+    ) -> None:
         self._file_path = Path(file_path)
         self._file_path.parent.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._columnar = columnar
+        self._cache = CachedDocument(self._file_path, self._read_snapshot)
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Return snapshot cache hit/miss counters."""
+        return self._cache.stats
 
     def load(self) -> ProgressSnapshot:
-        return progress_snapshot_from_payload(self._load_payload())
+        snapshot = self._cache.load()
+        return replace(
+            snapshot, items=list(snapshot.items), attempts=list(snapshot.attempts)
+        )
 
     def save(self, snapshot: ProgressSnapshot) -> None:
-        self._save_payload(progress_snapshot_to_payload(snapshot))
+        self._save_payload(snapshot_to_payload(snapshot, columnar=self._columnar))
+        self._cache.store(
+            replace(
+                snapshot, items=list(snapshot.items), attempts=list(snapshot.attempts)
+            )
+        )
+
+    def read_exported_at(self) -> datetime:
+        """Return the export time, stopping the parse as soon as it is read.
+
+        Snapshots written by this store put `exported_at` before the item and
+        attempt sections, so those are never decoded.
+        """
+        if not self._file_path.exists():
+            return datetime.fromtimestamp(0)
+        with _open_text_reader(self._file_path) as snapshot_file:
+            members = iter_object_members(
+                snapshot_file, stream_keys=("items", "attempts")
+            )
+            try:
+                for key, value in members:
+                    if key == "exported_at":
+                        return decode_timestamp(value) or datetime.fromtimestamp(0)
+            except json.JSONDecodeError as error:
+                raise ValueError(
+                    f"Progress snapshot file {self._file_path} is not valid JSON"
+                ) from error
+        return datetime.fromtimestamp(0)
+
+    def iter_records(self) -> Iterator[SnapshotRecord]:
+        """Yield items and attempts while parsing the file incrementally."""
+        if not self._file_path.exists():
+            return
+        with _open_text_reader(self._file_path) as snapshot_file:
+            yield from iter_snapshot_json_records(
+                snapshot_file, source=f"file {self._file_path}"
+            )
+
+    def load_streamed(self) -> ProgressSnapshot:
+        """Return the whole snapshot, decoding it while parsing incrementally.
+
+        Unlike `load()` the file text is never held in memory, so it is not
+        size limited and bypasses the cache.
+        """
+        header: dict[str, object] = {}
+        items: list[LearningItem] = []
+        attempts: list[Attempt] = []
+
+        def section_members(
+            members: Iterator[tuple[str, object]],
+        ) -> Iterator[tuple[str, object]]:
+            for key, value in members:
+                if key in ("items", "attempts"):
+                    yield key, value
+                else:
+                    header[key] = value
+
+        if self._file_path.exists():
+            with _open_text_reader(self._file_path) as snapshot_file:
+                members = iter_object_members(
+                    snapshot_file, stream_keys=("items", "attempts")
+                )
+                try:
+                    for record in _decode_snapshot_members(section_members(members)):
+                        if isinstance(record, LearningItem):
+                            items.append(record)
+                        else:
+                            attempts.append(record)
+                except json.JSONDecodeError as error:
+                    raise ValueError(
+                        f"Progress snapshot file {self._file_path} is not valid JSON"
+                    ) from error
+        return replace(snapshot_from_payload(header), items=items, attempts=attempts)
+
+    def _read_snapshot(self) -> ProgressSnapshot:
+        return progress_snapshot_from_payload(self._load_payload())
 
     def _load_payload(self) -> dict[str, object]:
         if not self._file_path.exists():
             return {}
-        if self._file_path.stat().st_size > 10 * 1024 * 1024:
-            raise ValueError(
-                f"Progress snapshot file {self._file_path} exceeds 10MB size limit"
-            )
+        if (
+            self._max_bytes is not None
+            and self._file_path.stat().st_size > self._max_bytes
+        ):
+            self._raise_too_large()
         try:
-            parsed = json.loads(self._file_path.read_text(encoding="utf-8"))
-        except (OSError, json.JSONDecodeError):
+            with _open_text_reader(self._file_path) as snapshot_file:
+                # Compressed files can expand past the limit, so cap the read.
+                content = snapshot_file.read(
+                    -1 if self._max_bytes is None else self._max_bytes + 1
+                )
+        except (OSError, EOFError, lzma.LZMAError):
             return {}
-        return parsed if isinstance(parsed, dict) else {}
-
-    def _save_payload(self, payload: dict[str, object]) -> None:
-        temp_path: Path | None = None
+        if self._max_bytes is not None and len(content) > self._max_bytes:
+            self._raise_too_large()
         try:
-            with NamedTemporaryFile(
-                mode="w",
-                encoding="utf-8",
-                dir=self._file_path.parent,
-                prefix=f"{self._file_path.name}.",
-                suffix=".tmp",
-                delete=False,
-            ) as temp_file:
-                json.dump(payload, temp_file)
-                temp_file.flush()
-                os.fsync(temp_file.fileno())
-                temp_path = Path(temp_file.name)
-            os.replace(temp_path, self._file_path)
-        finally:
-            if temp_path is not None and temp_path.exists():
-                temp_path.unlink()
-
-
-def _item_to_dict(item: LearningItem) -> dict[str, object]:
-    return {
-        "id": item.id,
-        "prompt": item.prompt,
-        "status": item.status,
-        "order": item.order,
-        "due_at": item.due_at.isoformat() if item.due_at else None,
-        "review_level": item.review_level,
-        "interval_minutes": item.interval_minutes,
-    }
-
-
-def progress_snapshot_to_payload(snapshot: ProgressSnapshot) -> dict[str, object]:
-    """Serialize progress snapshot to the stable JSON payload shape."""
+            parsed = json.loads(content)
+        except json.JSONDecodeError:
+            return {}
+        return parsed if isinstance(parsed, dict) else {}
 
-    return {
-        "version": snapshot.version,
-        "exported_at": snapshot.exported_at.isoformat(),
-        "items": [_item_to_dict(item) for item in snapshot.items],
-        "attempts": [_attempt_to_dict(attempt) for attempt in snapshot.attempts],
-    }
+    def _raise_too_large(self) -> NoReturn:
+        raise ValueError(
+            f"Progress snapshot file {self._file_path} exceeds "
+            f"{self._max_bytes} byte size limit; stream it with iter_records()"
+        )
 
+    def _save_payload(self, payload: dict[str, object]) -> None:
+        def write(temp_file: IO[bytes]) -> None:
+            with _open_text_writer(temp_file, self._file_path) as text_file:
+                json.dump(payload, text_file)
 
-def progress_snapshot_from_payload(payload: dict[str, object]) -> ProgressSnapshot:
-    """Deserialize progress snapshot from the stable JSON payload shape."""
+        replace_file(self._file_path, write)
 
-    raw_items = payload.get("items", [])
-    raw_attempts = payload.get("attempts", [])
-
-    item_entries = raw_items if isinstance(raw_items, list) else []
-    attempt_entries = raw_attempts if isinstance(raw_attempts, list) else []
-
-    items = [
-        _item_from_dict(entry) for entry in item_entries if isinstance(entry, dict)
-    ]
-    attempts = [
-        _attempt_from_dict(entry)
-        for entry in attempt_entries
-        if isinstance(entry, dict) and _has_attempt_required_fields(entry)
-    ]
-
-    exported_at_raw = payload.get("exported_at")
-    exported_at = (
-        datetime.fromisoformat(exported_at_raw)
-        if isinstance(exported_at_raw, str)
-        else datetime.fromtimestamp(0)
-    )
 
-    return ProgressSnapshot(
-        version=_to_int(payload.get("version"), 1),
-        exported_at=exported_at,
-        items=items,
-        attempts=attempts,
-    )
+def write_snapshot_json(
+    snapshot: ProgressSnapshot, stream: IO[str], *, columnar: bool = False
+) -> None:
+    """Encode `snapshot` as JSON into an open text stream, such as stdout."""
+    json.dump(snapshot_to_payload(snapshot, columnar=columnar), stream)
 
 
-def _item_from_dict(payload: dict[str, object]) -> LearningItem:
-    due_at_raw = payload.get("due_at")
-    due_at = datetime.fromisoformat(due_at_raw) if isinstance(due_at_raw, str) else None
-    return LearningItem(
-        id=str(payload.get("id", "")),
-        prompt=str(payload.get("prompt", "")),
-        status="review" if payload.get("status") == "review" else "new",
-        order=_to_int(payload.get("order"), 0),
-        due_at=due_at,
-        review_level=_to_int(payload.get("review_level"), 0),
-        interval_minutes=_to_int(payload.get("interval_minutes"), 0),
-    )
+def iter_snapshot_json_records(
+    stream: IO[str], *, source: str = "stream"
+) -> Iterator[SnapshotRecord]:
+    """Yield items and attempts from a JSON snapshot text stream, such as stdin."""
+    try:
+        yield from _decode_snapshot_members(
+            iter_object_members(stream, stream_keys=("items", "attempts"))
+        )
+    except json.JSONDecodeError as error:
+        raise ValueError(f"Progress snapshot {source} is not valid JSON") from error
 
 
-def _attempt_to_dict(attempt: Attempt) -> dict[str, str]:
-    return {
-        "item_id": attempt.item_id,
-        "timestamp": attempt.timestamp.isoformat(),
-        "outcome": attempt.outcome,
-    }
+def progress_snapshot_to_payload(snapshot: ProgressSnapshot) -> dict[str, object]:
+    """Serialize progress snapshot to the stable JSON payload shape."""
 
+    return snapshot_to_payload(snapshot)
 
-def _attempt_from_dict(payload: dict[str, object]) -> Attempt:
-    outcome = str(payload.get("outcome", "skip"))
-    normalized = outcome if outcome in {"correct", "incorrect", "skip"} else "skip"
-    return Attempt(
-        item_id=str(payload.get("item_id", "")),
-        timestamp=datetime.fromisoformat(str(payload.get("timestamp"))),
-        outcome=cast(AttemptOutcome, normalized),
-    )
 
+def progress_snapshot_from_payload(payload: dict[str, object]) -> ProgressSnapshot:
+    """Deserialize progress snapshot from the stable JSON payload shape."""
 
-def _has_attempt_required_fields(payload: dict[str, object]) -> bool:
-    return isinstance(payload.get("item_id"), str) and isinstance(
-        payload.get("timestamp"), str
+    return snapshot_from_payload(payload)
+
+
+def _decode_snapshot_members(
+    members: Iterator[tuple[str, object]],
+) -> Iterator[SnapshotRecord]:
+    """Decode streamed members, telling the layouts apart by value shape.
+
+    Row arrays arrive one object per element, while a columnar section is a
+    single object of column lists, so the `"layout"` key (which may come
+    after the sections) is not needed.
+    """
+    for key, value in members:
+        if not isinstance(value, dict):
+            continue
+        columnar = all(isinstance(column, list) for column in value.values())
+        if columnar and key == "items":
+            yield from decode_item_columns(value)
+        elif columnar and key == "attempts":
+            yield from decode_attempt_columns(value, strict=True)
+        elif key == "items":
+            yield item_from_dict(value)
+        elif key == "attempts":
+            attempt = attempt_from_dict(value, strict=True)
+            if attempt is not None:
+                yield attempt
+
+
+def _compression_opener(file_path: Path) -> Callable[..., IO[str]] | None:
+    return _COMPRESSION_OPENERS.get(file_path.suffix.lower())
+
+
+def _open_text_reader(file_path: Path) -> IO[str]:
+    opener = _compression_opener(file_path)
+    if opener is None:
+        return file_path.open(encoding="utf-8")
+    return opener(file_path, "rt", encoding="utf-8")
+
+
+@contextmanager
+def _open_text_writer(raw_file: IO[bytes], file_path: Path) -> Iterator[IO[str]]:
+    """Yield a UTF-8 text stream that writes through to `raw_file`.
+
+    `raw_file` is left open so the caller can fsync it.
+    """
+    opener = _compression_opener(file_path)
+    if opener is not None:
+        with opener(raw_file, "wt", encoding="utf-8") as text_file:
+            yield text_file
+        return
+    text_file = io.TextIOWrapper(raw_file, encoding="utf-8")
+    try:
+        yield text_file
+    finally:
+        text_file.flush()
+        text_file.detach()
+
+
+def _open_lzma_alone(
+    file: str | Path | IO[bytes], mode: Literal["rt", "wt"], *, encoding: str
+) -> IO[str]:
+    binary_mode: Literal["r", "w"] = "r" if mode == "rt" else "w"
+    return io.TextIOWrapper(
+        lzma.LZMAFile(file, binary_mode, format=lzma.FORMAT_ALONE), encoding=encoding
     )
 
 
-def _to_int(value: object, default: int) -> int:
-    if isinstance(value, int):
-        return value
-    if isinstance(value, str):
-        try:
-            return int(value)
-        except ValueError:
-            return default
-    return default
+_COMPRESSION_OPENERS: dict[str, Callable[..., IO[str]]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+    ".lzma": _open_lzma_alone,
+}
@@ -0,0 +1,118 @@
+"""Incremental JSON tokenizer for large top-level objects."""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Collection, Iterator
+from typing import IO
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+
+
+def iter_object_members(
+    source: IO[str],
+    *,
+    stream_keys: Collection[str] = (),
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[str, object]]:
+    """Yield `(key, value)` pairs of a top-level JSON object in one pass.
+
+    Array members whose key is in `stream_keys` are not decoded as a whole:
+    each array element is yielded as its own `(key, element)` pair, so memory
+    stays bounded by the largest element rather than the whole document.
+    Raises `json.JSONDecodeError` when the document is malformed.
+    """
+    reader = _ChunkReader(source, chunk_size)
+    reader.expect("{")
+    if reader.consume_if("}"):
+        return
+    while True:
+        key = reader.decode_value()
+        if not isinstance(key, str):
+            raise reader.error("Expecting property name enclosed in double quotes")
+        reader.expect(":")
+        if key in stream_keys and reader.consume_if("["):
+            if not reader.consume_if("]"):
+                while True:
+                    yield key, reader.decode_value()
+                    if reader.consume_if("]"):
+                        break
+                    reader.expect(",")
+        else:
+            yield key, reader.decode_value()
+        if reader.consume_if("}"):
+            return
+        reader.expect(",")
+
+
+class _ChunkReader:
+    """Sliding text buffer that decodes JSON values with `raw_decode`."""
+
+    def __init__(self, source: IO[str], chunk_size: int) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self._source = source
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def expect(self, token: str) -> None:
+        if not self.consume_if(token):
+            raise self.error(f"Expecting {token!r}")
+
+    def consume_if(self, token: str) -> bool:
+        self._skip_whitespace()
+        if self._buffer.startswith(token, self._position):
+            self._position += len(token)
+            return True
+        return False
+
+    def decode_value(self) -> object:
+        self._skip_whitespace()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                self._read_more()
+                continue
+            if end == len(self._buffer) and not self._eof:
+                # A number may continue in the next chunk; decode it again.
+                self._read_more()
+                continue
+            self._position = end
+            self._compact()
+            return value
+
+    def error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._position)
+
+    def _skip_whitespace(self) -> None:
+        while True:
+            while (
+                self._position < len(self._buffer)
+                and self._buffer[self._position] in _WHITESPACE
+            ):
+                self._position += 1
+            if self._position < len(self._buffer) or self._eof:
+                return
+            self._read_more()
+
+    def _read_more(self) -> None:
+        # Grow reads with the buffer so one large value is not re-scanned
+        # once per chunk.
+        chunk = self._source.read(max(self._chunk_size, len(self._buffer)))
+        if not chunk:
+            self._eof = True
+            return
+        self._buffer += chunk
+
+    def _compact(self) -> None:
+        if self._position >= self._chunk_size:
+            self._buffer = self._buffer[self._position :]
+            self._position = 0
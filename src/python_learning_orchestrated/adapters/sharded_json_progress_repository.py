@@ -0,0 +1,167 @@
+"""Directory-sharded JSON progress repository adapter."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+from collections.abc import Mapping
+from pathlib import Path
+
+from python_learning_orchestrated.adapters.atomic_file import (
+    replace_file,
+    text_writer,
+)
+from python_learning_orchestrated.adapters.json_file_progress_repository import (
+    JsonFileProgressRepository,
+)
+from python_learning_orchestrated.domain.progress import LessonProgress
+from python_learning_orchestrated.ports.progress_repository import ProgressRepository
+
+LAYOUT_FILENAME = "layout.json"
+_LAYOUT_VERSION = 1
+
+
+class ShardedJsonFileProgressRepository(ProgressRepository):
+    """Persist progress across many small JSON files in a directory.
+
+    By default every user gets their own file, so writes for different users
+    never touch the same file and resetting a user unlinks their file. With
+    `shard_count` set, users are instead hash-bucketed into that many shard
+    files. Each file uses the same document shape as
+    `JsonFileProgressRepository`.
+
+    The layout is saved to `layout.json` on the first write. Reopening the
+    directory without `shard_count` uses the saved layout, and a different
+    `shard_count` raises `ValueError` instead of reading the wrong files.
+
+    Shard files are read, modified and replaced without a lock. In
+    hash-bucket mode, separate processes writing users that share a shard can
+    therefore overwrite each other's changes; use one writer per directory.
+    """
+
+    def __init__(
+        self, directory: str | Path, *, shard_count: int | None = None
+    ) -> None:
+        if shard_count is not None and shard_count < 1:
+            raise ValueError("shard_count must be at least 1")
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        layout_path = self._directory / LAYOUT_FILENAME
+        self._layout_saved = layout_path.exists()
+        if self._layout_saved:
+            saved_count = _read_layout(layout_path)
+            if shard_count is not None and shard_count != saved_count:
+                raise ValueError(
+                    f"{self._directory} holds {_describe_layout(saved_count)}, "
+                    f"not {_describe_layout(shard_count)}"
+                )
+            shard_count = saved_count
+        self._shard_count = shard_count
+        self._shards: dict[Path, JsonFileProgressRepository] = {}
+
+    def get_progress(self, user_id: str) -> LessonProgress:
+        """Return stored progress for user_id from its shard file."""
+        return self._shard_for(user_id).get_progress(user_id)
+
+    def save_progress(self, user_id: str, progress: LessonProgress) -> None:
+        """Persist progress for user_id by replacing only its shard file."""
+        self._save_layout()
+        self._shard_for(user_id).save_progress(user_id, progress)
+
+    def reset_progress(self, user_id: str) -> None:
+        """Delete progress for user_id; per-user files are simply unlinked."""
+        self._save_layout()
+        if self._shard_count is None:
+            self._path_for(user_id).unlink(missing_ok=True)
+            return
+        self._shard_for(user_id).reset_progress(user_id)
+
+    def apply_changes(self, changes: Mapping[str, LessonProgress | None]) -> None:
+        """Apply changes with at most one write per affected shard file."""
+        self._save_layout()
+        by_path: dict[Path, dict[str, LessonProgress | None]] = {}
+        for user_id, progress in changes.items():
+            if progress is None and self._shard_count is None:
+                self.reset_progress(user_id)
+                continue
+            by_path.setdefault(self._path_for(user_id), {})[user_id] = progress
+        for path, shard_changes in by_path.items():
+            self._shard_at(path).apply_changes(shard_changes)
+
+    def _save_layout(self) -> None:
+        """Write `layout.json` before the first write to a new directory."""
+        if self._layout_saved:
+            return
+        payload = {
+            "version": _LAYOUT_VERSION,
+            "mode": "per-user" if self._shard_count is None else "hash-bucket",
+            "shard_count": self._shard_count,
+        }
+        replace_file(
+            self._directory / LAYOUT_FILENAME,
+            text_writer(lambda temp_file: json.dump(payload, temp_file)),
+        )
+        self._layout_saved = True
+
+    def _shard_for(self, user_id: str) -> JsonFileProgressRepository:
+        return self._shard_at(self._path_for(user_id))
+
+    def _shard_at(self, path: Path) -> JsonFileProgressRepository:
+        if self._shard_count is None:
+            return JsonFileProgressRepository(path)
+        shard = self._shards.get(path)
+        if shard is None:
+            shard = JsonFileProgressRepository(path)
+            self._shards[path] = shard
+        return shard
+
+    def _path_for(self, user_id: str) -> Path:
+        digest = hashlib.sha256(user_id.encode("utf-8")).hexdigest()
+        if self._shard_count is None:
+            slug = re.sub(r"[^a-zA-Z0-9]+", "-", user_id).strip("-").lower()[:40]
+            return self._directory / f"{slug or 'user'}-{digest[:16]}.json"
+        bucket = int(digest[:16], 16) % self._shard_count
+        return self._directory / f"shard-{bucket:04d}.json"
+
+
+def migrate_progress_file_to_shards(
+    source_file: str | Path,
+    directory: str | Path,
+    *,
+    shard_count: int | None = None,
+) -> int:
+    """Copy every user from a monolithic progress file into a sharded directory.
+
+    Returns the number of migrated users. The source file is left untouched.
+    """
+    all_progress = JsonFileProgressRepository(source_file).all_progress()
+    target = ShardedJsonFileProgressRepository(directory, shard_count=shard_count)
+    target.apply_changes(all_progress)
+    return len(all_progress)
+
+
+def _read_layout(path: Path) -> int | None:
+    """Return the saved shard count, or `None` for one file per user.
+
+    Raises `ValueError` if the layout file cannot be read.
+    """
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError) as exc:
+        raise ValueError(f"cannot read shard layout {path}: {exc}") from None
+    if not isinstance(payload, dict):
+        raise ValueError(f"cannot read shard layout {path}")
+    mode = payload.get("mode")
+    shard_count = payload.get("shard_count")
+    if mode == "per-user":
+        return None
+    if mode == "hash-bucket" and isinstance(shard_count, int) and shard_count >= 1:
+        return shard_count
+    raise ValueError(f"unknown shard layout {mode!r} in {path}")
+
+
+def _describe_layout(shard_count: int | None) -> str:
+    if shard_count is None:
+        return "one file per user"
+    return f"{shard_count} hash-bucket shards"
@@ -0,0 +1,449 @@
+"""Shared JSON codec for learning items, attempts and progress snapshots.
+
+Every JSON adapter stores items and attempts in the same dict shape; this
+module is the single encoder/decoder for it. Decoding first tries a fast
+path that fetches all fields in one `itemgetter` call and only checks exact
+types, falling back to the lenient per-field path for anything unusual.
+
+Session files and logs skip attempts without a usable id or timestamp, so a
+torn record does not block a session. Snapshots and checkpoints are decoded
+strictly: an attempt timestamp that cannot be decoded raises `ValueError`,
+like an invalid item `due_at` does, instead of silently dropping the attempt.
+
+Schema version 1 stores timestamps as ISO-8601 strings. Version 2 stores them
+as integer epoch microseconds (see `domain.timestamps`): a naive timestamp is a
+plain int, and an aware one is a `[micros, offset_minutes]` pair so its UTC
+offset is kept. An aware timestamp whose offset is not whole minutes stays an
+ISO string. Decoders accept every form in any field, so v1 and v2 payloads
+are read the same way.
+
+Snapshots can also use a columnar layout (`"layout": "columnar"`): items and
+attempts become objects of parallel per-field arrays, and attempt item ids
+and outcomes are dictionary-encoded as indexes into small value tables.
+`snapshot_from_payload` detects the layout on load.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from operator import itemgetter
+from typing import cast
+
+from python_learning_orchestrated.domain.practice import (
+    Attempt,
+    AttemptOutcome,
+    LearningItem,
+)
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+from python_learning_orchestrated.domain.timestamps import (
+    from_epoch_micros,
+    to_epoch_micros,
+    utc_offset_minutes,
+)
+
+COLUMNAR_LAYOUT = "columnar"
+EPOCH_TIMESTAMPS_VERSION = 2
+
+_OUTCOMES = frozenset({"correct", "incorrect", "skip"})
+_ITEM_FIELDS = itemgetter(
+    "id", "prompt", "status", "order", "due_at", "review_level", "interval_minutes"
+)
+_ATTEMPT_FIELDS = itemgetter("item_id", "timestamp", "outcome")
+
+
+def item_to_dict(
+    item: LearningItem, *, epoch_timestamps: bool = False
+) -> dict[str, object]:
+    """Encode an item as its JSON object."""
+    return {
+        "id": item.id,
+        "prompt": item.prompt,
+        "status": item.status,
+        "order": item.order,
+        "due_at": (
+            encode_timestamp(item.due_at, epoch_timestamps=epoch_timestamps)
+            if item.due_at is not None
+            else None
+        ),
+        "review_level": item.review_level,
+        "interval_minutes": item.interval_minutes,
+    }
+
+
+def attempt_to_dict(
+    attempt: Attempt, *, epoch_timestamps: bool = False
+) -> dict[str, object]:
+    """Encode an attempt as its JSON object."""
+    return {
+        "item_id": attempt.item_id,
+        "timestamp": encode_timestamp(
+            attempt.timestamp, epoch_timestamps=epoch_timestamps
+        ),
+        "outcome": attempt.outcome,
+    }
+
+
+def item_from_dict(payload: dict[str, object]) -> LearningItem:
+    """Decode an item, defaulting missing or malformed fields.
+
+    Raises `ValueError` if `due_at` is not a valid v1 or v2 timestamp.
+    """
+    try:
+        item_id, prompt, status, order, due_at, review_level, interval_minutes = (
+            _ITEM_FIELDS(payload)
+        )
+    except KeyError:
+        return _item_from_dict_lenient(payload)
+    if (
+        type(item_id) is not str
+        or type(prompt) is not str
+        or type(order) is not int
+        or type(review_level) is not int
+        or type(interval_minutes) is not int
+    ):
+        return _item_from_dict_lenient(payload)
+    if due_at is not None:
+        if type(due_at) is str:
+            due_at = parse_timestamp(due_at)
+        elif type(due_at) is int or type(due_at) is list:
+            due_at = decode_timestamp(due_at)
+        else:
+            return _item_from_dict_lenient(payload)
+    return LearningItem(
+        item_id,
+        prompt,
+        "review" if status == "review" else "new",
+        order,
+        due_at,
+        review_level,
+        interval_minutes,
+    )
+
+
+def attempt_from_dict(
+    payload: dict[str, object], *, strict: bool = False
+) -> Attempt | None:
+    """Decode an attempt, or return `None` if it lacks a valid id/timestamp.
+
+    With `strict`, an invalid timestamp string or epoch pair raises
+    `ValueError`.
+    """
+    try:
+        item_id, timestamp, outcome = _ATTEMPT_FIELDS(payload)
+    except KeyError:
+        item_id = payload.get("item_id")
+        timestamp = payload.get("timestamp")
+        outcome = payload.get("outcome")
+    if not isinstance(item_id, str):
+        return None
+    try:
+        parsed_timestamp = decode_timestamp(timestamp)
+    except ValueError:
+        if strict:
+            raise _invalid_timestamp(item_id, timestamp) from None
+        return None
+    if parsed_timestamp is None:
+        return None
+    return Attempt(
+        item_id,
+        parsed_timestamp,
+        cast(AttemptOutcome, outcome if outcome in _OUTCOMES else "skip"),
+    )
+
+
+def decode_items(entries: Iterable[object]) -> list[LearningItem]:
+    """Decode every JSON object in `entries` as an item, skipping non-objects."""
+    return [item_from_dict(entry) for entry in entries if isinstance(entry, dict)]
+
+
+def decode_attempts(entries: Iterable[object]) -> Iterator[Attempt]:
+    """Yield decoded attempts, skipping entries without a valid id/timestamp."""
+    for entry in entries:
+        if isinstance(entry, dict):
+            attempt = attempt_from_dict(entry)
+            if attempt is not None:
+                yield attempt
+
+
+def snapshot_to_payload(
+    snapshot: ProgressSnapshot, *, columnar: bool = False
+) -> dict[str, object]:
+    """Encode a progress snapshot in the schema named by its `version`."""
+    epoch = snapshot.version >= EPOCH_TIMESTAMPS_VERSION
+    payload: dict[str, object] = {
+        "version": snapshot.version,
+        "exported_at": encode_timestamp(snapshot.exported_at, epoch_timestamps=epoch),
+    }
+    if snapshot.delta_since is not None:
+        payload["delta_since"] = encode_timestamp(
+            snapshot.delta_since, epoch_timestamps=epoch
+        )
+    if columnar:
+        payload["layout"] = COLUMNAR_LAYOUT
+    payload["items"] = items_to_payload(
+        snapshot.items, columnar=columnar, epoch_timestamps=epoch
+    )
+    payload["attempts"] = attempts_to_payload(
+        snapshot.attempts, columnar=columnar, epoch_timestamps=epoch
+    )
+    return payload
+
+
+def snapshot_from_payload(payload: dict[str, object]) -> ProgressSnapshot:
+    """Decode a row or columnar snapshot, ignoring malformed entries."""
+    exported_at = decode_timestamp(payload.get("exported_at"))
+    items = items_from_payload(payload.get("items", []))
+    attempts = attempts_from_payload(payload.get("attempts", []))
+    return ProgressSnapshot(
+        version=to_int(payload.get("version"), 1),
+        exported_at=exported_at or datetime.fromtimestamp(0),
+        items=items,
+        attempts=attempts,
+        delta_since=decode_timestamp(payload.get("delta_since")),
+    )
+
+
+def items_to_payload(
+    items: list[LearningItem],
+    *,
+    columnar: bool = False,
+    epoch_timestamps: bool = False,
+) -> object:
+    """Encode items as a list of objects, or as columns if `columnar`."""
+    if columnar:
+        return _item_columns(items, epoch_timestamps)
+    return [item_to_dict(item, epoch_timestamps=epoch_timestamps) for item in items]
+
+
+def attempts_to_payload(
+    attempts: list[Attempt],
+    *,
+    columnar: bool = False,
+    epoch_timestamps: bool = False,
+) -> object:
+    """Encode attempts as a list of objects, or as columns if `columnar`."""
+    if columnar:
+        return _attempt_columns(attempts, epoch_timestamps)
+    return [
+        attempt_to_dict(attempt, epoch_timestamps=epoch_timestamps)
+        for attempt in attempts
+    ]
+
+
+def items_from_payload(value: object) -> list[LearningItem]:
+    """Decode an `items` value in either layout."""
+    if isinstance(value, dict):
+        return decode_item_columns(value)
+    return decode_items(value if isinstance(value, list) else [])
+
+
+def attempts_from_payload(value: object) -> list[Attempt]:
+    """Decode a snapshot `attempts` value in either layout, strictly."""
+    if isinstance(value, dict):
+        return list(decode_attempt_columns(value, strict=True))
+    entries = value if isinstance(value, list) else []
+    return [
+        attempt
+        for entry in entries
+        if isinstance(entry, dict)
+        and (attempt := attempt_from_dict(entry, strict=True)) is not None
+    ]
+
+
+def decode_item_columns(columns: dict[str, object]) -> list[LearningItem]:
+    """Decode items from a columnar `items` object."""
+    ids = _column(columns, "id", 0, "")
+    count = len(ids)
+    rows = zip(
+        ids,
+        _column(columns, "prompt", count, ""),
+        _column(columns, "status", count, "new"),
+        _column(columns, "order", count, 0),
+        _column(columns, "due_at", count, None),
+        _column(columns, "review_level", count, 0),
+        _column(columns, "interval_minutes", count, 0),
+        strict=False,
+    )
+    return [
+        LearningItem(
+            str(item_id),
+            str(prompt),
+            "review" if status == "review" else "new",
+            to_int(order, 0),
+            decode_timestamp(due_at),
+            to_int(review_level, 0),
+            to_int(interval_minutes, 0),
+        )
+        for item_id, prompt, status, order, due_at, review_level, interval_minutes in (
+            rows
+        )
+    ]
+
+
+def decode_attempt_columns(
+    columns: dict[str, object], *, strict: bool = False
+) -> Iterator[Attempt]:
+    """Yield attempts from a columnar `attempts` object, skipping bad rows.
+
+    With `strict`, an invalid timestamp string or epoch pair raises
+    `ValueError`.
+    """
+    item_ids = _column(columns, "item_ids", 0, None)
+    outcomes = [
+        outcome if outcome in _OUTCOMES else "skip"
+        for outcome in _column(columns, "outcomes", 0, None)
+    ]
+    item_indexes = _column(columns, "item", 0, None)
+    count = len(item_indexes)
+    rows = zip(
+        item_indexes,
+        _column(columns, "timestamp", count, None),
+        _column(columns, "outcome", count, None),
+        strict=False,
+    )
+    for item_index, timestamp, outcome_index in rows:
+        if not isinstance(item_index, int) or not 0 <= item_index < len(item_ids):
+            continue
+        item_id = item_ids[item_index]
+        if not isinstance(item_id, str):
+            continue
+        try:
+            parsed_timestamp = decode_timestamp(timestamp)
+        except ValueError:
+            if strict:
+                raise _invalid_timestamp(item_id, timestamp) from None
+            continue
+        if parsed_timestamp is None:
+            continue
+        outcome = (
+            outcomes[outcome_index]
+            if isinstance(outcome_index, int) and 0 <= outcome_index < len(outcomes)
+            else "skip"
+        )
+        yield Attempt(item_id, parsed_timestamp, cast(AttemptOutcome, outcome))
+
+
+def encode_timestamp(
+    value: datetime, *, epoch_timestamps: bool = False
+) -> str | int | list[int]:
+    """Encode a timestamp as ISO-8601 (v1) or epoch microseconds (v2).
+
+    Both keep the UTC offset of aware values.
+    """
+    if not epoch_timestamps:
+        return value.isoformat()
+    try:
+        offset_minutes = utc_offset_minutes(value)
+    except ValueError:
+        return value.isoformat()
+    micros = to_epoch_micros(value)
+    return micros if offset_minutes is None else [micros, offset_minutes]
+
+
+def decode_timestamp(value: object) -> datetime | None:
+    """Decode a v1 or v2 timestamp, else return `None`.
+
+    Raises `ValueError` for strings that are not ISO-8601, for lists that are
+    not `[micros, offset_minutes]` pairs and for out-of-range values.
+    """
+    if isinstance(value, str):
+        return parse_timestamp(value)
+    if type(value) is int:
+        micros, offset_minutes = value, None
+    elif type(value) is list:
+        if len(value) != 2 or type(value[0]) is not int or type(value[1]) is not int:
+            raise ValueError(f"invalid epoch timestamp {value!r}")
+        micros, offset_minutes = value
+    else:
+        return None
+    try:
+        return from_epoch_micros(micros, offset_minutes)
+    except OverflowError:
+        raise ValueError(f"epoch timestamp {value!r} is out of range") from None
+
+
+def parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp."""
+    return datetime.fromisoformat(value)
+
+
+def to_int(value: object, default: int) -> int:
+    """Return `value` as an int, or `default` if it cannot be converted."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value)
+        except ValueError:
+            return default
+    return default
+
+
+def _item_from_dict_lenient(payload: dict[str, object]) -> LearningItem:
+    return LearningItem(
+        id=str(payload.get("id", "")),
+        prompt=str(payload.get("prompt", "")),
+        status="review" if payload.get("status") == "review" else "new",
+        order=to_int(payload.get("order"), 0),
+        due_at=decode_timestamp(payload.get("due_at")),
+        review_level=to_int(payload.get("review_level"), 0),
+        interval_minutes=to_int(payload.get("interval_minutes"), 0),
+    )
+
+
+def _invalid_timestamp(item_id: str, timestamp: object) -> ValueError:
+    return ValueError(f"attempt for {item_id!r} has invalid timestamp {timestamp!r}")
+
+
+def _item_columns(
+    items: list[LearningItem], epoch_timestamps: bool
+) -> dict[str, object]:
+    return {
+        "id": [item.id for item in items],
+        "prompt": [item.prompt for item in items],
+        "status": [item.status for item in items],
+        "order": [item.order for item in items],
+        "due_at": [
+            encode_timestamp(item.due_at, epoch_timestamps=epoch_timestamps)
+            if item.due_at is not None
+            else None
+            for item in items
+        ],
+        "review_level": [item.review_level for item in items],
+        "interval_minutes": [item.interval_minutes for item in items],
+    }
+
+
+def _attempt_columns(
+    attempts: list[Attempt], epoch_timestamps: bool
+) -> dict[str, object]:
+    item_indexes: dict[str, int] = {}
+    outcome_indexes: dict[str, int] = {}
+    return {
+        "item": [
+            item_indexes.setdefault(attempt.item_id, len(item_indexes))
+            for attempt in attempts
+        ],
+        "timestamp": [
+            encode_timestamp(attempt.timestamp, epoch_timestamps=epoch_timestamps)
+            for attempt in attempts
+        ],
+        "outcome": [
+            outcome_indexes.setdefault(attempt.outcome, len(outcome_indexes))
+            for attempt in attempts
+        ],
+        "item_ids": list(item_indexes),
+        "outcomes": list(outcome_indexes),
+    }
+
+
+def _column(
+    columns: dict[str, object], key: str, count: int, default: object
+) -> list[object]:
+    values = columns.get(key)
+    if isinstance(values, list) and len(values) >= count:
+        return values
+    column = list(values) if isinstance(values, list) else []
+    column.extend([default] * (count - len(column)))
+    return column
@@ -0,0 +1,93 @@
+"""Parallel decoding and merging of many progress snapshot files."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from functools import reduce
+from itertools import repeat
+from multiprocessing import get_context
+
+from python_learning_orchestrated.adapters.snapshot_codec import (
+    attempts_from_payload,
+    attempts_to_payload,
+    items_from_payload,
+    items_to_payload,
+)
+from python_learning_orchestrated.domain.practice_progress import (
+    ProgressSnapshot,
+    canonical_snapshot,
+    combine_snapshots,
+)
+
+SnapshotLoader = Callable[[str], ProgressSnapshot]
+
+
+def merge_snapshot_files(
+    paths: Sequence[str], load: SnapshotLoader, *, max_workers: int = 1
+) -> ProgressSnapshot:
+    """Load snapshot files and combine them in order, optionally in parallel.
+
+    By default the files are loaded and combined in this process. With
+    `max_workers` above one they are split into one contiguous group per
+    worker process, and each worker loads and combines its group.
+    Workers send their partial results back in the columnar snapshot
+    layout, which is far cheaper to unpickle than domain objects, and they
+    are combined pairwise in this process until one is left. `load` must be
+    a picklable module-level function. The result equals combining the files
+    one after another with `combine_snapshots`.
+    """
+    if not paths:
+        raise ValueError("no snapshot files to merge")
+    workers = min(max_workers, len(paths))
+    if workers <= 1:
+        return _load_group(paths, load)
+    groups = [
+        paths[index * len(paths) // workers : (index + 1) * len(paths) // workers]
+        for index in range(workers)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=get_context("spawn")
+    ) as pool:
+        partials = [
+            _from_transfer(partial)
+            for partial in pool.map(_load_group_for_transfer, groups, repeat(load))
+        ]
+    while len(partials) > 1:
+        combined = [
+            combine_snapshots(first, second)
+            for first, second in zip(partials[0::2], partials[1::2], strict=False)
+        ]
+        if len(partials) % 2:
+            combined.append(partials[-1])
+        partials = combined
+    return partials[0]
+
+
+def _load_group(paths: Sequence[str], load: SnapshotLoader) -> ProgressSnapshot:
+    return reduce(combine_snapshots, (canonical_snapshot(load(path)) for path in paths))
+
+
+def _load_group_for_transfer(
+    paths: Sequence[str], load: SnapshotLoader
+) -> tuple[int, datetime, object, object]:
+    snapshot = _load_group(paths, load)
+    return (
+        snapshot.version,
+        snapshot.exported_at,
+        items_to_payload(snapshot.items, columnar=True),
+        attempts_to_payload(snapshot.attempts, columnar=True),
+    )
+
+
+def _from_transfer(
+    partial: tuple[int, datetime, object, object],
+) -> ProgressSnapshot:
+    version, exported_at, items, attempts = partial
+    return ProgressSnapshot(
+        version=version,
+        exported_at=exported_at,
+        items=items_from_payload(items),
+        attempts=attempts_from_payload(attempts),
+    )
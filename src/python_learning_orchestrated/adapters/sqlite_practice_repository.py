@@ -0,0 +1,211 @@
+"""SQLite-backed adapter for practice repository port."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from collections.abc import Iterable, Iterator
+from datetime import datetime
+from pathlib import Path
+from typing import cast
+
+from python_learning_orchestrated.domain.practice import (
+    Attempt,
+    AttemptOutcome,
+    LearningItem,
+)
+from python_learning_orchestrated.ports.practice_repository import PracticeRepository
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id TEXT PRIMARY KEY,
+    prompt TEXT NOT NULL,
+    status TEXT NOT NULL,
+    "order" INTEGER NOT NULL,
+    due_at TEXT,
+    review_level INTEGER NOT NULL,
+    interval_minutes INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS items_status_due_at ON items (status, due_at, id);
+CREATE INDEX IF NOT EXISTS items_status_order ON items (status, "order", id);
+CREATE TABLE IF NOT EXISTS attempts (
+    seq INTEGER PRIMARY KEY,
+    item_id TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    outcome TEXT NOT NULL
+);
+"""
+
+_ITEM_COLUMNS = 'id, prompt, status, "order", due_at, review_level, interval_minutes'
+
+_UPSERT_ITEM = f"""
+INSERT INTO items ({_ITEM_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    prompt = excluded.prompt,
+    status = excluded.status,
+    "order" = excluded."order",
+    due_at = excluded.due_at,
+    review_level = excluded.review_level,
+    interval_minutes = excluded.interval_minutes
+"""
+
+_INSERT_ATTEMPT = "INSERT INTO attempts (item_id, timestamp, outcome) VALUES (?, ?, ?)"
+
+ItemRow = tuple[str, str, str, int, str | None, int, int]
+
+
+class SqlitePracticeRepository(PracticeRepository):
+    """Persist practice items and attempts in a SQLite database.
+
+    The database runs in WAL mode, batches writes with `executemany` inside a
+    single transaction, and answers `next_item` with indexed queries instead
+    of loading every item. `due_at` is stored as fixed-width ISO-8601 text so
+    that string order matches chronological order for consistently
+    timezone-naive (or same-offset) timestamps.
+    """
+
+    def __init__(self, db_path: str | Path, seed_items: list[LearningItem]) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        is_new = not self._db_path.exists()
+        self._connection = sqlite3.connect(self._db_path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.executescript(_SCHEMA)
+        if is_new:
+            self.save_items(seed_items)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._connection.close()
+
+    def replace_contents(
+        self, items: list[LearningItem], attempts: Iterable[Attempt]
+    ) -> None:
+        """Build a new database file and rename it over the current one.
+
+        The current connection is closed before the swap, which checkpoints
+        and removes its WAL; other connections to the database must be closed.
+        """
+        temp_path = self._db_path.with_name(f"{self._db_path.name}.restore.tmp")
+        temp_path.unlink(missing_ok=True)
+        connection = sqlite3.connect(temp_path)
+        try:
+            with connection:
+                connection.executescript(_SCHEMA)
+                connection.executemany(
+                    _UPSERT_ITEM, (_item_to_row(item) for item in items)
+                )
+                connection.executemany(
+                    _INSERT_ATTEMPT, (_attempt_to_row(attempt) for attempt in attempts)
+                )
+        except BaseException:
+            connection.close()
+            temp_path.unlink(missing_ok=True)
+            raise
+        connection.close()
+        self._connection.close()
+        os.replace(temp_path, self._db_path)
+        self._connection = sqlite3.connect(self._db_path)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+
+    def list_items(self) -> list[LearningItem]:
+        rows = self._connection.execute(
+            f"SELECT {_ITEM_COLUMNS} FROM items ORDER BY rowid"
+        )
+        return [_item_from_row(row) for row in rows]
+
+    def next_item(self, now: datetime) -> LearningItem | None:
+        row = self._connection.execute(
+            f"SELECT {_ITEM_COLUMNS} FROM items "
+            "WHERE status = 'review' AND due_at IS NOT NULL AND due_at <= ? "
+            "ORDER BY due_at, id LIMIT 1",
+            (_format_timestamp(now),),
+        ).fetchone()
+        if row is None:
+            row = self._connection.execute(
+                f"SELECT {_ITEM_COLUMNS} FROM items "
+                "WHERE status = 'new' ORDER BY \"order\", id LIMIT 1"
+            ).fetchone()
+        return _item_from_row(row) if row is not None else None
+
+    def save_item(self, item: LearningItem) -> None:
+        self.save_items([item])
+
+    def save_items(self, items: list[LearningItem]) -> None:
+        self.apply_changes(items, [])
+
+    def list_attempts(self) -> list[Attempt]:
+        return list(self.iter_attempts())
+
+    def iter_attempts(self) -> Iterator[Attempt]:
+        rows = self._connection.execute(
+            "SELECT item_id, timestamp, outcome FROM attempts ORDER BY seq"
+        )
+        for item_id, timestamp, outcome in rows:
+            yield Attempt(
+                item_id=item_id,
+                timestamp=datetime.fromisoformat(timestamp),
+                outcome=_normalize_outcome(outcome),
+            )
+
+    def record_attempt(self, attempt: Attempt) -> None:
+        self.record_attempts([attempt])
+
+    def record_attempts(self, attempts: list[Attempt]) -> None:
+        self.apply_changes([], attempts)
+
+    @property
+    def appends_attempts(self) -> bool:
+        return True
+
+    def apply_changes(self, items: list[LearningItem], attempts: list[Attempt]) -> None:
+        if not items and not attempts:
+            return
+        with self._connection:
+            if attempts:
+                self._connection.executemany(
+                    _INSERT_ATTEMPT, [_attempt_to_row(attempt) for attempt in attempts]
+                )
+            if items:
+                self._connection.executemany(
+                    _UPSERT_ITEM, [_item_to_row(item) for item in items]
+                )
+
+
+def _format_timestamp(value: datetime) -> str:
+    return value.isoformat(timespec="microseconds")
+
+
+def _item_to_row(item: LearningItem) -> ItemRow:
+    return (
+        item.id,
+        item.prompt,
+        item.status,
+        item.order,
+        _format_timestamp(item.due_at) if item.due_at is not None else None,
+        item.review_level,
+        item.interval_minutes,
+    )
+
+
+def _attempt_to_row(attempt: Attempt) -> tuple[str, str, str]:
+    return (attempt.item_id, _format_timestamp(attempt.timestamp), attempt.outcome)
+
+
+def _item_from_row(row: ItemRow) -> LearningItem:
+    item_id, prompt, status, order, due_at, review_level, interval_minutes = row
+    return LearningItem(
+        id=item_id,
+        prompt=prompt,
+        status="review" if status == "review" else "new",
+        order=order,
+        due_at=datetime.fromisoformat(due_at) if due_at is not None else None,
+        review_level=review_level,
+        interval_minutes=interval_minutes,
+    )
+
+
+def _normalize_outcome(outcome: str) -> AttemptOutcome:
+    normalized = outcome if outcome in {"correct", "incorrect", "skip"} else "skip"
+    return cast(AttemptOutcome, normalized)
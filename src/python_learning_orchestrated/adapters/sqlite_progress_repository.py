@@ -0,0 +1,96 @@
+"""SQLite-backed progress repository adapter."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import cast
+
+from python_learning_orchestrated.domain.progress import LessonProgress
+from python_learning_orchestrated.ports.progress_repository import ProgressRepository
+
+_UPSERT_PROGRESS = (
+    "INSERT INTO progress (user_id, payload) VALUES (?, ?) "
+    "ON CONFLICT (user_id) DO UPDATE SET payload = excluded.payload"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS progress (
+    user_id TEXT PRIMARY KEY,
+    payload TEXT NOT NULL
+)
+"""
+
+
+class SqliteProgressRepository(ProgressRepository):
+    """Persist each user's progress as its own row in a SQLite database.
+
+    Reads and writes touch only the requested user's row. One connection is
+    reused for the lifetime of the repository (guarded by a lock so it can be
+    shared across threads), and WAL mode lets other processes keep reading
+    while a write is in progress.
+    """
+
+    def __init__(self, db_path: str | Path, *, timeout: float = 5.0) -> None:
+        self._db_path = Path(db_path)
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            self._db_path, timeout=timeout, check_same_thread=False
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        with self._connection:
+            self._connection.execute(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def get_progress(self, user_id: str) -> LessonProgress:
+        """Return stored progress for user_id, or empty progress."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT payload FROM progress WHERE user_id = ?", (user_id,)
+            ).fetchone()
+        if row is None:
+            return {}
+        try:
+            progress = json.loads(row[0])
+        except json.JSONDecodeError:
+            return {}
+        return cast(LessonProgress, progress) if isinstance(progress, dict) else {}
+
+    def save_progress(self, user_id: str, progress: LessonProgress) -> None:
+        """Insert or replace the progress row for user_id."""
+        payload = json.dumps(progress)
+        with self._lock, self._connection:
+            self._connection.execute(_UPSERT_PROGRESS, (user_id, payload))
+
+    def reset_progress(self, user_id: str) -> None:
+        """Delete the progress row for user_id if present."""
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM progress WHERE user_id = ?", (user_id,)
+            )
+
+    def apply_changes(self, changes: Mapping[str, LessonProgress | None]) -> None:
+        """Apply saves and resets for several users in one transaction."""
+        saved = [
+            (user_id, json.dumps(progress))
+            for user_id, progress in changes.items()
+            if progress is not None
+        ]
+        reset = [
+            (user_id,) for user_id, progress in changes.items() if progress is None
+        ]
+        if not saved and not reset:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(_UPSERT_PROGRESS, saved)
+            self._connection.executemany(
+                "DELETE FROM progress WHERE user_id = ?", reset
+            )
@@ -0,0 +1,203 @@
+"""Write-behind buffering decorators for repository ports."""
+
+from __future__ import annotations
+
+import atexit
+import copy
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterable, Iterator
+from itertools import chain
+
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.progress import LessonProgress
+from python_learning_orchestrated.ports.practice_repository import PracticeRepository
+from python_learning_orchestrated.ports.progress_repository import ProgressRepository
+
+ClockFn = Callable[[], float]
+
+
+class _WriteBehindBuffer(ABC):
+    """Track buffered writes and decide when they must be group-committed.
+
+    `max_unflushed_writes` bounds how many accepted writes can be lost if the
+    process dies before a flush; `1` makes the wrapper write-through. With
+    `max_delay_seconds` set, the next write after that much time since the
+    last flush also triggers a flush. Pending writes are flushed at
+    interpreter exit until `close()` is called; the exit hook holds a
+    reference to the wrapper, so a wrapper that is never closed stays alive
+    until the interpreter exits. Call `close()` when done with it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_unflushed_writes: int,
+        max_delay_seconds: float | None,
+        clock: ClockFn,
+    ) -> None:
+        if max_unflushed_writes < 1:
+            raise ValueError("max_unflushed_writes must be at least 1")
+        if max_delay_seconds is not None and max_delay_seconds < 0:
+            raise ValueError("max_delay_seconds must not be negative")
+        self._max_unflushed_writes = max_unflushed_writes
+        self._max_delay_seconds = max_delay_seconds
+        self._clock = clock
+        self._unflushed_writes = 0
+        self._last_flush = clock()
+        atexit.register(self.flush)
+
+    @property
+    def unflushed_writes(self) -> int:
+        """Return how many accepted writes are not yet durable."""
+        return self._unflushed_writes
+
+    def flush(self) -> None:
+        """Write all buffered changes to the wrapped repository in one commit."""
+        if self._unflushed_writes:
+            self._flush_pending()
+            self._unflushed_writes = 0
+        self._last_flush = self._clock()
+
+    def close(self) -> None:
+        """Flush buffered changes and stop flushing at interpreter exit."""
+        self.flush()
+        atexit.unregister(self.flush)
+
+    @abstractmethod
+    def _flush_pending(self) -> None:
+        """Write the buffered changes to the wrapped repository."""
+
+    def _record_writes(self, count: int) -> None:
+        self._unflushed_writes += count
+        if self._unflushed_writes >= self._max_unflushed_writes:
+            self.flush()
+        elif (
+            self._max_delay_seconds is not None
+            and self._clock() - self._last_flush >= self._max_delay_seconds
+        ):
+            self.flush()
+
+
+class WriteBehindPracticeRepository(_WriteBehindBuffer, PracticeRepository):
+    """Buffer practice writes in memory and group-commit them to `inner`.
+
+    Repeated updates to the same item are coalesced so only the latest state
+    is written. Reads overlay buffered changes on the wrapped repository.
+    """
+
+    def __init__(
+        self,
+        inner: PracticeRepository,
+        *,
+        max_unflushed_writes: int = 100,
+        max_delay_seconds: float | None = 5.0,
+        clock: ClockFn = time.monotonic,
+    ) -> None:
+        self._inner = inner
+        self._pending_items: dict[str, LearningItem] = {}
+        self._pending_attempts: list[Attempt] = []
+        super().__init__(
+            max_unflushed_writes=max_unflushed_writes,
+            max_delay_seconds=max_delay_seconds,
+            clock=clock,
+        )
+
+    def list_items(self) -> list[LearningItem]:
+        items = self._inner.list_items()
+        if not self._pending_items:
+            return items
+        by_id = {item.id: item for item in items}
+        by_id.update(self._pending_items)
+        return list(by_id.values())
+
+    def save_item(self, item: LearningItem) -> None:
+        self.apply_changes([item], [])
+
+    def save_items(self, items: list[LearningItem]) -> None:
+        self.apply_changes(items, [])
+
+    def list_attempts(self) -> list[Attempt]:
+        return [*self._inner.list_attempts(), *self._pending_attempts]
+
+    def iter_attempts(self) -> Iterator[Attempt]:
+        return chain(self._inner.iter_attempts(), list(self._pending_attempts))
+
+    def record_attempt(self, attempt: Attempt) -> None:
+        self.apply_changes([], [attempt])
+
+    def record_attempts(self, attempts: list[Attempt]) -> None:
+        self.apply_changes([], attempts)
+
+    @property
+    def appends_attempts(self) -> bool:
+        return self._inner.appends_attempts
+
+    def apply_changes(self, items: list[LearningItem], attempts: list[Attempt]) -> None:
+        if not items and not attempts:
+            return
+        for item in items:
+            self._pending_items[item.id] = item
+        self._pending_attempts.extend(attempts)
+        self._record_writes(len(items) + len(attempts))
+
+    def replace_contents(
+        self, items: list[LearningItem], attempts: Iterable[Attempt]
+    ) -> None:
+        """Drop buffered writes and replace the wrapped repository's contents."""
+        self._pending_items = {}
+        self._pending_attempts = []
+        self._unflushed_writes = 0
+        self._inner.replace_contents(items, attempts)
+
+    def _flush_pending(self) -> None:
+        self._inner.apply_changes(
+            list(self._pending_items.values()), self._pending_attempts
+        )
+        self._pending_items = {}
+        self._pending_attempts = []
+
+
+class WriteBehindProgressRepository(_WriteBehindBuffer, ProgressRepository):
+    """Buffer progress writes in memory and group-commit them to `inner`.
+
+    Repeated saves or resets for the same user are coalesced to the latest
+    one. Reads see buffered changes before falling back to `inner`.
+    """
+
+    def __init__(
+        self,
+        inner: ProgressRepository,
+        *,
+        max_unflushed_writes: int = 100,
+        max_delay_seconds: float | None = 5.0,
+        clock: ClockFn = time.monotonic,
+    ) -> None:
+        self._inner = inner
+        self._pending: dict[str, LessonProgress | None] = {}
+        super().__init__(
+            max_unflushed_writes=max_unflushed_writes,
+            max_delay_seconds=max_delay_seconds,
+            clock=clock,
+        )
+
+    def get_progress(self, user_id: str) -> LessonProgress:
+        """Return buffered progress for user_id, else the stored progress."""
+        if user_id in self._pending:
+            progress = self._pending[user_id]
+            return copy.deepcopy(progress) if progress is not None else {}
+        return self._inner.get_progress(user_id)
+
+    def save_progress(self, user_id: str, progress: LessonProgress) -> None:
+        """Buffer progress for user_id until the next flush."""
+        self._pending[user_id] = copy.deepcopy(progress)
+        self._record_writes(1)
+
+    def reset_progress(self, user_id: str) -> None:
+        """Buffer a reset for user_id until the next flush."""
+        self._pending[user_id] = None
+        self._record_writes(1)
+
+    def _flush_pending(self) -> None:
+        self._inner.apply_changes(self._pending)
+        self._pending = {}
@@ -12,6 +12,9 @@ from python_learning_orchestrated.adapters.in_memory_progress_repository import
 from python_learning_orchestrated.adapters.json_file_progress_repository import (
     JsonFileProgressRepository,
 )
+from python_learning_orchestrated.adapters.sqlite_progress_repository import (
+    SqliteProgressRepository,
+)
 from python_learning_orchestrated.application.interactive_ui import progress_summary
 from python_learning_orchestrated.application.lesson_runner import LessonRunner
 from python_learning_orchestrated.application.progress_service import ProgressService
@@ -55,8 +58,9 @@ def verify_action(
 def generate_progress_report(base_dir: Path, arguments: dict[str, Any]) -> ActionResult:
     user_id = arguments.get("user_id", "demo-user")
     progress_file = arguments.get("progress_file")
+    progress_db = arguments.get("progress_db")
     output_name = arguments.get("output_name", "progress-report.json")
-    service = _build_progress_service(progress_file)
+    service = _build_progress_service(progress_file, progress_db)
     learning_path = _build_learning_path()
     completed_count, total_count = progress_summary(service, learning_path, user_id)
     payload = {
@@ -80,7 +84,8 @@ def generate_progress_report(base_dir: Path, arguments: dict[str, Any]) -> Actio
 def run_next_lesson(base_dir: Path, arguments: dict[str, Any]) -> ActionResult:
     user_id = arguments.get("user_id", "demo-user")
     progress_file = arguments.get("progress_file")
-    service = _build_progress_service(progress_file)
+    progress_db = arguments.get("progress_db")
+    service = _build_progress_service(progress_file, progress_db)
     learning_path = _build_learning_path()
     runner = LessonRunner(service, learning_path)
     outcome = runner.run_next_lesson(user_id)
@@ -124,10 +129,18 @@ def validate_run_next_lesson(
         progress_path = base_dir / arguments["progress_file"]
         if not progress_path.exists():
             return False, [f"Progress file missing: {progress_path}"]
+    if arguments.get("progress_db"):
+        progress_db_path = base_dir / arguments["progress_db"]
+        if not progress_db_path.exists():
+            return False, [f"Progress database missing: {progress_db_path}"]
     return True, [f"Verified {len(completed_lessons)} completed lessons in progress."]
 
 
-def _build_progress_service(progress_file: str | None) -> ProgressService:
+def _build_progress_service(
+    progress_file: str | None, progress_db: str | None = None
+) -> ProgressService:
+    if progress_db:
+        return ProgressService(SqliteProgressRepository(progress_db))
     if progress_file:
         return ProgressService(JsonFileProgressRepository(progress_file))
     return ProgressService(InMemoryProgressRepository())
@@ -2,20 +2,49 @@
 
 from __future__ import annotations
 
+import time
 from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime
 
+from python_learning_orchestrated.domain.due_queue import DueQueue
 from python_learning_orchestrated.domain.practice import (
     Attempt,
     AttemptOutcome,
     LearningItem,
-    select_next_item,
     update_schedule,
 )
 from python_learning_orchestrated.ports.practice_repository import PracticeRepository
 from python_learning_orchestrated.ports.session_io import SessionIO
 
 NowProvider = Callable[[], datetime]
+ClockFn = Callable[[], float]
+
+
+@dataclass(frozen=True, slots=True)
+class CommitPolicy:
+    """When a practice session commits staged rounds to the repository.
+
+    The default commits after every answered prompt. Scripted high-volume
+    sessions can batch rounds by count and/or elapsed seconds instead. Both
+    thresholds are only checked when a round ends, so `every_seconds` does
+    not commit while the session waits for an answer.
+    """
+
+    every_rounds: int = 1
+    every_seconds: float | None = None
+
+    def __post_init__(self) -> None:
+        if self.every_rounds < 1:
+            raise ValueError("every_rounds must be at least 1")
+        if self.every_seconds is not None and self.every_seconds < 0:
+            raise ValueError("every_seconds must not be negative")
+
+    def is_due(self, pending_rounds: int, elapsed_seconds: float) -> bool:
+        """Return whether pending rounds should be committed now."""
+        if pending_rounds >= self.every_rounds:
+            return True
+        return self.every_seconds is not None and elapsed_seconds >= self.every_seconds
 
 
 class RunPracticeSession:
@@ -26,39 +55,66 @@ class RunPracticeSession:
         repository: PracticeRepository,
         io: SessionIO,
         now_provider: NowProvider,
+        *,
+        commit_policy: CommitPolicy | None = None,
+        clock: ClockFn = time.monotonic,
     ) -> None:
         self._repository = repository
         self._io = io
         self._now_provider = now_provider
+        self._commit_policy = commit_policy or CommitPolicy()
+        self._clock = clock
 
     def run(self) -> None:
-        """Execute practice rounds until user quits or no items are available."""
+        """Execute practice rounds until user quits or no items are available.
+
+        Items are loaded once; the session keeps its own scheduling index in
+        sync with each update and only goes back to the repository for writes.
+        Each round's attempt and item update are staged in a unit of work and
+        committed according to the commit policy, and always before returning.
+        """
         self._io.write_line("Starting practice session.")
+        queue = DueQueue(self._repository.list_items())
+        unit_of_work = self._repository.begin()
+        pending_rounds = 0
+        last_commit = self._clock()
 
-        while True:
-            now = self._now_provider()
-            next_item = select_next_item(self._repository.list_items(), now)
-            if next_item is None:
-                self._io.write_line(
-                    "No due review or new items available. Session complete."
-                )
-                return
+        try:
+            while True:
+                now = self._now_provider()
+                next_item = queue.peek_next(now)
+                if next_item is None:
+                    self._io.write_line(
+                        "No due review or new items available. Session complete."
+                    )
+                    return
 
-            self._io.write_line(f"Activity {next_item.id}: {next_item.prompt}")
-            outcome = self._read_valid_outcome(next_item)
-            if outcome is None:
-                self._io.write_line("Session ended by user.")
-                return
+                self._io.write_line(f"Activity {next_item.id}: {next_item.prompt}")
+                outcome = self._read_valid_outcome(next_item)
+                if outcome is None:
+                    self._io.write_line("Session ended by user.")
+                    return
 
-            self._repository.record_attempt(
-                Attempt(item_id=next_item.id, timestamp=now, outcome=outcome)
-            )
+                unit_of_work.stage_attempt(
+                    Attempt(item_id=next_item.id, timestamp=now, outcome=outcome)
+                )
+
+                updated_item = update_schedule(next_item, outcome, now)
+                if updated_item != next_item:
+                    unit_of_work.stage_item(updated_item)
+                    queue.update(updated_item)
 
-            updated_item = update_schedule(next_item, outcome, now)
-            if updated_item != next_item:
-                self._repository.save_item(updated_item)
+                pending_rounds += 1
+                if self._commit_policy.is_due(
+                    pending_rounds, self._clock() - last_commit
+                ):
+                    unit_of_work.commit()
+                    pending_rounds = 0
+                    last_commit = self._clock()
 
-            self._io.write_line(f"Recorded: {outcome} for {next_item.id}.")
+                self._io.write_line(f"Recorded: {outcome} for {next_item.id}.")
+        finally:
+            unit_of_work.commit()
 
     def _read_valid_outcome(self, item: LearningItem) -> AttemptOutcome | None:
         while True:
@@ -3,33 +3,64 @@
 Stability Contract (frozen):
 - Export returns a `ProgressSnapshot` containing repository items, repository
   attempts, the injected `now_provider()` timestamp, and the configured version.
+- Delta export (`since` and/or `baseline`) returns only attempts recorded at or
+  after the watermark and the items they touched, plus items that differ
+  from the baseline snapshot, with `delta_since` set to the watermark.
+  Importing a delta applies the same additive merge as a full snapshot.
 - Import is additive and deterministic: it merges item progress by id, unions
-  attempts by `(item_id, timestamp)`, writes only missing attempt keys, and
+  attempts by `attempt_order_key`, writes only missing attempt keys, and
   returns a snapshot that preserves the imported `version` and `exported_at`.
 - Running import with the same snapshot repeatedly is idempotent for resulting
   stored items and attempts.
+- `ImportProgress.run_records` applies the same merge to a stream of snapshot
+  records and returns an `ImportSummary` instead of the merged snapshot. It
+  writes new attempts in batches to repositories that append them, and
+  writes the whole import once to repositories that rewrite their storage.
+- `ReplaceProgress` is the non-additive counterpart: repository items and
+  attempts become exactly the given ones, via the repository's
+  `replace_contents`.
 
 Out of scope for this feature version:
 - Snapshot/schema migration, compatibility across versions, or version
   negotiation.
 - Conflict-resolution strategies beyond the existing domain merge semantics.
-- Partial import/export, filtering, deletion, rollback, encryption, signing,
+- Filtering, deletion, rollback, encryption, signing,
   transport/protocol concerns, or cross-repository transaction guarantees.
 """
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 
+from python_learning_orchestrated.domain.attempt_key_index import AttemptKeyIndex
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 from python_learning_orchestrated.domain.practice_progress import (
     ProgressSnapshot,
+    attempt_order_key,
+    merge_item,
     merge_progress,
 )
+from python_learning_orchestrated.domain.timestamps import to_epoch_micros
 from python_learning_orchestrated.ports.practice_repository import PracticeRepository
 
 NowProvider = Callable[[], datetime]
 
+DEFAULT_IMPORT_BATCH_SIZE = 1000
+
+
+@dataclass(frozen=True, slots=True)
+class ImportSummary:
+    """Counts reported by a streaming import."""
+
+    items_read: int
+    attempts_read: int
+    items_changed: int
+    attempts_added: int
+    total_items: int
+    total_attempts: int
+
 
 class ExportProgress:
     """Export repository progress as a domain snapshot."""
@@ -45,20 +76,69 @@ class ExportProgress:
         self._now_provider = now_provider
         self._version = version
 
-    def run(self) -> ProgressSnapshot:
+    def run(
+        self,
+        *,
+        since: datetime | None = None,
+        baseline: ProgressSnapshot | None = None,
+    ) -> ProgressSnapshot:
+        """Export all progress, or a delta when a watermark is given.
+
+        `since` defaults to `baseline.exported_at`. Items cannot tell when
+        they last changed, so a delta includes items with attempts at or
+        after the watermark, plus items that differ from `baseline`. The
+        watermark and attempts compare as epoch microseconds, so naive and
+        aware timestamps can be mixed.
+        """
+        if since is None and baseline is not None:
+            since = baseline.exported_at
+        exported_at = self._now_provider()
+        if since is None:
+            return ProgressSnapshot(
+                version=self._version,
+                exported_at=exported_at,
+                items=self._repository.list_items(),
+                attempts=self._repository.list_attempts(),
+            )
+
+        watermark = to_epoch_micros(since)
+        attempts = [
+            attempt
+            for attempt in self._repository.iter_attempts()
+            if to_epoch_micros(attempt.timestamp) >= watermark
+        ]
+        attempted_ids = {attempt.item_id for attempt in attempts}
+        baseline_items = (
+            {item.id: item for item in baseline.items} if baseline is not None else {}
+        )
+        items = [
+            item
+            for item in self._repository.list_items()
+            if item.id in attempted_ids
+            or (baseline is not None and baseline_items.get(item.id) != item)
+        ]
         return ProgressSnapshot(
             version=self._version,
-            exported_at=self._now_provider(),
-            items=self._repository.list_items(),
-            attempts=self._repository.list_attempts(),
+            exported_at=exported_at,
+            items=items,
+            attempts=attempts,
+            delta_since=since,
         )
 
 
 class ImportProgress:
     """Import and merge a progress snapshot into repository state."""
 
-    def __init__(self, repository: PracticeRepository) -> None:
+    def __init__(
+        self,
+        repository: PracticeRepository,
+        *,
+        batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+    ) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
         self._repository = repository
+        self._batch_size = batch_size
 
     def run(self, snapshot: ProgressSnapshot) -> ProgressSnapshot:
         current_items = self._repository.list_items()
@@ -77,15 +157,14 @@ class ImportProgress:
         if changed_items:
             self._repository.save_items(changed_items)
 
-        existing_attempt_keys = {
-            (attempt.item_id, attempt.timestamp) for attempt in current_attempts
-        }
-        new_attempts = []
-        for attempt in merged_attempts:
-            key = (attempt.item_id, attempt.timestamp)
-            if key not in existing_attempt_keys:
-                new_attempts.append(attempt)
-                existing_attempt_keys.add(key)
+        existing_attempt_keys = AttemptKeyIndex(
+            attempt_order_key(attempt) for attempt in current_attempts
+        )
+        new_attempts = [
+            attempt
+            for attempt in merged_attempts
+            if existing_attempt_keys.add(attempt_order_key(attempt))
+        ]
 
         if new_attempts:
             self._repository.record_attempts(new_attempts)
@@ -96,3 +175,93 @@ class ImportProgress:
             items=merged_items,
             attempts=merged_attempts,
         )
+
+    def run_records(self, records: Iterable[LearningItem | Attempt]) -> ImportSummary:
+        """Merge streamed snapshot records without materializing the snapshot.
+
+        If the repository `appends_attempts`, new attempts are written every
+        `batch_size` records, so memory is bounded by the repository's items
+        and a compact index of its attempt keys rather than by the snapshot
+        size. Other repositories rewrite their whole storage on every write,
+        so new attempts are held and written with the changed items in one
+        `apply_changes`. Changed items are saved once at the end either way.
+        """
+        batch_size = self._batch_size if self._repository.appends_attempts else None
+        items_by_id = {item.id: item for item in self._repository.list_items()}
+        existing_attempt_keys = AttemptKeyIndex(
+            attempt_order_key(attempt) for attempt in self._repository.iter_attempts()
+        )
+        existing_attempt_count = len(existing_attempt_keys)
+        changed_items: dict[str, LearningItem] = {}
+        pending_attempts: list[Attempt] = []
+        items_read = 0
+        attempts_read = 0
+        attempts_added = 0
+
+        for record in records:
+            if isinstance(record, LearningItem):
+                items_read += 1
+                current = items_by_id.get(record.id)
+                merged = merge_item(current, record)
+                if merged != current:
+                    items_by_id[record.id] = merged
+                    changed_items[record.id] = merged
+                continue
+            attempts_read += 1
+            if not existing_attempt_keys.add(attempt_order_key(record)):
+                continue
+            pending_attempts.append(record)
+            if batch_size is not None and len(pending_attempts) >= batch_size:
+                self._repository.record_attempts(pending_attempts)
+                attempts_added += len(pending_attempts)
+                pending_attempts = []
+
+        if batch_size is None:
+            self._repository.apply_changes(
+                list(changed_items.values()), pending_attempts
+            )
+        else:
+            if pending_attempts:
+                self._repository.record_attempts(pending_attempts)
+            if changed_items:
+                self._repository.save_items(list(changed_items.values()))
+        attempts_added += len(pending_attempts)
+
+        return ImportSummary(
+            items_read=items_read,
+            attempts_read=attempts_read,
+            items_changed=len(changed_items),
+            attempts_added=attempts_added,
+            total_items=len(items_by_id),
+            total_attempts=existing_attempt_count + attempts_added,
+        )
+
+
+class ReplaceProgress:
+    """Replace repository progress with the given items and attempts."""
+
+    def __init__(self, repository: PracticeRepository) -> None:
+        self._repository = repository
+
+    def run(
+        self, items: Iterable[LearningItem], attempts: Iterable[Attempt]
+    ) -> ImportSummary:
+        """Swap in `items` and the streamed `attempts` in one repository write."""
+        item_list = list(items)
+        attempt_count = 0
+
+        def counted_attempts() -> Iterator[Attempt]:
+            nonlocal attempt_count
+            for attempt in attempts:
+                attempt_count += 1
+                yield attempt
+
+        self._repository.replace_contents(item_list, counted_attempts())
+        return ImportSummary(
+            items_read=len(item_list),
+            attempts_read=attempt_count,
+            items_changed=len(item_list),
+            attempts_added=attempt_count,
+            total_items=len(item_list),
+            total_attempts=attempt_count,
+        )
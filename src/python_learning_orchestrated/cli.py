@@ -3,11 +3,23 @@
 from __future__ import annotations
 
 import argparse
+import glob
+import json
+import sys
+from collections import Counter
 from collections.abc import Callable
+from dataclasses import replace
 from datetime import datetime
-import json
+from itertools import chain
 from pathlib import Path
 
+from python_learning_orchestrated.adapters.binary_snapshot_store import (
+    BINARY_SNAPSHOT_SUFFIX,
+    BinaryProgressSnapshotStore,
+)
+from python_learning_orchestrated.adapters.checkpoint_retention import (
+    RetentionPolicy,
+)
 from python_learning_orchestrated.adapters.checkpoint_store import CheckpointStore
 from python_learning_orchestrated.adapters.in_memory_practice_repository import (
     InMemoryPracticeRepository,
@@ -23,29 +35,59 @@ from python_learning_orchestrated.adapters.json_file_progress_repository import
 )
 from python_learning_orchestrated.adapters.json_file_progress_snapshot_store import (
     JsonFileProgressSnapshotStore,
+    iter_snapshot_json_records,
+    write_snapshot_json,
+)
+from python_learning_orchestrated.adapters.sharded_json_progress_repository import (
+    ShardedJsonFileProgressRepository,
+    migrate_progress_file_to_shards,
+)
+from python_learning_orchestrated.adapters.snapshot_codec import (
+    EPOCH_TIMESTAMPS_VERSION,
+)
+from python_learning_orchestrated.adapters.snapshot_reduce import (
+    merge_snapshot_files,
+)
+from python_learning_orchestrated.adapters.sqlite_practice_repository import (
+    SqlitePracticeRepository,
+)
+from python_learning_orchestrated.adapters.sqlite_progress_repository import (
+    SqliteProgressRepository,
 )
 from python_learning_orchestrated.adapters.stdio_session_io import StdioSessionIO
+from python_learning_orchestrated.adk.roadmap import load_roadmap
+from python_learning_orchestrated.adk.workflow import LocalWorkflowEngine
 from python_learning_orchestrated.application.interactive_ui import (
     InteractiveLearningUI,
     run_interactive_ui_loop,
 )
 from python_learning_orchestrated.application.lesson_runner import LessonRunner
-from python_learning_orchestrated.application.practice_session import RunPracticeSession
+from python_learning_orchestrated.application.practice_session import (
+    CommitPolicy,
+    RunPracticeSession,
+)
 from python_learning_orchestrated.application.progress_service import ProgressService
 from python_learning_orchestrated.application.progress_transfer import (
     ExportProgress,
     ImportProgress,
+    ReplaceProgress,
 )
-from python_learning_orchestrated.adk.roadmap import load_roadmap
-from python_learning_orchestrated.adk.workflow import LocalWorkflowEngine
 from python_learning_orchestrated.domain.learning_path import LearningPath, Lesson
 from python_learning_orchestrated.domain.practice import LearningItem
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+from python_learning_orchestrated.domain.progress_diff import ItemChange
 from python_learning_orchestrated.ports.practice_repository import PracticeRepository
 from python_learning_orchestrated.ports.progress_repository import ProgressRepository
+from python_learning_orchestrated.ports.progress_snapshot_store import (
+    ProgressSnapshotStore,
+)
 
 InputFn = Callable[[], str]
 OutputFn = Callable[[str], None]
 
+STDIO_PATH = "-"
+_DIFF_MARKERS = {"added": "+", "removed": "-", "changed": "~"}
+
 
 def _build_parser() -> argparse.ArgumentParser:
     """Create CLI argument parser."""
@@ -56,6 +98,27 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Persist user progress in the given JSON file path.",
     )
+    parser.add_argument(
+        "--progress-db",
+        type=str,
+        default=None,
+        help="Persist user progress in the given SQLite database path.",
+    )
+    parser.add_argument(
+        "--progress-dir",
+        type=str,
+        default=None,
+        help="Persist user progress as per-user JSON files in the given directory.",
+    )
+    parser.add_argument(
+        "--shard-count",
+        type=int,
+        default=None,
+        help=(
+            "Hash users into this many shard files under a new --progress-dir; "
+            "an existing directory keeps its saved layout."
+        ),
+    )
     parser.add_argument(
         "command",
         nargs="?",
@@ -65,6 +128,8 @@ def _build_parser() -> argparse.ArgumentParser:
             "session",
             "export-progress",
             "import-progress",
+            "migrate-progress",
+            "upgrade-schema",
             "checkpoint",
             "adk-roadmap",
             "adk-run-next",
@@ -78,14 +143,23 @@ def _build_parser() -> argparse.ArgumentParser:
         "checkpoint_command",
         nargs="?",
         default=None,
-        choices=["create", "list"],
-        help="Checkpoint action: create a named snapshot or list saved snapshots.",
+        choices=["create", "list", "diff", "restore", "prune", "verify"],
+        help=(
+            "Checkpoint action: create a named snapshot, list saved snapshots, "
+            "diff two of them, restore one, prune old ones or verify them."
+        ),
     )
     parser.add_argument(
         "checkpoint_name",
         nargs="?",
         default=None,
-        help="Checkpoint name used by checkpoint create.",
+        help="Checkpoint name used by checkpoint create, diff, restore and verify.",
+    )
+    parser.add_argument(
+        "checkpoint_other",
+        nargs="?",
+        default=None,
+        help="Second checkpoint name used by checkpoint diff and verify.",
     )
     parser.add_argument(
         "--session-file",
@@ -93,18 +167,83 @@ def _build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Persist practice session state in the given JSON file path.",
     )
+    parser.add_argument(
+        "--session-db",
+        type=str,
+        default=None,
+        help="Persist practice session state in the given SQLite database path.",
+    )
+    parser.add_argument(
+        "--attempts-log",
+        type=str,
+        default=None,
+        help="Append practice attempts to this JSONL log instead of --session-file.",
+    )
+    parser.add_argument(
+        "--commit-every",
+        type=int,
+        default=1,
+        help="Commit practice session rounds to storage every N answers.",
+    )
+    parser.add_argument(
+        "--commit-interval",
+        type=float,
+        default=None,
+        help=(
+            "Also commit practice session rounds once this many seconds have "
+            "passed, checked when a round ends."
+        ),
+    )
     parser.add_argument(
         "--out",
         type=str,
         default=None,
-        help="Output file for export-progress snapshot JSON.",
+        help=(
+            "Output file for export-progress snapshot JSON; .gz, .bz2, .xz and "
+            ".lzma are compressed, '-' writes to stdout."
+        ),
+    )
+    parser.add_argument(
+        "--since",
+        type=str,
+        default=None,
+        help="Export only progress recorded at or after an ISO timestamp.",
+    )
+    parser.add_argument(
+        "--since-file",
+        type=str,
+        default=None,
+        help="Export only progress since a previous snapshot file's export time.",
+    )
+    parser.add_argument(
+        "--since-checkpoint",
+        type=str,
+        default=None,
+        help=(
+            "Export only progress since a checkpoint, plus items that differ from it."
+        ),
     )
     parser.add_argument(
         "--in",
-        dest="input_path",
+        dest="input_paths",
+        nargs="+",
+        action="extend",
         type=str,
         default=None,
-        help="Input file for import-progress snapshot JSON.",
+        help=(
+            "Input file for import-progress snapshot JSON; compressed files are "
+            "detected by extension, '-' reads from stdin. import-progress "
+            "accepts several files and glob patterns."
+        ),
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "import-progress: processes loading and merging multiple snapshots "
+            "(default: 1, merge in this process)."
+        ),
     )
     parser.add_argument(
         "--roadmap-file",
@@ -117,11 +256,83 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Emit machine-readable JSON for ADK commands.",
     )
+    parser.add_argument(
+        "--columnar",
+        action="store_true",
+        help="Write JSON snapshots and checkpoints in the columnar layout.",
+    )
+    parser.add_argument(
+        "--restore-mode",
+        choices=["merge", "replace"],
+        default="merge",
+        help=(
+            "checkpoint restore: merge into current progress, or replace it "
+            "with the checkpoint's progress. Replace writes new files before "
+            "renaming any; with --attempts-log the log and session file are "
+            "renamed one after the other, so a crash between the two renames "
+            "leaves the new attempts log beside the old session file."
+        ),
+    )
+    parser.add_argument(
+        "--keep-last",
+        type=int,
+        default=0,
+        help="Retention: keep the newest N checkpoints.",
+    )
+    parser.add_argument(
+        "--keep-daily",
+        type=int,
+        default=0,
+        help="Retention: keep the newest checkpoint of each of the last N days.",
+    )
+    parser.add_argument(
+        "--keep-weekly",
+        type=int,
+        default=0,
+        help="Retention: keep the newest checkpoint of each of the last N weeks.",
+    )
+    parser.add_argument(
+        "--keep-monthly",
+        type=int,
+        default=0,
+        help="Retention: keep the newest checkpoint of each of the last N months.",
+    )
+    parser.add_argument(
+        "--max-total-bytes",
+        type=int,
+        default=None,
+        help="Retention: drop the oldest checkpoints beyond this total size.",
+    )
+    parser.add_argument(
+        "--dry-run",
+        action="store_true",
+        help="checkpoint prune: list the checkpoints that would be deleted.",
+    )
+    parser.add_argument(
+        "--all",
+        dest="all_checkpoints",
+        action="store_true",
+        help="checkpoint verify: verify every saved checkpoint.",
+    )
     return parser
 
 
-def _build_repository(progress_file: str | None) -> ProgressRepository:
+def _build_repository(
+    progress_file: str | None,
+    progress_db: str | None = None,
+    progress_dir: str | None = None,
+    shard_count: int | None = None,
+) -> ProgressRepository:
     """Create repository adapter from CLI options."""
+    if progress_db:
+        return SqliteProgressRepository(progress_db)
+    if progress_dir:
+        try:
+            return ShardedJsonFileProgressRepository(
+                progress_dir, shard_count=shard_count
+            )
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
     if progress_file:
         return JsonFileProgressRepository(progress_file)
     return InMemoryProgressRepository()
@@ -165,13 +376,176 @@ def _build_practice_items() -> list[LearningItem]:
     ]
 
 
-def _build_practice_repository(session_file: str | None) -> PracticeRepository:
+def _build_practice_repository(
+    session_file: str | None,
+    attempts_log: str | None = None,
+    session_db: str | None = None,
+) -> PracticeRepository:
     seed_items = _build_practice_items()
+    if session_db:
+        return SqlitePracticeRepository(session_db, seed_items)
     if session_file:
-        return JsonFilePracticeRepository(session_file, seed_items)
+        return JsonFilePracticeRepository(
+            session_file, seed_items, attempts_log=attempts_log
+        )
     return InMemoryPracticeRepository(seed_items)
 
 
+def _build_snapshot_store(
+    file_path: str, *, columnar: bool = False
+) -> ProgressSnapshotStore:
+    if Path(file_path).suffix == BINARY_SNAPSHOT_SUFFIX:
+        return BinaryProgressSnapshotStore(file_path)
+    return JsonFileProgressSnapshotStore(file_path, columnar=columnar)
+
+
+def _load_snapshot(file_path: str) -> ProgressSnapshot:
+    """Load a snapshot file; module-level so worker processes can run it.
+
+    JSON snapshots are decoded while streaming, so like a single-file import
+    they are not limited to the size `load()` accepts.
+    """
+    store = _build_snapshot_store(file_path)
+    if isinstance(store, JsonFileProgressSnapshotStore):
+        return store.load_streamed()
+    return store.load()
+
+
+def _expand_input_paths(input_paths: list[str] | None) -> list[str]:
+    """Expand --in glob patterns, keeping the given order of arguments."""
+    expanded: list[str] = []
+    for input_path in input_paths or []:
+        if not any(char in input_path for char in "*?["):
+            expanded.append(input_path)
+            continue
+        matches = sorted(glob.glob(input_path))
+        if not matches:
+            raise SystemExit(f"--in {input_path!r} matched no files")
+        expanded.extend(matches)
+    if STDIO_PATH in expanded and len(expanded) > 1:
+        raise SystemExit("--in - cannot be combined with other input files")
+    return expanded
+
+
+def _single_input_path(input_paths: list[str] | None, command: str) -> str | None:
+    if input_paths and len(input_paths) > 1:
+        raise SystemExit(f"{command} accepts a single --in <file>")
+    if input_paths and input_paths[0] == STDIO_PATH:
+        raise SystemExit(f"{command} cannot read --in -")
+    return input_paths[0] if input_paths else None
+
+
+def _retention_policy(args: argparse.Namespace) -> RetentionPolicy | None:
+    """Build the checkpoint retention policy from CLI flags, if any are set."""
+    try:
+        policy = RetentionPolicy(
+            keep_last=args.keep_last,
+            keep_daily=args.keep_daily,
+            keep_weekly=args.keep_weekly,
+            keep_monthly=args.keep_monthly,
+            max_total_bytes=args.max_total_bytes,
+        )
+    except ValueError as exc:
+        raise SystemExit(str(exc)) from exc
+    return None if policy.keeps_everything else policy
+
+
+def _print_checkpoint_diff(
+    checkpoint_store: CheckpointStore,
+    before: str | None,
+    after: str | None,
+    output_fn: OutputFn,
+) -> None:
+    """Print change counts and changed item ids between two checkpoints."""
+    if not before or not after:
+        raise SystemExit("checkpoint diff requires <name> <other-name>")
+    for name in (before, after):
+        if not checkpoint_store.has_checkpoint(name):
+            raise SystemExit(f"checkpoint '{name}' not found")
+    counts: Counter[tuple[str, str]] = Counter()
+    item_lines: list[str] = []
+    for change in checkpoint_store.diff_checkpoints(before, after):
+        if isinstance(change, ItemChange):
+            counts["items", change.kind] += 1
+            item = change.after or change.before
+            if item is not None:
+                item_lines.append(f"{_DIFF_MARKERS[change.kind]} {item.id}")
+        else:
+            counts["attempts", change.kind] += 1
+    output_fn(f"Diff '{before}' -> '{after}':")
+    for section in ("items", "attempts"):
+        output_fn(
+            f"{section.capitalize()}: {counts[section, 'added']} added, "
+            f"{counts[section, 'removed']} removed, "
+            f"{counts[section, 'changed']} changed"
+        )
+    for line in item_lines:
+        output_fn(line)
+
+
+def _verify_checkpoints(
+    checkpoint_store: CheckpointStore,
+    names: list[str],
+    verify_all: bool,
+    output_fn: Callable[[str], None],
+) -> None:
+    """Verify the named checkpoints (or all of them) and report each one."""
+    if verify_all == bool(names):
+        raise SystemExit("checkpoint verify requires <name> or --all")
+    statuses = checkpoint_store.verify_checkpoints(None if verify_all else names)
+    if not statuses:
+        output_fn("No checkpoints found.")
+        return
+    for status in statuses:
+        if status.ok:
+            output_fn(
+                f"OK   {status.name}: {status.item_count} items, "
+                f"{status.attempt_count} attempts, "
+                f"sha256 {(status.content_hash or '')[:12]}"
+            )
+        else:
+            output_fn(f"FAIL {status.name}: {status.error}")
+    failed = sum(1 for status in statuses if not status.ok)
+    if failed:
+        raise SystemExit(f"{failed} of {len(statuses)} checkpoints failed verification")
+    output_fn(f"Verified {len(statuses)} checkpoints.")
+
+
+def _resolve_watermark(
+    args: argparse.Namespace,
+) -> tuple[datetime | None, ProgressSnapshot | None]:
+    """Resolve --since, --since-file or --since-checkpoint to a watermark."""
+    given = [
+        flag
+        for flag, value in (
+            ("--since", args.since),
+            ("--since-file", args.since_file),
+            ("--since-checkpoint", args.since_checkpoint),
+        )
+        if value is not None
+    ]
+    if len(given) > 1:
+        raise SystemExit(f"{' and '.join(given)} cannot be combined")
+    if args.since is not None:
+        try:
+            return datetime.fromisoformat(args.since), None
+        except ValueError as exc:
+            raise SystemExit(f"--since {args.since!r} is not an ISO timestamp") from exc
+    if args.since_file is not None:
+        if not Path(args.since_file).is_file():
+            raise SystemExit(f"--since-file {args.since_file!r} does not exist")
+        try:
+            return _build_snapshot_store(args.since_file).read_exported_at(), None
+        except (OSError, EOFError, ValueError) as exc:
+            raise SystemExit(f"--since-file {args.since_file!r}: {exc}") from exc
+    if args.since_checkpoint is not None:
+        checkpoint_store = CheckpointStore(columnar=args.columnar)
+        if not checkpoint_store.has_checkpoint(args.since_checkpoint):
+            raise SystemExit(f"checkpoint '{args.since_checkpoint}' not found")
+        return None, checkpoint_store.load_checkpoint(args.since_checkpoint).progress
+    return None, None
+
+
 def main(
     argv: list[str] | None = None,
     *,
@@ -180,12 +554,36 @@ def main(
 ) -> None:
     """Run the text-based interactive learning loop."""
     args = _build_parser().parse_args(argv)
+    if args.attempts_log and not args.session_file:
+        raise SystemExit("--attempts-log requires --session-file <file>")
+    if args.shard_count is not None and args.shard_count < 1:
+        raise SystemExit("--shard-count must be at least 1")
+    if args.command != "migrate-progress" and (
+        sum(map(bool, [args.progress_file, args.progress_db, args.progress_dir])) > 1
+    ):
+        raise SystemExit(
+            "use only one of --progress-file, --progress-db or --progress-dir"
+        )
+    if args.session_db and args.session_file:
+        raise SystemExit("use either --session-file or --session-db, not both")
 
     if args.command == "session":
-        repository = _build_practice_repository(args.session_file)
+        repository = _build_practice_repository(
+            args.session_file, args.attempts_log, args.session_db
+        )
         io = StdioSessionIO(input_fn=input_fn, output_fn=output_fn)
+        if args.commit_every < 1:
+            raise SystemExit("session requires --commit-every >= 1")
+        if args.commit_interval is not None and args.commit_interval < 0:
+            raise SystemExit("session requires --commit-interval >= 0")
+        commit_policy = CommitPolicy(
+            every_rounds=args.commit_every, every_seconds=args.commit_interval
+        )
         session = RunPracticeSession(
-            repository=repository, io=io, now_provider=datetime.now
+            repository=repository,
+            io=io,
+            now_provider=datetime.now,
+            commit_policy=commit_policy,
         )
         session.run()
         return
@@ -193,30 +591,124 @@ def main(
     if args.command == "export-progress":
         if not args.out:
             raise SystemExit("export-progress requires --out <file>")
-        repository = _build_practice_repository(args.session_file)
-        snapshot = ExportProgress(
-            repository=repository, now_provider=datetime.now
-        ).run()
-        JsonFileProgressSnapshotStore(args.out).save(snapshot)
+        repository = _build_practice_repository(
+            args.session_file, args.attempts_log, args.session_db
+        )
+        since, baseline = _resolve_watermark(args)
+        snapshot = ExportProgress(repository=repository, now_provider=datetime.now).run(
+            since=since, baseline=baseline
+        )
+        if args.out == STDIO_PATH:
+            # stdout carries the snapshot, so no status line is printed.
+            write_snapshot_json(snapshot, sys.stdout, columnar=args.columnar)
+            return
+        try:
+            _build_snapshot_store(args.out, columnar=args.columnar).save(snapshot)
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+        if snapshot.delta_since is not None:
+            output_fn(
+                "Exported progress delta since "
+                f"{snapshot.delta_since.isoformat()} to {args.out} "
+                f"({len(snapshot.items)} items, {len(snapshot.attempts)} attempts)."
+            )
+            return
         output_fn(f"Exported progress snapshot to {args.out}.")
         return
 
     if args.command == "import-progress":
-        if not args.input_path:
+        input_paths = _expand_input_paths(args.input_paths)
+        if not input_paths:
             raise SystemExit("import-progress requires --in <file>")
-        repository = _build_practice_repository(args.session_file)
-        snapshot = JsonFileProgressSnapshotStore(args.input_path).load()
-        merged = ImportProgress(repository=repository).run(snapshot)
+        if args.workers < 1:
+            raise SystemExit("--workers must be at least 1")
+        repository = _build_practice_repository(
+            args.session_file, args.attempts_log, args.session_db
+        )
+        if len(input_paths) > 1:
+            try:
+                merged = merge_snapshot_files(
+                    input_paths, _load_snapshot, max_workers=args.workers
+                )
+            except ValueError as exc:
+                raise SystemExit(str(exc)) from exc
+            summary = ImportProgress(repository=repository).run_records(
+                chain(merged.items, merged.attempts)
+            )
+            output_fn(
+                f"Imported {len(input_paths)} progress snapshots "
+                f"({summary.total_items} items, {summary.total_attempts} attempts)."
+            )
+            return
+        [input_path] = input_paths
+        records = (
+            iter_snapshot_json_records(sys.stdin)
+            if input_path == STDIO_PATH
+            else _build_snapshot_store(input_path).iter_records()
+        )
+        summary = ImportProgress(repository=repository).run_records(records)
         output_fn(
             "Imported progress snapshot from "
-            f"{args.input_path} ({len(merged.items)} items, "
-            f"{len(merged.attempts)} attempts)."
+            f"{input_path} ({summary.total_items} items, "
+            f"{summary.total_attempts} attempts)."
         )
         return
 
+    if args.command == "migrate-progress":
+        if not args.progress_file or not args.progress_dir:
+            raise SystemExit(
+                "migrate-progress requires --progress-file <file> "
+                "and --progress-dir <dir>"
+            )
+        try:
+            migrated_users = migrate_progress_file_to_shards(
+                args.progress_file, args.progress_dir, shard_count=args.shard_count
+            )
+        except ValueError as exc:
+            raise SystemExit(str(exc)) from exc
+        output_fn(
+            f"Migrated progress for {migrated_users} users from "
+            f"{args.progress_file} to {args.progress_dir}."
+        )
+        return
+
+    if args.command == "upgrade-schema":
+        snapshot_path = _single_input_path(args.input_paths, "upgrade-schema")
+        if snapshot_path:
+            target = args.out or snapshot_path
+            try:
+                snapshot = _build_snapshot_store(snapshot_path).load()
+                _build_snapshot_store(target, columnar=args.columnar).save(
+                    replace(
+                        snapshot,
+                        version=max(snapshot.version, EPOCH_TIMESTAMPS_VERSION),
+                    )
+                )
+            except ValueError as exc:
+                raise SystemExit(str(exc)) from exc
+        elif args.session_file:
+            JsonFilePracticeRepository(
+                args.session_file,
+                _build_practice_items(),
+                attempts_log=args.attempts_log,
+            ).upgrade_schema()
+            target = args.session_file
+        else:
+            raise SystemExit(
+                "upgrade-schema requires --in <file> or --session-file <file>"
+            )
+        output_fn(f"Upgraded {target} to schema version {EPOCH_TIMESTAMPS_VERSION}.")
+        return
+
     if args.command == "checkpoint":
-        repository = _build_practice_repository(args.session_file)
-        checkpoint_store = CheckpointStore()
+        repository = _build_practice_repository(
+            args.session_file, args.attempts_log, args.session_db
+        )
+        retention = _retention_policy(args)
+        checkpoint_store = CheckpointStore(
+            columnar=args.columnar,
+            retention=retention if args.checkpoint_command == "create" else None,
+        )
 
         if args.checkpoint_command == "create":
             if not args.checkpoint_name:
@@ -248,8 +740,65 @@ def main(
                 output_fn(f"- {checkpoint.name} ({created_at_label})")
             return
 
+        if args.checkpoint_command == "diff":
+            _print_checkpoint_diff(
+                checkpoint_store,
+                args.checkpoint_name,
+                args.checkpoint_other,
+                output_fn,
+            )
+            return
+
+        if args.checkpoint_command == "restore":
+            name = args.checkpoint_name
+            if not name:
+                raise SystemExit("checkpoint restore requires <name>")
+            if not checkpoint_store.has_checkpoint(name):
+                raise SystemExit(f"checkpoint '{name}' not found")
+            items = checkpoint_store.iter_checkpoint_items(name)
+            attempts = checkpoint_store.iter_checkpoint_attempts(name)
+            if args.restore_mode == "replace":
+                summary = ReplaceProgress(repository).run(items, attempts)
+            else:
+                summary = ImportProgress(repository=repository).run_records(
+                    chain(items, attempts)
+                )
+            output_fn(
+                f"Restored checkpoint '{name}' ({args.restore_mode}; "
+                f"{summary.total_items} items, {summary.total_attempts} attempts)."
+            )
+            return
+
+        if args.checkpoint_command == "prune":
+            if retention is None:
+                raise SystemExit(
+                    "checkpoint prune requires --keep-last, --keep-daily, "
+                    "--keep-weekly, --keep-monthly or --max-total-bytes"
+                )
+            pruned = checkpoint_store.prune(retention, dry_run=args.dry_run)
+            verb = "Would prune" if args.dry_run else "Pruned"
+            output_fn(f"{verb} {len(pruned)} checkpoints.")
+            for entry in pruned:
+                created_at_label = entry.created_at.strftime("%Y-%m-%d %H:%M")
+                output_fn(f"- {entry.name} ({created_at_label})")
+            return
+
+        if args.checkpoint_command == "verify":
+            _verify_checkpoints(
+                checkpoint_store,
+                [
+                    name
+                    for name in (args.checkpoint_name, args.checkpoint_other)
+                    if name
+                ],
+                args.all_checkpoints,
+                output_fn,
+            )
+            return
+
         raise SystemExit(
-            "checkpoint requires 'create' or 'list' (e.g. checkpoint list)"
+            "checkpoint requires 'create', 'list', 'diff', 'restore', 'prune' or "
+            "'verify' (e.g. checkpoint list)"
         )
 
     if args.command == "adk-roadmap":
@@ -277,7 +826,9 @@ def main(
         return
 
     user_id = "demo-user"
-    progress_repository = _build_repository(args.progress_file)
+    progress_repository = _build_repository(
+        args.progress_file, args.progress_db, args.progress_dir, args.shard_count
+    )
     service = ProgressService(progress_repository)
     learning_path = _build_learning_path()
     runner = LessonRunner(service, learning_path)
@@ -0,0 +1,130 @@
+"""Compact set of attempt keys used to deduplicate imports."""
+
+from __future__ import annotations
+
+import heapq
+from array import array
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from itertools import pairwise
+
+AttemptKey = tuple[int, str]
+
+_SLOT_BITS = 24
+_SLOT_MASK = (1 << _SLOT_BITS) - 1
+_RUN_SIZE = 65_536
+_MIN_PENDING = 65_536
+
+
+class AttemptKeyIndex:
+    """Set of `attempt_order_key` keys in about 8 bytes per key.
+
+    Keys are `(epoch_micros, item_id)` tuples, the key merges deduplicate
+    attempts by. Item ids are interned to small slot numbers, and each slot
+    keeps the epoch microseconds of its keys in a sorted `array`. Keys added
+    later go to a small pending set that is folded into the arrays as it
+    grows. Membership matches a set of the key tuples.
+    """
+
+    def __init__(self, keys: Iterable[AttemptKey] = ()) -> None:
+        self._slots: dict[str, int] = {}
+        self._columns: list[array[int]] = []
+        self._pending: set[int] = set()
+        for key in keys:
+            packed = self._pack(key)
+            self._columns[packed & _SLOT_MASK].append(packed >> _SLOT_BITS)
+        self._columns = [_sorted_unique(column) for column in self._columns]
+        self._size = sum(len(column) for column in self._columns)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, tuple) or len(key) != 2:
+            return False
+        micros, item_id = key
+        if type(micros) is not int or not isinstance(item_id, str):
+            return False
+        slot = self._slots.get(item_id)
+        if slot is None:
+            return False
+        return self._contains_packed((micros << _SLOT_BITS) | slot)
+
+    def add(self, key: AttemptKey) -> bool:
+        """Add `key` and return whether it was not already present."""
+        packed = self._pack(key)
+        if self._contains_packed(packed):
+            return False
+        self._pending.add(packed)
+        self._size += 1
+        if len(self._pending) >= max(_MIN_PENDING, self._size // 16):
+            self._fold_pending()
+        return True
+
+    def _pack(self, key: AttemptKey) -> int:
+        """Return `key` as epoch microseconds shifted over its item slot."""
+        micros, item_id = key
+        slot = self._slots.get(item_id)
+        if slot is None:
+            slot = len(self._columns)
+            if slot > _SLOT_MASK:
+                raise ValueError("too many distinct item ids in attempt key index")
+            self._slots[item_id] = slot
+            self._columns.append(array("q"))
+        return (micros << _SLOT_BITS) | slot
+
+    def _contains_packed(self, packed: int) -> bool:
+        if packed in self._pending:
+            return True
+        column = self._columns[packed & _SLOT_MASK]
+        micros = packed >> _SLOT_BITS
+        position = bisect_left(column, micros)
+        return position < len(column) and column[position] == micros
+
+    def _fold_pending(self) -> None:
+        """Merge pending keys into the sorted per-slot arrays."""
+        added: defaultdict[int, array[int]] = defaultdict(lambda: array("q"))
+        for packed in self._pending:
+            added[packed & _SLOT_MASK].append(packed >> _SLOT_BITS)
+        self._pending.clear()
+        for slot, values in added.items():
+            self._columns[slot] = _merge_sorted(
+                self._columns[slot], _sorted_unique(values)
+            )
+
+
+def _sorted_unique(values: array[int]) -> array[int]:
+    """Sort and deduplicate `values` holding one short run in a list at a time."""
+    runs = [
+        array("q", sorted(set(values[start : start + _RUN_SIZE])))
+        for start in range(0, len(values), _RUN_SIZE)
+    ]
+    if all(previous[-1] < run[0] for previous, run in pairwise(runs)):
+        merged = array("q")
+        for run in runs:
+            merged.extend(run)
+        return merged
+    return array("q", _unique(heapq.merge(*runs)))
+
+
+def _merge_sorted(first: array[int], second: array[int]) -> array[int]:
+    """Merge two sorted duplicate-free arrays into one."""
+    if not first or not second:
+        return first or second
+    if first[-1] < second[0]:
+        first.extend(second)
+        return first
+    if second[-1] < first[0]:
+        second.extend(first)
+        return second
+    return array("q", _unique(heapq.merge(first, second)))
+
+
+def _unique(values: Iterable[int]) -> Iterator[int]:
+    """Drop repeats from sorted `values`."""
+    previous: int | None = None
+    for value in values:
+        if value != previous:
+            yield value
+            previous = value
@@ -0,0 +1,141 @@
+"""Heap-backed scheduling index for practice item selection."""
+
+from __future__ import annotations
+
+import heapq
+from collections.abc import Iterable
+from datetime import datetime
+
+from python_learning_orchestrated.domain.practice import LearningItem
+
+_COMPACT_MIN_HEAP_SIZE = 64
+
+
+class DueQueue:
+    """Index learning items so the next practice item is found in O(log N).
+
+    Selection follows `select_next_item`: the earliest due review item by
+    `(due_at, id)`, otherwise the first new item by `(order, id)`. Replaced and
+    removed items leave stale heap entries that are discarded lazily.
+    """
+
+    def __init__(self, items: Iterable[LearningItem] = ()) -> None:
+        self._items: dict[str, LearningItem] = {item.id: item for item in items}
+        self._reviews: list[tuple[datetime, str]] = []
+        self._new: list[tuple[int, str]] = []
+        self._rebuild()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, item_id: object) -> bool:
+        return item_id in self._items
+
+    def get(self, item_id: str) -> LearningItem | None:
+        """Return the indexed item with the given id, if present."""
+        return self._items.get(item_id)
+
+    def items(self) -> list[LearningItem]:
+        """Return all indexed items."""
+        return list(self._items.values())
+
+    def push(self, item: LearningItem) -> None:
+        """Insert an item or replace the indexed item with the same id."""
+        previous = self._items.get(item.id)
+        self._items[item.id] = item
+        if previous is not None and _same_keys(previous, item):
+            return
+        self._push_entry(item)
+        self._maybe_compact()
+
+    def update(self, item: LearningItem) -> None:
+        """Replace an already indexed item after its schedule changed."""
+        if item.id not in self._items:
+            raise KeyError(item.id)
+        self.push(item)
+
+    def remove(self, item_id: str) -> LearningItem | None:
+        """Drop an item from the index and return it, if present."""
+        removed = self._items.pop(item_id, None)
+        if removed is not None:
+            self._maybe_compact()
+        return removed
+
+    def peek_next(self, now: datetime) -> LearningItem | None:
+        """Return the next item to practice without removing it."""
+        self._discard_stale_reviews()
+        if self._reviews and self._reviews[0][0] <= now:
+            return self._items[self._reviews[0][1]]
+
+        self._discard_stale_new()
+        if self._new:
+            return self._items[self._new[0][1]]
+
+        return None
+
+    def pop_next(self, now: datetime) -> LearningItem | None:
+        """Remove and return the next item to practice."""
+        selected = self.peek_next(now)
+        if selected is not None:
+            self.remove(selected.id)
+        return selected
+
+    def _push_entry(self, item: LearningItem) -> None:
+        if item.status == "review":
+            if item.due_at is not None:
+                heapq.heappush(self._reviews, (item.due_at, item.id))
+        elif item.status == "new":
+            heapq.heappush(self._new, (item.order, item.id))
+
+    def _discard_stale_reviews(self) -> None:
+        heap = self._reviews
+        while heap:
+            due_at, item_id = heap[0]
+            current = self._items.get(item_id)
+            if (
+                current is not None
+                and current.status == "review"
+                and current.due_at == due_at
+            ):
+                return
+            heapq.heappop(heap)
+
+    def _discard_stale_new(self) -> None:
+        heap = self._new
+        while heap:
+            order, item_id = heap[0]
+            current = self._items.get(item_id)
+            if (
+                current is not None
+                and current.status == "new"
+                and current.order == order
+            ):
+                return
+            heapq.heappop(heap)
+
+    def _maybe_compact(self) -> None:
+        heap_size = len(self._reviews) + len(self._new)
+        if heap_size > _COMPACT_MIN_HEAP_SIZE and heap_size > 2 * len(self._items):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        self._reviews = [
+            (item.due_at, item.id)
+            for item in self._items.values()
+            if item.status == "review" and item.due_at is not None
+        ]
+        self._new = [
+            (item.order, item.id)
+            for item in self._items.values()
+            if item.status == "new"
+        ]
+        heapq.heapify(self._reviews)
+        heapq.heapify(self._new)
+
+
+def _same_keys(first: LearningItem, second: LearningItem) -> bool:
+    return (
+        first.status == second.status
+        and first.due_at == second.due_at
+        and first.order == second.order
+    )
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import heapq
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, replace
 from datetime import datetime
 
 from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.timestamps import to_epoch_micros
 
 
 @dataclass(frozen=True, slots=True)
 class ProgressSnapshot:
-    """Serializable progress state for learning items and attempts."""
+    """Serializable progress state for learning items and attempts.
+
+    A delta snapshot sets `delta_since` to its watermark and only holds the
+    items and attempts that changed since then.
+    """
 
     version: int
     exported_at: datetime
     items: list[LearningItem]
     attempts: list[Attempt]
+    delta_since: datetime | None = None
 
 
 def merge_progress(
@@ -29,17 +37,99 @@ def merge_progress(
     return merged_items, merged_attempts
 
 
+def canonical_snapshot(snapshot: ProgressSnapshot) -> ProgressSnapshot:
+    """Return `snapshot` in canonical order with duplicates resolved.
+
+    Repeated items are merged and the first of repeated attempts is kept, as
+    an import of the snapshot would.
+    """
+    first_attempts: dict[tuple[int, str], Attempt] = {}
+    for attempt in snapshot.attempts:
+        first_attempts.setdefault(attempt_order_key(attempt), attempt)
+    return replace(
+        snapshot,
+        items=_merge_items([], snapshot.items),
+        attempts=sorted(first_attempts.values(), key=attempt_order_key),
+        delta_since=None,
+    )
+
+
+def combine_snapshots(
+    first: ProgressSnapshot, second: ProgressSnapshot
+) -> ProgressSnapshot:
+    """Combine two canonical snapshots as if importing `first`, then `second`.
+
+    Items are merged with `merge_item`, keeping `first`'s item on ties, and an
+    attempt key present in both keeps `first`'s attempt, since an import
+    never overwrites stored attempts. Combining is associative, so files can
+    be combined in any grouping as long as their order is kept. Naive and
+    offset-aware timestamps are compared with `to_epoch_micros`.
+    """
+    return ProgressSnapshot(
+        version=max(first.version, second.version),
+        exported_at=max(first.exported_at, second.exported_at, key=to_epoch_micros),
+        items=_merge_items(first.items, second.items),
+        attempts=list(iter_merged_attempts(second.attempts, first.attempts)),
+    )
+
+
+def iter_merged_attempts(
+    current_attempts: Iterable[Attempt], imported_attempts: Iterable[Attempt]
+) -> Iterator[Attempt]:
+    """Lazily merge two attempt streams sorted by `attempt_order_key`.
+
+    Yields what `merge_progress` returns for the attempts, in one pass holding
+    only the current run of equal keys. Raises `ValueError` on unsorted input.
+    Only `combine_snapshots` uses it: there is no item counterpart, and
+    repository imports deduplicate against an `AttemptKeyIndex` instead.
+    """
+    merged: Attempt | None = None
+    for attempt in heapq.merge(
+        _checked_sorted(current_attempts),
+        _checked_sorted(imported_attempts),
+        key=attempt_order_key,
+    ):
+        if merged is not None and attempt_order_key(merged) != attempt_order_key(
+            attempt
+        ):
+            yield merged
+        merged = attempt
+    if merged is not None:
+        yield merged
+
+
+def item_order_key(item: LearningItem) -> tuple[int, str]:
+    """Return the key merged items are ordered by."""
+    return (item.order, item.id)
+
+
+def attempt_order_key(attempt: Attempt) -> tuple[int, str]:
+    """Return the key attempts are ordered and deduplicated by.
+
+    Merges, canonical snapshots, diffs and the import's `AttemptKeyIndex` all
+    use this key. It compares timestamps as instants (naive ones read as UTC),
+    so naive and offset-aware timestamps can be mixed.
+    """
+    return (to_epoch_micros(attempt.timestamp), attempt.item_id)
+
+
+def merge_item(existing: LearningItem | None, imported: LearningItem) -> LearningItem:
+    """Return the merged state of one item, as `merge_progress` would keep it."""
+    if existing is None:
+        return imported
+    return _pick_more_progressed(existing, imported)
+
+
 def _merge_items(
     current_items: list[LearningItem], imported_items: list[LearningItem]
 ) -> list[LearningItem]:
+    # Items are ordered by (order, id) but deduplicated by id, and an item's
+    # order can differ between the two sides, so they cannot be merged as
+    # sorted streams the way attempts are.
     by_id = {item.id: item for item in current_items}
     for imported_item in imported_items:
-        existing = by_id.get(imported_item.id)
-        if existing is None:
-            by_id[imported_item.id] = imported_item
-            continue
-        by_id[imported_item.id] = _pick_more_progressed(existing, imported_item)
-    return sorted(by_id.values(), key=lambda item: (item.order, item.id))
+        by_id[imported_item.id] = merge_item(by_id.get(imported_item.id), imported_item)
+    return sorted(by_id.values(), key=item_order_key)
 
 
 def _pick_more_progressed(first: LearningItem, second: LearningItem) -> LearningItem:
@@ -67,11 +157,19 @@ def _item_progress_score(item: LearningItem) -> tuple[int, int, int, float]:
 def _merge_attempts(
     current_attempts: list[Attempt], imported_attempts: list[Attempt]
 ) -> list[Attempt]:
-    deduped: dict[tuple[str, datetime], Attempt] = {
-        (attempt.item_id, attempt.timestamp): attempt for attempt in current_attempts
+    deduped: dict[tuple[int, str], Attempt] = {
+        attempt_order_key(attempt): attempt for attempt in current_attempts
     }
     for attempt in imported_attempts:
-        deduped[(attempt.item_id, attempt.timestamp)] = attempt
-    return sorted(
-        deduped.values(), key=lambda attempt: (attempt.timestamp, attempt.item_id)
-    )
+        deduped[attempt_order_key(attempt)] = attempt
+    return sorted(deduped.values(), key=attempt_order_key)
+
+
+def _checked_sorted(attempts: Iterable[Attempt]) -> Iterator[Attempt]:
+    previous: tuple[int, str] | None = None
+    for attempt in attempts:
+        key = attempt_order_key(attempt)
+        if previous is not None and key < previous:
+            raise ValueError(f"merge input is not sorted: {key} after {previous}")
+        previous = key
+        yield attempt
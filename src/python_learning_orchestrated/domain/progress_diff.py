@@ -0,0 +1,99 @@
+"""Streaming comparison of two progress states."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator
+from dataclasses import dataclass
+from typing import Literal
+
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.practice_progress import attempt_order_key
+
+ChangeKind = Literal["added", "removed", "changed"]
+AttemptKey = tuple[int, str]
+
+
+@dataclass(frozen=True, slots=True)
+class ItemChange:
+    """An item present in only one state, or different between the two."""
+
+    kind: ChangeKind
+    before: LearningItem | None
+    after: LearningItem | None
+
+
+@dataclass(frozen=True, slots=True)
+class AttemptChange:
+    """An attempt present in only one state, or with a different outcome."""
+
+    kind: ChangeKind
+    before: Attempt | None
+    after: Attempt | None
+
+
+def item_sort_key(item: LearningItem) -> str:
+    """Return the key `diff_items` expects its inputs to be sorted by."""
+    return item.id
+
+
+def attempt_sort_key(attempt: Attempt) -> AttemptKey:
+    """Return the key `diff_attempts` expects its inputs to be sorted by."""
+    return attempt_order_key(attempt)
+
+
+def diff_items(
+    before: Iterable[LearningItem], after: Iterable[LearningItem]
+) -> Iterator[ItemChange]:
+    """Yield item changes between two streams sorted by `item_sort_key`."""
+    for old, new in _merge_join(before, after, item_sort_key):
+        yield ItemChange(_change_kind(old, new), old, new)
+
+
+def diff_attempts(
+    before: Iterable[Attempt], after: Iterable[Attempt]
+) -> Iterator[AttemptChange]:
+    """Yield attempt changes between two streams sorted by `attempt_sort_key`."""
+    for old, new in _merge_join(before, after, attempt_sort_key):
+        yield AttemptChange(_change_kind(old, new), old, new)
+
+
+def _merge_join[T, K: (str, AttemptKey)](
+    before: Iterable[T], after: Iterable[T], key: Callable[[T], K]
+) -> Iterator[tuple[T | None, T | None]]:
+    """Walk two sorted streams once, yielding pairs that are not equal.
+
+    Only the current head of each stream is held in memory. Entries with equal
+    keys are paired in order.
+    """
+    old_entries = iter(before)
+    new_entries = iter(after)
+    old = next(old_entries, None)
+    new = next(new_entries, None)
+    while old is not None and new is not None:
+        old_key = key(old)
+        new_key = key(new)
+        if old_key < new_key:
+            yield old, None
+            old = next(old_entries, None)
+        elif new_key < old_key:
+            yield None, new
+            new = next(new_entries, None)
+        else:
+            if old != new:
+                yield old, new
+            old = next(old_entries, None)
+            new = next(new_entries, None)
+    while old is not None:
+        yield old, None
+        old = next(old_entries, None)
+    while new is not None:
+        yield None, new
+        new = next(new_entries, None)
+
+
+def _change_kind(before: object | None, after: object | None) -> ChangeKind:
+    if before is None:
+        return "added"
+    if after is None:
+        return "removed"
+    return "changed"
@@ -0,0 +1,56 @@
+"""Epoch-microsecond timestamp convention for stored and compared progress.
+
+Timestamps are integer microseconds since 1970-01-01T00:00:00 UTC. Naive
+datetimes, which the application uses throughout, are read as UTC wall time;
+aware datetimes are converted to UTC. Sorting and lookup structures
+(`practice_progress`, `progress_diff`, `attempt_key_index`) key attempts by
+these integers, and schema version 2 snapshots and session files store them,
+together with the UTC offset in minutes of aware values so offsets survive a
+round trip.
+"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, timezone
+
+_EPOCH = datetime(1970, 1, 1)
+_AWARE_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+_MINUTE = timedelta(minutes=1)
+
+
+def to_epoch_micros(value: datetime) -> int:
+    """Return `value` as integer microseconds since the Unix epoch."""
+    if value.tzinfo is not None:
+        value = value.astimezone(UTC).replace(tzinfo=None)
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def utc_offset_minutes(value: datetime) -> int | None:
+    """Return the UTC offset of `value` in whole minutes.
+
+    Returns `None` for naive datetimes. Raises `ValueError` for offsets that
+    are not whole minutes.
+    """
+    offset = value.utcoffset()
+    if offset is None:
+        return None
+    minutes, remainder = divmod(offset, _MINUTE)
+    if remainder:
+        raise ValueError(f"UTC offset {offset} is not a whole number of minutes")
+    return minutes
+
+
+def from_epoch_micros(value: int, offset_minutes: int | None = None) -> datetime:
+    """Return the datetime for integer epoch microseconds.
+
+    Without `offset_minutes` the result is naive UTC wall time; otherwise it
+    is aware, in that fixed UTC offset. Raises `ValueError` for offsets of a
+    day or more.
+    """
+    if offset_minutes is None:
+        return _EPOCH + _MICROSECOND * value
+    instant = _AWARE_EPOCH + _MICROSECOND * value
+    if not offset_minutes:
+        return instant
+    return instant.astimezone(timezone(_MINUTE * offset_minutes))
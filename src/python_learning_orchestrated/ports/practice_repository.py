@@ -3,8 +3,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator
+from datetime import datetime
 
-from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.practice import (
+    Attempt,
+    LearningItem,
+    select_next_item,
+)
 
 
 class PracticeRepository(ABC):
@@ -14,6 +20,10 @@ class PracticeRepository(ABC):
     def list_items(self) -> list[LearningItem]:
         """Return all available learning items."""
 
+    def next_item(self, now: datetime) -> LearningItem | None:
+        """Return the next item to practice following `select_next_item` rules."""
+        return select_next_item(self.list_items(), now)
+
     @abstractmethod
     def save_item(self, item: LearningItem) -> None:
         """Persist item scheduling state."""
@@ -27,6 +37,10 @@ class PracticeRepository(ABC):
     def list_attempts(self) -> list[Attempt]:
         """Return all recorded attempts."""
 
+    def iter_attempts(self) -> Iterator[Attempt]:
+        """Yield recorded attempts, streaming them where the adapter can."""
+        return iter(self.list_attempts())
+
     @abstractmethod
     def record_attempt(self, attempt: Attempt) -> None:
         """Persist an attempt record."""
@@ -35,3 +49,77 @@ class PracticeRepository(ABC):
         """Persist multiple attempt records in batch."""
         for attempt in attempts:
             self.record_attempt(attempt)
+
+    @property
+    def appends_attempts(self) -> bool:
+        """Return whether recording attempts appends instead of rewriting storage.
+
+        Streaming imports only write attempts in batches when this is true;
+        otherwise they hold new attempts and write the import once.
+        """
+        return False
+
+    def apply_changes(self, items: list[LearningItem], attempts: list[Attempt]) -> None:
+        """Persist staged item updates and attempts as a single write."""
+        if attempts:
+            self.record_attempts(attempts)
+        if items:
+            self.save_items(items)
+
+    @abstractmethod
+    def replace_contents(
+        self, items: list[LearningItem], attempts: Iterable[Attempt]
+    ) -> None:
+        """Replace all stored items and attempts with the given ones."""
+
+    def begin(self) -> PracticeUnitOfWork:
+        """Start a unit of work that commits staged changes in one write."""
+        return PracticeUnitOfWork(self)
+
+
+class PracticeUnitOfWork:
+    """Stage item updates and attempts, then persist them with one commit."""
+
+    def __init__(self, repository: PracticeRepository) -> None:
+        self._repository = repository
+        self._items: dict[str, LearningItem] = {}
+        self._attempts: list[Attempt] = []
+
+    def __enter__(self) -> PracticeUnitOfWork:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, traceback: object) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    @property
+    def has_changes(self) -> bool:
+        """Return whether any item update or attempt is waiting for commit."""
+        return bool(self._items or self._attempts)
+
+    def stage_item(self, item: LearningItem) -> None:
+        """Stage item scheduling state, replacing earlier staged state by id."""
+        self._items[item.id] = item
+
+    def stage_attempt(self, attempt: Attempt) -> None:
+        """Stage an attempt record."""
+        self._attempts.append(attempt)
+
+    def commit(self) -> None:
+        """Persist all staged changes through the repository in one write.
+
+        Staged changes are only cleared once the write succeeds, so a failed
+        commit can be retried.
+        """
+        if not self.has_changes:
+            return
+        self._repository.apply_changes(list(self._items.values()), list(self._attempts))
+        self._items = {}
+        self._attempts = []
+
+    def rollback(self) -> None:
+        """Discard all staged changes."""
+        self._items = {}
+        self._attempts = []
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 
 from python_learning_orchestrated.domain.progress import LessonProgress
 
@@ -21,3 +22,11 @@ class ProgressRepository(ABC):
     @abstractmethod
     def reset_progress(self, user_id: str) -> None:
         """Delete persisted progress for a specific user."""
+
+    def apply_changes(self, changes: Mapping[str, LessonProgress | None]) -> None:
+        """Persist several users' progress in one write; `None` resets a user."""
+        for user_id, progress in changes.items():
+            if progress is None:
+                self.reset_progress(user_id)
+            else:
+                self.save_progress(user_id, progress)
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from datetime import datetime
 
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
 
+SnapshotRecord = LearningItem | Attempt
+
 
 class ProgressSnapshotStore(ABC):
     """Boundary for snapshot serialization IO."""
@@ -17,3 +22,13 @@ class ProgressSnapshotStore(ABC):
     @abstractmethod
     def save(self, snapshot: ProgressSnapshot) -> None:
         """Persist a progress snapshot to storage."""
+
+    def read_exported_at(self) -> datetime:
+        """Return the snapshot's export time, reading as little as possible."""
+        return self.load().exported_at
+
+    def iter_records(self) -> Iterator[SnapshotRecord]:
+        """Yield snapshot items and attempts, streaming them where possible."""
+        snapshot = self.load()
+        yield from snapshot.items
+        yield from snapshot.attempts
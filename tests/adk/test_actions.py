@@ -35,3 +35,15 @@ def test_run_next_lesson_records_completed_lesson(tmp_path) -> None:
 
     assert result.ok is True
     assert result.details["lesson_id"] == "variables"
+
+
+def test_run_next_lesson_with_progress_db_resumes_progress(tmp_path) -> None:
+    progress_db = tmp_path / "progress.db"
+    arguments = {"progress_db": str(progress_db), "user_id": "demo-user"}
+
+    first = run_next_lesson(tmp_path, arguments)
+    second = run_next_lesson(tmp_path, arguments)
+
+    assert first.details["lesson_id"] == "variables"
+    assert second.details["lesson_id"] == "loops"
+    assert progress_db.exists()
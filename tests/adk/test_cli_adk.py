@@ -13,7 +13,8 @@ def test_cli_adk_roadmap_outputs_json(capsys) -> None:
     assert payload["tasks"]
 
 
-def test_cli_adk_run_next_outputs_json(tmp_path, capsys) -> None:
+def test_cli_adk_run_next_outputs_json(tmp_path, capsys, monkeypatch) -> None:
+    monkeypatch.chdir(tmp_path)
     progress_file = tmp_path / "progress.json"
     roadmap_copy = tmp_path / "adk-roadmap.md"
     roadmap_copy.write_text(
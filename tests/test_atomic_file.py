@@ -0,0 +1,39 @@
+"""Tests for the shared atomic file replacement helpers."""
+
+from __future__ import annotations
+
+import json
+from typing import IO
+
+import pytest
+
+from python_learning_orchestrated.adapters.atomic_file import (
+    replace_file,
+    text_writer,
+    write_bytes,
+)
+
+
+def test_replace_file_writes_bytes_and_text(tmp_path) -> None:
+    target = tmp_path / "data.json"
+
+    write_bytes(target, b"old")
+    replace_file(target, text_writer(lambda text_file: json.dump({"a": 1}, text_file)))
+
+    assert json.loads(target.read_text(encoding="utf-8")) == {"a": 1}
+    assert [path.name for path in tmp_path.iterdir()] == ["data.json"]
+
+
+def test_failed_write_keeps_the_target_and_removes_the_temp_file(tmp_path) -> None:
+    target = tmp_path / "data.json"
+    target.write_bytes(b"old")
+
+    def fail(temp_file: IO[bytes]) -> None:
+        temp_file.write(b"partial")
+        raise OSError("disk full")
+
+    with pytest.raises(OSError, match="disk full"):
+        replace_file(target, fail)
+
+    assert target.read_bytes() == b"old"
+    assert [path.name for path in tmp_path.iterdir()] == ["data.json"]
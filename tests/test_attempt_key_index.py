@@ -0,0 +1,42 @@
+"""Tests for the compact attempt-key index."""
+
+from __future__ import annotations
+
+import random
+
+from python_learning_orchestrated.domain import attempt_key_index
+from python_learning_orchestrated.domain.attempt_key_index import AttemptKeyIndex
+
+
+def test_attempt_key_index_matches_a_set_of_keys(monkeypatch) -> None:
+    monkeypatch.setattr(attempt_key_index, "_RUN_SIZE", 3)
+    monkeypatch.setattr(attempt_key_index, "_MIN_PENDING", 5)
+    rng = random.Random(11)
+    start = 1_735_722_000_000_000
+
+    def random_key() -> tuple[int, str]:
+        return (start + rng.randint(-50, 200) * 1_000_000, f"item-{rng.randint(0, 4)}")
+
+    existing = [random_key() for _ in range(120)]
+    index = AttemptKeyIndex(existing)
+    expected = set(existing)
+
+    assert len(index) == len(expected)
+    for _ in range(400):
+        key = random_key()
+        assert (key in index) == (key in expected)
+        assert index.add(key) == (key not in expected)
+        expected.add(key)
+        assert len(index) == len(expected)
+    assert all(key in index for key in expected)
+
+
+def test_attempt_key_index_rejects_other_keys() -> None:
+    index = AttemptKeyIndex([(1_735_722_000_000_000, "a")])
+
+    assert (1_735_722_000_000_000, "a") in index
+    assert (1_735_722_000_000_000, "b") not in index
+    assert ("a", 1_735_722_000_000_000) not in index
+    assert "a" not in index
+    assert not index.add((1_735_722_000_000_000, "a"))
+    assert len(index) == 1
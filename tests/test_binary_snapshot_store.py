@@ -0,0 +1,149 @@
+"""Tests for the memory-mapped binary progress snapshot format."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from python_learning_orchestrated.adapters.binary_snapshot_store import (
+    BinaryProgressSnapshotStore,
+    BinarySnapshotReader,
+    binary_snapshot_to_payload,
+    payload_to_binary_snapshot,
+)
+from python_learning_orchestrated.adapters.json_file_progress_snapshot_store import (
+    progress_snapshot_to_payload,
+)
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+
+FIXED_NOW = datetime(2025, 1, 1, 9, 30, 15, 123456)
+
+
+def _snapshot() -> ProgressSnapshot:
+    return ProgressSnapshot(
+        version=1,
+        exported_at=FIXED_NOW,
+        items=[
+            LearningItem(id="new-1", prompt="Näive prompt", status="new", order=1),
+            LearningItem(
+                id="review-1",
+                prompt="Review",
+                status="review",
+                order=2,
+                due_at=FIXED_NOW + timedelta(days=1),
+                review_level=3,
+                interval_minutes=1440,
+            ),
+            LearningItem(
+                id="aware-1",
+                prompt="Review",
+                status="review",
+                order=3,
+                due_at=datetime(2024, 12, 31, 23, 0, tzinfo=UTC),
+            ),
+        ],
+        attempts=[
+            Attempt(item_id="review-1", timestamp=FIXED_NOW, outcome="correct"),
+            Attempt(
+                item_id="new-1",
+                timestamp=FIXED_NOW - timedelta(microseconds=1),
+                outcome="incorrect",
+            ),
+            Attempt(item_id="review-1", timestamp=FIXED_NOW, outcome="skip"),
+        ],
+    )
+
+
+def test_binary_snapshot_store_round_trips_snapshot(tmp_path) -> None:
+    store = BinaryProgressSnapshotStore(tmp_path / "snapshot.plsnap")
+    snapshot = _snapshot()
+
+    store.save(snapshot)
+
+    assert store.load() == snapshot
+
+
+def test_binary_snapshot_reader_reads_header_and_records_lazily(tmp_path) -> None:
+    store = BinaryProgressSnapshotStore(tmp_path / "snapshot.plsnap")
+    snapshot = _snapshot()
+    store.save(snapshot)
+
+    with store.open() as reader:
+        assert reader.version == 1
+        assert reader.exported_at == FIXED_NOW
+        assert reader.item_count == 3
+        assert reader.attempt_count == 3
+        assert reader.item(1) == snapshot.items[1]
+        assert reader.attempt(2) == snapshot.attempts[2]
+        with pytest.raises(IndexError):
+            reader.item(3)
+
+
+def test_binary_snapshot_interns_repeated_strings(tmp_path) -> None:
+    snapshot_path = tmp_path / "snapshot.plsnap"
+    BinaryProgressSnapshotStore(snapshot_path).save(_snapshot())
+
+    with BinarySnapshotReader(snapshot_path) as reader:
+        strings = [reader.string(index) for index in range(reader._string_count)]
+
+    assert sorted(strings) == sorted(
+        {"new-1", "Näive prompt", "review-1", "Review", "aware-1"}
+    )
+
+
+def test_binary_snapshot_converts_to_and_from_json_payload(tmp_path) -> None:
+    snapshot_path = tmp_path / "snapshot.plsnap"
+    payload = progress_snapshot_to_payload(_snapshot())
+
+    payload_to_binary_snapshot(payload, snapshot_path)
+
+    assert binary_snapshot_to_payload(snapshot_path) == payload
+
+
+def test_binary_snapshot_keeps_utc_offsets(tmp_path) -> None:
+    snapshot_path = tmp_path / "snapshot.plsnap"
+    india = timezone(timedelta(hours=5, minutes=30))
+    pacific = timezone(timedelta(hours=-8))
+    snapshot = replace(
+        _snapshot(),
+        exported_at=datetime(2025, 1, 1, 15, 0, tzinfo=india),
+        attempts=[
+            Attempt(
+                item_id="aware-1",
+                timestamp=datetime(2024, 12, 31, 22, 0, tzinfo=pacific),
+                outcome="correct",
+            )
+        ],
+    )
+    payload = progress_snapshot_to_payload(snapshot)
+
+    payload_to_binary_snapshot(payload, snapshot_path)
+
+    assert binary_snapshot_to_payload(snapshot_path) == payload
+    with BinarySnapshotReader(snapshot_path) as reader:
+        assert reader.exported_at.utcoffset() == timedelta(hours=5, minutes=30)
+        assert reader.attempt(0).timestamp.utcoffset() == timedelta(hours=-8)
+        assert reader.item(2).due_at == datetime(2024, 12, 31, 23, 0, tzinfo=UTC)
+
+
+def test_binary_snapshot_reader_rejects_other_files(tmp_path) -> None:
+    snapshot_path = tmp_path / "snapshot.plsnap"
+    snapshot_path.write_bytes(b"{}")
+
+    with pytest.raises(ValueError, match="truncated"):
+        BinarySnapshotReader(snapshot_path)
+
+    snapshot_path.write_bytes(b"x" * 256)
+
+    with pytest.raises(ValueError, match="not a binary progress snapshot"):
+        BinarySnapshotReader(snapshot_path)
+
+
+def test_binary_snapshot_rejects_delta_snapshots(tmp_path) -> None:
+    delta = replace(_snapshot(), delta_since=FIXED_NOW)
+
+    with pytest.raises(ValueError, match="delta"):
+        BinaryProgressSnapshotStore(tmp_path / "snapshot.plsnap").save(delta)
@@ -0,0 +1,77 @@
+"""Tests for the mtime-validated document cache and its adapters."""
+
+from __future__ import annotations
+
+import json
+
+from python_learning_orchestrated.adapters.cached_document import (
+    CachedDocument,
+    CacheStats,
+)
+from python_learning_orchestrated.adapters.json_file_practice_repository import (
+    JsonFilePracticeRepository,
+)
+from python_learning_orchestrated.adapters.json_file_progress_repository import (
+    JsonFileProgressRepository,
+)
+from python_learning_orchestrated.domain.practice import LearningItem
+
+
+def test_cached_document_reads_once_until_file_changes(tmp_path) -> None:
+    document_path = tmp_path / "doc.json"
+    document_path.write_text('{"value": 1}', encoding="utf-8")
+    reads: list[int] = []
+
+    def read() -> dict[str, object]:
+        payload: dict[str, object] = json.loads(
+            document_path.read_text(encoding="utf-8")
+        )
+        reads.append(1)
+        return payload
+
+    cache = CachedDocument(document_path, read)
+
+    assert cache.load() == {"value": 1}
+    assert cache.load() == {"value": 1}
+    document_path.write_text('{"value": 22}', encoding="utf-8")
+    assert cache.load() == {"value": 22}
+
+    assert len(reads) == 2
+    assert cache.stats == CacheStats(hits=1, misses=2)
+
+
+def test_cached_document_store_refreshes_without_reread(tmp_path) -> None:
+    document_path = tmp_path / "doc.json"
+    cache = CachedDocument(document_path, lambda: "from-disk")
+
+    document_path.write_text("written", encoding="utf-8")
+    cache.store("written")
+
+    assert cache.load() == "written"
+    assert cache.stats == CacheStats(hits=1, misses=0)
+
+
+def test_practice_repository_serves_repeated_reads_from_cache(tmp_path) -> None:
+    repository = JsonFilePracticeRepository(
+        tmp_path / "session.json",
+        [LearningItem(id="a", prompt="A", status="new", order=1)],
+    )
+
+    repository.list_items()
+    repository.save_item(LearningItem(id="b", prompt="B", status="new", order=2))
+    items = repository.list_items()
+
+    assert [item.id for item in items] == ["a", "b"]
+    assert repository.cache_stats.misses == 0
+
+
+def test_progress_repository_picks_up_external_writes(tmp_path) -> None:
+    progress_file = tmp_path / "progress.json"
+    repository = JsonFileProgressRepository(progress_file)
+    repository.save_progress("user-1", {"completed_lessons": ["variables"]})
+
+    other_writer = JsonFileProgressRepository(progress_file)
+    other_writer.save_progress("user-1", {"completed_lessons": ["loops"]})
+
+    assert repository.get_progress("user-1") == {"completed_lessons": ["loops"]}
+    assert repository.cache_stats.misses == 2
@@ -0,0 +1,69 @@
+"""Tests for checkpoint retention rules."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+import pytest
+
+from python_learning_orchestrated.adapters.checkpoint_retention import (
+    RetentionPolicy,
+    select_prunable,
+)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    slug: str
+    created_at: datetime
+    total_size: int = 100
+
+
+def _daily_entries(days: int) -> list[_Entry]:
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    return [
+        _Entry(slug=f"day-{index:03}", created_at=start + timedelta(days=index))
+        for index in range(days)
+    ]
+
+
+def test_keep_last_and_calendar_buckets() -> None:
+    entries = _daily_entries(70)
+    extra = _Entry(
+        slug="day-069-late", created_at=entries[-1].created_at.replace(hour=18)
+    )
+
+    pruned = select_prunable(
+        [*entries, extra],
+        RetentionPolicy(keep_last=2, keep_daily=3, keep_weekly=2, keep_monthly=3),
+    )
+
+    kept = {entry.slug for entry in [*entries, extra]} - {e.slug for e in pruned}
+    assert kept == {
+        "day-069-late",
+        "day-069",
+        "day-068",
+        "day-067",
+        "day-058",
+        "day-030",
+    }
+    assert pruned == sorted(pruned, key=lambda entry: entry.created_at)
+
+
+def test_max_total_bytes_drops_oldest_but_keeps_newest() -> None:
+    entries = _daily_entries(5)
+
+    pruned = select_prunable(entries, RetentionPolicy(max_total_bytes=250))
+    only_newest = select_prunable(entries, RetentionPolicy(max_total_bytes=0))
+
+    assert [entry.slug for entry in pruned] == ["day-000", "day-001", "day-002"]
+    assert [entry.slug for entry in only_newest] == [
+        entry.slug for entry in entries[:-1]
+    ]
+
+
+def test_empty_policy_keeps_everything() -> None:
+    assert select_prunable(_daily_entries(3), RetentionPolicy()) == []
+    with pytest.raises(ValueError, match="negative"):
+        RetentionPolicy(keep_last=-1)
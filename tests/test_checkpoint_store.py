@@ -2,8 +2,19 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import hashlib
+import json
+from dataclasses import replace
+from datetime import datetime, timedelta
 
+import pytest
+
+from python_learning_orchestrated.adapters import (
+    checkpoint_batch,
+    checkpoint_manifest,
+    checkpoint_store,
+)
+from python_learning_orchestrated.adapters.checkpoint_retention import RetentionPolicy
 from python_learning_orchestrated.adapters.checkpoint_store import CheckpointStore
 from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
@@ -70,8 +81,376 @@ def test_list_and_delete_checkpoints(tmp_path) -> None:
 
 
 def test_to_int_error_paths() -> None:
-    from python_learning_orchestrated.adapters.checkpoint_store import _to_int
+    from python_learning_orchestrated.adapters.snapshot_codec import to_int
+
+    assert to_int("invalid", 42) == 42
+    assert to_int("3.14", 42) == 42
+    assert to_int("abc", 0) == 0
+
+
+def test_columnar_checkpoint_round_trip(tmp_path) -> None:
+    snapshot = ProgressSnapshot(
+        version=2,
+        exported_at=datetime(2025, 1, 1, 9, 0, 0),
+        items=[LearningItem(id="a", prompt="A", status="new", order=1)],
+        attempts=[
+            Attempt(
+                item_id="a",
+                timestamp=datetime(2025, 1, 1, 9, 5, 0),
+                outcome="incorrect",
+            )
+        ],
+    )
+
+    CheckpointStore(tmp_path, columnar=True).save_checkpoint("Week 1", snapshot)
+    loaded = CheckpointStore(tmp_path).load_checkpoint("Week 1")
+
+    assert loaded.progress == snapshot
+
+
+def test_list_checkpoints_reads_manifest_instead_of_checkpoints(
+    tmp_path, monkeypatch
+) -> None:
+    store = CheckpointStore(tmp_path)
+    snapshot = ProgressSnapshot(
+        version=1,
+        exported_at=datetime(2025, 1, 1, 9, 0, 0),
+        items=[LearningItem(id="a", prompt="A", status="new", order=1)],
+        attempts=[],
+    )
+    store.save_checkpoint("Week 1", snapshot, description="Before quiz")
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("checkpoint file was parsed")
+
+    monkeypatch.setattr(checkpoint_manifest, "_index_entry", fail)
+    [entry] = store.checkpoint_index()
+
+    checkpoint_bytes = (tmp_path / "week-1.checkpoint.json").read_bytes()
+    assert entry.checkpoint == store.list_checkpoints()[0]
+    assert entry.slug == "week-1"
+    assert entry.size == len(checkpoint_bytes)
+    assert (entry.item_count, entry.attempt_count) == (1, 0)
+    assert entry.content_hash == hashlib.sha256(checkpoint_bytes).hexdigest()
+
+
+def test_checkpoint_manifest_heals_missing_and_stale_entries(tmp_path) -> None:
+    store = CheckpointStore(tmp_path)
+    snapshot = ProgressSnapshot(
+        version=1,
+        exported_at=datetime(2025, 1, 1, 9, 0, 0),
+        items=[],
+        attempts=[],
+    )
+    store.save_checkpoint("Week 1", snapshot)
+    store.save_checkpoint("Week 2", snapshot)
+    manifest = tmp_path / "manifest.json"
+
+    manifest.unlink()
+    assert [c.name for c in store.list_checkpoints()] == ["Week 1", "Week 2"]
+    assert manifest.exists()
+
+    (tmp_path / "week-1.checkpoint.json").unlink()
+    other = CheckpointStore(tmp_path / "other")
+    other.save_checkpoint("Week 2", snapshot, description="Edited elsewhere")
+    other.save_checkpoint("Week 3", snapshot)
+    for slug in ("week-2", "week-3"):
+        (tmp_path / "other" / f"{slug}.checkpoint.json").replace(
+            tmp_path / f"{slug}.checkpoint.json"
+        )
+    checkpoints = store.list_checkpoints()
+
+    assert [c.name for c in checkpoints] == ["Week 2", "Week 3"]
+    assert checkpoints[0].description == "Edited elsewhere"
+    listed = json.loads(manifest.read_text(encoding="utf-8"))["checkpoints"]
+    assert [entry["slug"] for entry in listed] == ["week-2", "week-3"]
+
+    manifest.write_text("{not json", encoding="utf-8")
+    assert store.list_checkpoints() == checkpoints
+
+
+def test_checkpoints_share_chunks_and_collect_them_on_delete(tmp_path) -> None:
+    store = CheckpointStore(tmp_path)
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    items = [
+        LearningItem(id=f"item-{index}", prompt="P", status="new", order=index)
+        for index in range(600)
+    ]
+    attempts = [
+        Attempt(
+            item_id=f"item-{index % 600}",
+            timestamp=start + timedelta(seconds=index),
+            outcome="correct",
+        )
+        for index in range(2000)
+    ]
+    first = ProgressSnapshot(
+        version=2, exported_at=start, items=items, attempts=attempts
+    )
+    second = replace(
+        first,
+        exported_at=start + timedelta(days=1),
+        items=[*items[:-1], replace(items[-1], status="review", review_level=1)],
+        attempts=[*attempts, replace(attempts[0], timestamp=start + timedelta(days=1))],
+    )
+    chunk_dir = tmp_path / "chunks"
+
+    store.save_checkpoint("Day 1", first)
+    first_chunks = set(chunk_dir.glob("*.chunk"))
+    store.save_checkpoint("Day 2", second)
+    all_chunks = set(chunk_dir.glob("*.chunk"))
+
+    assert len(all_chunks - first_chunks) <= 2
+    assert store.load_checkpoint("Day 1").progress == first
+    assert store.load_checkpoint("Day 2").progress == second
+
+    store.delete_checkpoint("Day 1")
+
+    assert len(set(chunk_dir.glob("*.chunk"))) < len(all_chunks)
+    assert store.load_checkpoint("Day 2").progress == second
+
+    store.delete_checkpoint("Day 2")
+
+    assert list(chunk_dir.glob("*.chunk")) == []
+    assert json.loads((chunk_dir / "refcounts.json").read_text()) == {}
+
+
+def test_failed_checkpoint_write_releases_its_chunks(tmp_path, monkeypatch) -> None:
+    store = CheckpointStore(tmp_path)
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    first = ProgressSnapshot(
+        version=1,
+        exported_at=start,
+        items=[LearningItem(id="a", prompt="A", status="new", order=1)],
+        attempts=[],
+    )
+    second = replace(
+        first, items=[LearningItem(id="b", prompt="B", status="new", order=1)]
+    )
+    store.save_checkpoint("Day 1", first)
+    chunk_dir = tmp_path / "chunks"
+    refcounts = json.loads((chunk_dir / "refcounts.json").read_text())
+
+    def fail_write(*_args: object) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(checkpoint_store, "write_bytes", fail_write)
+    with pytest.raises(OSError, match="disk full"):
+        store.save_checkpoint("Day 2", second)
+
+    assert json.loads((chunk_dir / "refcounts.json").read_text()) == refcounts
+    assert {path.stem for path in chunk_dir.glob("*.chunk")} == set(refcounts)
+    assert not store.has_checkpoint("Day 2")
+
+
+def test_load_checkpoint_with_inline_progress(tmp_path) -> None:
+    (tmp_path / "week-1.checkpoint.json").write_text(
+        json.dumps(
+            {
+                "name": "Week 1",
+                "created_at": "2025-01-01T09:00:00",
+                "description": None,
+                "progress": {
+                    "version": 1,
+                    "exported_at": "2025-01-01T09:00:00",
+                    "items": [{"id": "a", "prompt": "A", "status": "new", "order": 1}],
+                    "attempts": [],
+                },
+            }
+        ),
+        encoding="utf-8",
+    )
+    store = CheckpointStore(tmp_path)
+
+    [entry] = store.checkpoint_index()
+
+    assert entry.item_count == 1
+    assert store.load_checkpoint("Week 1").progress.items[0].id == "a"
+
+
+def test_diff_checkpoints_streams_sorted_changes(tmp_path) -> None:
+    store = CheckpointStore(tmp_path)
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    items = [
+        LearningItem(id=f"item-{index:03}", prompt="P", status="new", order=-index)
+        for index in range(50)
+    ]
+    attempts = [
+        Attempt(
+            item_id=f"item-{index % 50:03}",
+            timestamp=start + timedelta(seconds=(index * 37) % 300),
+            outcome="correct",
+        )
+        for index in range(300)
+    ]
+    reviewed = replace(items[10], status="review", review_level=1)
+    retried = replace(attempts[5], outcome="skip")
+    extra = Attempt(item_id="item-000", timestamp=start, outcome="skip")
+    store.save_checkpoint(
+        "Before", ProgressSnapshot(1, start, items=items, attempts=attempts)
+    )
+    store.save_checkpoint(
+        "After",
+        ProgressSnapshot(
+            1,
+            start,
+            items=[*items[:10], reviewed, *items[11:49]],
+            attempts=[*attempts[:5], retried, *attempts[6:299], extra],
+        ),
+    )
+
+    changes = list(store.diff_checkpoints("Before", "After", run_size=16))
+
+    assert [(type(change).__name__, change.kind) for change in changes] == [
+        ("ItemChange", "changed"),
+        ("ItemChange", "removed"),
+        ("AttemptChange", "added"),
+        ("AttemptChange", "changed"),
+        ("AttemptChange", "removed"),
+    ]
+    assert changes[0].after == reviewed
+    assert changes[3].after == retried
+
+
+def test_prune_uses_manifest_and_collects_chunks(tmp_path, monkeypatch) -> None:
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    store = CheckpointStore(tmp_path, retention=RetentionPolicy(keep_last=3))
+    for day in range(5):
+        store.save_checkpoint(
+            f"Day {day}",
+            ProgressSnapshot(
+                version=1,
+                exported_at=start + timedelta(days=day),
+                items=[LearningItem(id=f"d{day}", prompt="P", status="new", order=1)],
+                attempts=[],
+            ),
+        )
+
+    assert [c.name for c in store.list_checkpoints()] == ["Day 2", "Day 3", "Day 4"]
+    assert len(list((tmp_path / "chunks").glob("*.chunk"))) == 3
+
+    monkeypatch.setattr(checkpoint_manifest, "_index_entry", _fail)
+    would_prune = store.prune(RetentionPolicy(keep_last=1), dry_run=True)
+    pruned = store.prune(RetentionPolicy(keep_last=1))
+
+    assert [entry.name for entry in would_prune] == ["Day 2", "Day 3"]
+    assert pruned == would_prune
+    assert [c.name for c in store.list_checkpoints()] == ["Day 4"]
+    assert len(list((tmp_path / "chunks").glob("*.chunk"))) == 1
+
+
+def test_load_and_verify_checkpoints_in_batch(tmp_path) -> None:
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    items = [
+        LearningItem(id=f"item-{index}", prompt="P", status="new", order=index)
+        for index in range(50)
+    ]
+    snapshot = ProgressSnapshot(version=2, exported_at=start, items=items, attempts=[])
+    store = CheckpointStore(tmp_path)
+    store.save_checkpoint("Shared", snapshot)
+    store.save_checkpoint("Copy", replace(snapshot, exported_at=start))
+    store.save_checkpoint("Other", replace(snapshot, items=items[:1]))
+
+    statuses = store.load_checkpoints(["Shared", "Missing", "Other"], max_workers=2)
+
+    assert [status.ok for status in statuses] == [True, False, True]
+    assert statuses[0].record == store.load_checkpoint("Shared")
+    assert statuses[0].item_count == 50
+    assert statuses[1].error == "checkpoint not found"
+    assert statuses[2].record is not None
+    assert statuses[2].record.progress.items == items[:1]
+
+    shared_chunk = min(
+        _chunk_digests(tmp_path / "shared.checkpoint.json")
+        - _chunk_digests(tmp_path / "other.checkpoint.json")
+    )
+    (tmp_path / "chunks" / f"{shared_chunk}.chunk").write_text("{}")
+
+    verified = store.verify_checkpoints(max_workers=2)
+
+    assert {status.name: status.ok for status in verified} == {
+        "Copy": False,
+        "Other": True,
+        "Shared": False,
+    }
+    assert all(status.record is None for status in verified)
+    assert verified[0].error == f"chunk {shared_chunk[:12]} does not match its digest"
+    assert (
+        verified[0].content_hash
+        == hashlib.sha256((tmp_path / "copy.checkpoint.json").read_bytes()).hexdigest()
+    )
+
+
+def test_verify_all_reports_unreadable_checkpoint_files(tmp_path) -> None:
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    store = CheckpointStore(tmp_path)
+    store.save_checkpoint(
+        "Good", ProgressSnapshot(version=1, exported_at=now, items=[], attempts=[])
+    )
+    (tmp_path / "broken.checkpoint.json").write_text("{not json")
+    (tmp_path / "undated.checkpoint.json").write_text(
+        json.dumps({"name": "Undated", "created_at": "someday"})
+    )
+
+    statuses = store.verify_checkpoints(max_workers=1)
+
+    assert [checkpoint.name for checkpoint in store.list_checkpoints()] == ["Good"]
+    assert [(status.name, status.ok) for status in statuses] == [
+        ("broken", False),
+        ("Good", True),
+        ("undated", False),
+    ]
+
+
+def test_verify_reports_malformed_inline_checkpoints_in_process(
+    tmp_path, monkeypatch
+) -> None:
+    def checkpoint(name: str, progress: dict[str, object]) -> None:
+        (tmp_path / f"{name}.checkpoint.json").write_text(
+            json.dumps(
+                {
+                    "name": name,
+                    "created_at": "2025-01-01T09:00:00",
+                    "progress": {"version": 1, **progress},
+                }
+            ),
+            encoding="utf-8",
+        )
+
+    checkpoint("good", {"exported_at": "2025-01-01T09:00:00"})
+    checkpoint("bad-export", {"exported_at": "nope"})
+    checkpoint(
+        "bad-due",
+        {
+            "exported_at": "2025-01-01T09:00:00",
+            "items": [{"id": "a", "order": 1, "due_at": "garbage"}],
+        },
+    )
+    monkeypatch.setattr(checkpoint_batch, "ProcessPoolExecutor", _fail, raising=True)
+    store = CheckpointStore(tmp_path)
+
+    statuses = {
+        status.name: status.error
+        for status in store.verify_checkpoints(
+            ["good", "bad-export", "bad-due"], max_workers=1
+        )
+    }
+    [single] = store.load_checkpoints(["bad-due"])
+
+    assert statuses["good"] is None
+    assert statuses["bad-export"] == (
+        "progress cannot be decoded: Invalid isoformat string: 'nope'"
+    )
+    assert statuses["bad-due"] == (
+        "progress cannot be decoded: Invalid isoformat string: 'garbage'"
+    )
+    assert single.error == statuses["bad-due"]
+
+
+def _chunk_digests(path) -> set[str]:
+    chunks = json.loads(path.read_text())["chunks"]
+    return {*chunks["items"], *chunks["attempts"]}
+
 
-    assert _to_int("invalid", 42) == 42
-    assert _to_int("3.14", 42) == 42
-    assert _to_int("abc", 0) == 0
+def _fail(*_args: object) -> None:
+    raise AssertionError("checkpoint file was parsed")
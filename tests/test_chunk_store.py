@@ -0,0 +1,40 @@
+"""Tests for content-addressed chunk storage."""
+
+from __future__ import annotations
+
+import hashlib
+
+from python_learning_orchestrated.adapters.chunk_store import ChunkStore
+
+
+def test_put_deduplicates_and_release_deletes_unreferenced(tmp_path) -> None:
+    store = ChunkStore(tmp_path, lambda: [])
+
+    first = store.put(b"alpha")
+    again = store.put(b"alpha")
+    second = store.put(b"beta")
+    store.retain([first, second])
+    store.retain([first])
+
+    assert first == again == hashlib.sha256(b"alpha").hexdigest()
+    assert store.get(first) == b"alpha"
+    assert store.refcounts() == {first: 2, second: 1}
+    assert store.release([first, second]) == [second]
+    assert store.digests() == [first]
+    assert store.release([first]) == [first]
+    assert store.digests() == []
+
+
+def test_refcounts_rebuild_from_references(tmp_path) -> None:
+    references: list[str] = []
+    store = ChunkStore(tmp_path, lambda: references)
+    shared = store.put(b"shared")
+    dropped = store.put(b"dropped")
+    store.retain([shared, shared, dropped])
+    references.append(shared)
+
+    (tmp_path / "refcounts.json").unlink()
+
+    assert store.release([shared, dropped]) == [dropped]
+    assert store.refcounts() == {shared: 1}
+    assert store.has(shared)
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import gzip
+import io
 import json
 from pathlib import Path
 
+import pytest
+
 import python_learning_orchestrated.cli as cli_module
 from python_learning_orchestrated.cli import main
 
@@ -91,6 +95,309 @@ def test_cli_export_and_import_progress_commands(tmp_path, capsys) -> None:
     assert len(session_payload["attempts"]) == 1
 
 
+def test_cli_imports_many_snapshots_from_glob(tmp_path, capsys) -> None:
+    snapshot_dir = tmp_path / "backups"
+    for index in range(3):
+        session_file = tmp_path / f"session-{index}.json"
+        answers = iter(["correct"] * (index + 1) + ["quit"])
+        main(
+            ["session", "--session-file", str(session_file)], input_fn=answers.__next__
+        )
+        main(
+            [
+                "export-progress",
+                "--session-file",
+                str(session_file),
+                "--out",
+                str(snapshot_dir / f"day-{index}.json"),
+            ]
+        )
+    capsys.readouterr()
+    target_file = tmp_path / "merged.json"
+
+    main(
+        [
+            "import-progress",
+            "--session-file",
+            str(target_file),
+            "--in",
+            str(snapshot_dir / "day-*.json"),
+            "--workers",
+            "2",
+        ]
+    )
+
+    assert capsys.readouterr().out.startswith("Imported 3 progress snapshots (")
+    exported_keys = {
+        (attempt["item_id"], attempt["timestamp"])
+        for path in snapshot_dir.glob("day-*.json")
+        for attempt in json.loads(path.read_text(encoding="utf-8"))["attempts"]
+    }
+    session_payload = json.loads(target_file.read_text(encoding="utf-8"))
+    assert len(exported_keys) > 3
+    assert {
+        (attempt["item_id"], attempt["timestamp"])
+        for attempt in session_payload["attempts"]
+    } == exported_keys
+
+    try:
+        main(["import-progress", "--in", str(snapshot_dir / "none-*.json")])
+    except SystemExit as exc:
+        assert str(exc).endswith("matched no files")
+    else:
+        raise AssertionError("Expected SystemExit for an unmatched pattern")
+
+    (snapshot_dir / "day-3.json").write_text("{not json", encoding="utf-8")
+    with pytest.raises(SystemExit, match="day-3.json is not valid JSON"):
+        main(["import-progress", "--in", str(snapshot_dir / "day-*.json")])
+
+
+def test_cli_export_and_import_binary_snapshot(tmp_path, capsys) -> None:
+    session_file = tmp_path / "session.json"
+    export_file = tmp_path / "export.plsnap"
+
+    choices = iter(["correct", "quit"])
+    main(
+        ["session", "--session-file", str(session_file)], input_fn=lambda: next(choices)
+    )
+    main(
+        [
+            "export-progress",
+            "--session-file",
+            str(session_file),
+            "--out",
+            str(export_file),
+        ]
+    )
+
+    assert export_file.read_bytes().startswith(b"PLOSNAP")
+
+    main(
+        [
+            "import-progress",
+            "--session-file",
+            str(session_file),
+            "--in",
+            str(export_file),
+        ]
+    )
+    assert "(2 items, 1 attempts)" in capsys.readouterr().out
+
+
+def test_cli_pipes_snapshots_through_stdout_and_stdin(
+    tmp_path, capsys, monkeypatch
+) -> None:
+    session_file = tmp_path / "session.json"
+    target_file = tmp_path / "target.json"
+
+    choices = iter(["correct", "quit"])
+    main(
+        ["session", "--session-file", str(session_file)], input_fn=lambda: next(choices)
+    )
+    capsys.readouterr()
+    main(["export-progress", "--session-file", str(session_file), "--out", "-"])
+    exported = capsys.readouterr().out
+
+    assert json.loads(exported)["version"] == 1
+
+    monkeypatch.setattr("sys.stdin", io.StringIO(exported))
+    main(["import-progress", "--session-file", str(target_file), "--in", "-"])
+
+    assert "Imported progress snapshot from - (2 items, 1 attempts)." in (
+        capsys.readouterr().out
+    )
+
+
+def test_cli_exports_and_imports_compressed_snapshot(tmp_path, capsys) -> None:
+    session_file = tmp_path / "session.json"
+    export_file = tmp_path / "export.json.gz"
+
+    choices = iter(["correct", "quit"])
+    main(
+        ["session", "--session-file", str(session_file)], input_fn=lambda: next(choices)
+    )
+    main(
+        [
+            "export-progress",
+            "--session-file",
+            str(session_file),
+            "--out",
+            str(export_file),
+        ]
+    )
+    main(
+        [
+            "import-progress",
+            "--session-file",
+            str(tmp_path / "target.json"),
+            "--in",
+            str(export_file),
+        ]
+    )
+
+    payload = json.loads(gzip.decompress(export_file.read_bytes()))
+    assert len(payload["attempts"]) == 1
+    assert "(2 items, 1 attempts)" in capsys.readouterr().out
+
+
+def test_cli_upgrade_schema_converts_session_and_snapshot(tmp_path, capsys) -> None:
+    session_file = tmp_path / "session.json"
+    export_file = tmp_path / "export.json"
+    upgraded_file = tmp_path / "export-v2.json"
+
+    choices = iter(["correct", "quit"])
+    main(
+        ["session", "--session-file", str(session_file)], input_fn=lambda: next(choices)
+    )
+    main(
+        [
+            "export-progress",
+            "--session-file",
+            str(session_file),
+            "--out",
+            str(export_file),
+        ]
+    )
+    main(
+        [
+            "upgrade-schema",
+            "--in",
+            str(export_file),
+            "--out",
+            str(upgraded_file),
+            "--columnar",
+        ]
+    )
+    main(["upgrade-schema", "--session-file", str(session_file)])
+
+    output = capsys.readouterr().out
+    snapshot = json.loads(upgraded_file.read_text(encoding="utf-8"))
+    document = json.loads(session_file.read_text(encoding="utf-8"))
+    assert f"Upgraded {upgraded_file} to schema version 2." in output
+    assert snapshot["version"] == 2
+    assert snapshot["layout"] == "columnar"
+    assert isinstance(snapshot["attempts"]["timestamp"][0], int)
+    assert document["schema_version"] == 2
+    assert isinstance(document["attempts"][0]["timestamp"], int)
+
+
+def test_cli_export_delta_since_checkpoint(tmp_path, capsys, monkeypatch) -> None:
+    session_file = tmp_path / "session.json"
+    delta_file = tmp_path / "delta.json"
+    checkpoint_store_class = cli_module.CheckpointStore
+    monkeypatch.setattr(
+        cli_module,
+        "CheckpointStore",
+        lambda **options: checkpoint_store_class(tmp_path / "checkpoints", **options),
+    )
+
+    main(
+        ["session", "--session-file", str(session_file)],
+        input_fn=iter(["correct", "quit"]).__next__,
+    )
+    main(["checkpoint", "create", "Nightly", "--session-file", str(session_file)])
+    main(
+        ["session", "--session-file", str(session_file)],
+        input_fn=iter(["skip", "quit"]).__next__,
+    )
+    capsys.readouterr()
+    main(
+        [
+            "export-progress",
+            "--session-file",
+            str(session_file),
+            "--out",
+            str(delta_file),
+            "--since-checkpoint",
+            "Nightly",
+        ]
+    )
+
+    payload = json.loads(delta_file.read_text(encoding="utf-8"))
+    assert "delta_since" in payload
+    assert len(payload["attempts"]) == 1
+    assert payload["attempts"][0]["outcome"] == "skip"
+    assert "Exported progress delta since" in capsys.readouterr().out
+
+    try:
+        main(["export-progress", "--out", str(delta_file), "--since", "nope"])
+    except SystemExit as exc:
+        assert "is not an ISO timestamp" in str(exc)
+    else:
+        raise AssertionError("Expected SystemExit for unknown watermark")
+
+
+def test_cli_export_delta_since_file_reads_only_the_header(
+    tmp_path, capsys, monkeypatch
+) -> None:
+    session_file = tmp_path / "session.json"
+    full_file = tmp_path / "2025-01-01"
+    delta_file = tmp_path / "delta.json"
+
+    main(
+        ["session", "--session-file", str(session_file)],
+        input_fn=iter(["correct", "quit"]).__next__,
+    )
+    main(
+        [
+            "export-progress",
+            "--session-file",
+            str(session_file),
+            "--out",
+            str(full_file),
+        ]
+    )
+    exported_at = json.loads(full_file.read_text(encoding="utf-8"))["exported_at"]
+    monkeypatch.setattr(
+        cli_module.JsonFileProgressSnapshotStore,
+        "load",
+        lambda self: pytest.fail("--since-file must not load the whole snapshot"),
+    )
+    capsys.readouterr()
+
+    main(
+        [
+            "export-progress",
+            "--session-file",
+            str(session_file),
+            "--out",
+            str(delta_file),
+            "--since-file",
+            str(full_file),
+        ]
+    )
+
+    payload = json.loads(delta_file.read_text(encoding="utf-8"))
+    assert payload["delta_since"] == exported_at
+    assert payload["attempts"] == []
+
+
+@pytest.mark.parametrize(
+    ("arguments", "message"),
+    [
+        (["--since", "2025-01-01", "--since-checkpoint", "x"], "cannot be combined"),
+        (["--since-file", "missing.json"], "does not exist"),
+        (["--since-checkpoint", "missing"], "checkpoint 'missing' not found"),
+        (["--since", "2025-01-01", "--out", "delta.plsnap"], "cannot store delta"),
+    ],
+)
+def test_cli_export_delta_rejects_bad_watermarks(
+    tmp_path, monkeypatch, arguments, message
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    checkpoint_store_class = cli_module.CheckpointStore
+    monkeypatch.setattr(
+        cli_module,
+        "CheckpointStore",
+        lambda **options: checkpoint_store_class(tmp_path / "checkpoints", **options),
+    )
+    if "--out" not in arguments:
+        arguments = [*arguments, "--out", "delta.json"]
+
+    with pytest.raises(SystemExit, match=message):
+        main(["export-progress", *arguments])
+
+
 def test_cli_checkpoint_create_and_list(tmp_path, capsys, monkeypatch) -> None:
     session_file = tmp_path / "session.json"
     checkpoint_dir = tmp_path / "checkpoints"
@@ -105,7 +412,7 @@ def test_cli_checkpoint_create_and_list(tmp_path, capsys, monkeypatch) -> None:
     monkeypatch.setattr(
         cli_module,
         "CheckpointStore",
-        lambda: checkpoint_store_class(checkpoint_dir),
+        lambda **options: checkpoint_store_class(checkpoint_dir, **options),
     )
 
     main(
@@ -126,6 +433,155 @@ def test_cli_checkpoint_create_and_list(tmp_path, capsys, monkeypatch) -> None:
     assert "Week 1" in list_output
 
 
+def test_cli_checkpoint_diff(tmp_path, capsys, monkeypatch) -> None:
+    session_file = tmp_path / "session.json"
+    checkpoint_store_class = cli_module.CheckpointStore
+    monkeypatch.setattr(
+        cli_module,
+        "CheckpointStore",
+        lambda **options: checkpoint_store_class(tmp_path / "checkpoints", **options),
+    )
+    main(["checkpoint", "create", "Before", "--session-file", str(session_file)])
+    main(
+        ["session", "--session-file", str(session_file)],
+        input_fn=iter(["correct", "quit"]).__next__,
+    )
+    main(["checkpoint", "create", "After", "--session-file", str(session_file)])
+    capsys.readouterr()
+
+    main(["checkpoint", "diff", "Before", "After"])
+
+    output = capsys.readouterr().out.splitlines()
+    assert output[:3] == [
+        "Diff 'Before' -> 'After':",
+        "Items: 0 added, 0 removed, 1 changed",
+        "Attempts: 1 added, 0 removed, 0 changed",
+    ]
+    assert output[3].startswith("~ ")
+
+    try:
+        main(["checkpoint", "diff", "Before", "Missing"])
+    except SystemExit as exc:
+        assert str(exc) == "checkpoint 'Missing' not found"
+    else:
+        raise AssertionError("Expected SystemExit for unknown checkpoint")
+
+
+def test_cli_checkpoint_restore_merge_and_replace(
+    tmp_path, capsys, monkeypatch
+) -> None:
+    session_file = tmp_path / "session.json"
+    checkpoint_store_class = cli_module.CheckpointStore
+    monkeypatch.setattr(
+        cli_module,
+        "CheckpointStore",
+        lambda **options: checkpoint_store_class(tmp_path / "checkpoints", **options),
+    )
+    main(["checkpoint", "create", "Start", "--session-file", str(session_file)])
+    main(
+        ["session", "--session-file", str(session_file)],
+        input_fn=iter(["correct", "quit"]).__next__,
+    )
+    capsys.readouterr()
+
+    main(["checkpoint", "restore", "Start", "--session-file", str(session_file)])
+    merged = json.loads(session_file.read_text(encoding="utf-8"))
+    main(
+        [
+            "checkpoint",
+            "restore",
+            "Start",
+            "--session-file",
+            str(session_file),
+            "--restore-mode",
+            "replace",
+        ]
+    )
+    replaced = json.loads(session_file.read_text(encoding="utf-8"))
+
+    output = capsys.readouterr().out.splitlines()
+    assert output[0].startswith("Restored checkpoint 'Start' (merge; ")
+    assert output[1] == "Restored checkpoint 'Start' (replace; 2 items, 0 attempts)."
+    assert len(merged["attempts"]) == 1
+    assert replaced["attempts"] == []
+    assert all(item["status"] == "new" for item in replaced["items"])
+
+
+def test_cli_checkpoint_prune(tmp_path, capsys, monkeypatch) -> None:
+    session_file = tmp_path / "session.json"
+    checkpoint_store_class = cli_module.CheckpointStore
+    monkeypatch.setattr(
+        cli_module,
+        "CheckpointStore",
+        lambda **options: checkpoint_store_class(tmp_path / "checkpoints", **options),
+    )
+    for name in ("One", "Two"):
+        main(["checkpoint", "create", name, "--session-file", str(session_file)])
+    main(
+        [
+            "checkpoint",
+            "create",
+            "Three",
+            "--session-file",
+            str(session_file),
+            "--keep-last",
+            "2",
+        ]
+    )
+    capsys.readouterr()
+
+    main(["checkpoint", "prune", "--keep-last", "1", "--dry-run"])
+    main(["checkpoint", "list"])
+
+    output = capsys.readouterr().out.splitlines()
+    assert output[0] == "Would prune 1 checkpoints."
+    assert output[1].startswith("- Two (")
+    assert output[2] == "Checkpoints (2):"
+
+    try:
+        main(["checkpoint", "prune"])
+    except SystemExit as exc:
+        assert str(exc).startswith("checkpoint prune requires --keep-last")
+    else:
+        raise AssertionError("Expected SystemExit for prune without a policy")
+
+
+def test_cli_checkpoint_verify(tmp_path, capsys, monkeypatch) -> None:
+    session_file = tmp_path / "session.json"
+    checkpoint_dir = tmp_path / "checkpoints"
+    checkpoint_store_class = cli_module.CheckpointStore
+    monkeypatch.setattr(
+        cli_module,
+        "CheckpointStore",
+        lambda **options: checkpoint_store_class(checkpoint_dir, **options),
+    )
+    for name in ("One", "Two"):
+        main(["checkpoint", "create", name, "--session-file", str(session_file)])
+    capsys.readouterr()
+
+    main(["checkpoint", "verify", "--all"])
+
+    output = capsys.readouterr().out.splitlines()
+    assert output[0].startswith("OK   One: ")
+    assert output[1].startswith("OK   Two: ")
+    assert output[2] == "Verified 2 checkpoints."
+
+    (checkpoint_dir / "two.checkpoint.json").write_text("{not json")
+    try:
+        main(["checkpoint", "verify", "Two"])
+    except SystemExit as exc:
+        assert str(exc) == "1 of 1 checkpoints failed verification"
+    else:
+        raise AssertionError("Expected SystemExit for a corrupt checkpoint")
+    assert capsys.readouterr().out.startswith("FAIL Two: ")
+
+    with pytest.raises(SystemExit, match="1 of 2 checkpoints failed verification"):
+        main(["checkpoint", "verify", "--all"])
+    output = capsys.readouterr().out.splitlines()
+    assert output[0].startswith("OK   One: ")
+    assert output[1].startswith("FAIL two: ")
+
+
 def test_cli_checkpoint_create_fails_on_slug_collision(
     tmp_path, capsys, monkeypatch
 ) -> None:
@@ -142,7 +598,7 @@ def test_cli_checkpoint_create_fails_on_slug_collision(
     monkeypatch.setattr(
         cli_module,
         "CheckpointStore",
-        lambda: checkpoint_store_class(checkpoint_dir),
+        lambda **options: checkpoint_store_class(checkpoint_dir, **options),
     )
 
     main(["checkpoint", "create", "Week 1", "--session-file", str(session_file)])
@@ -184,7 +640,7 @@ def test_cli_checkpoint_create_fails_on_existing_name(
     monkeypatch.setattr(
         cli_module,
         "CheckpointStore",
-        lambda: checkpoint_store_class(checkpoint_dir),
+        lambda **options: checkpoint_store_class(checkpoint_dir, **options),
     )
 
     main(
@@ -216,3 +672,72 @@ def test_cli_checkpoint_create_fails_on_existing_name(
         )
     else:
         raise AssertionError("Expected SystemExit for duplicate checkpoint name")
+
+
+def test_cli_session_commit_every_batches_rounds(tmp_path, capsys) -> None:
+    session_file = tmp_path / "session.json"
+    choices = iter(["correct", "correct"])
+
+    main(
+        ["session", "--session-file", str(session_file), "--commit-every", "5"],
+        input_fn=lambda: next(choices),
+    )
+
+    output = capsys.readouterr().out
+    assert "Session complete." in output
+    session_payload = json.loads(session_file.read_text(encoding="utf-8"))
+    assert len(session_payload["attempts"]) == 2
+    assert {item["status"] for item in session_payload["items"]} == {"review"}
+
+
+def test_cli_session_db_persists_practice_state(tmp_path, capsys) -> None:
+    session_db = tmp_path / "session.db"
+
+    choices = iter(["correct", "quit"])
+    main(["session", "--session-db", str(session_db)], input_fn=lambda: next(choices))
+    choices = iter(["correct", "quit"])
+    main(["session", "--session-db", str(session_db)], input_fn=lambda: next(choices))
+
+    output = capsys.readouterr().out
+    assert "Recorded: correct for variables-review." in output
+    assert "Recorded: correct for loops-review." in output
+
+
+def test_cli_progress_db_resumes_progress(tmp_path, capsys) -> None:
+    """CLI should persist progress and resume from it with --progress-db."""
+    progress_db = tmp_path / "progress.db"
+
+    choices = iter(["1", "0"])
+    main(["--progress-db", str(progress_db)], input_fn=lambda: next(choices))
+    first_output = capsys.readouterr().out
+
+    choices = iter(["1", "0"])
+    main(["--progress-db", str(progress_db)], input_fn=lambda: next(choices))
+    second_output = capsys.readouterr().out
+
+    assert "Completed lesson: Variables" in first_output
+    assert "Completed lesson: Loops" in second_output
+
+
+def test_cli_migrate_progress_moves_users_to_progress_dir(tmp_path, capsys) -> None:
+    """migrate-progress should make --progress-dir resume existing progress."""
+    progress_file = tmp_path / "progress.json"
+    progress_dir = tmp_path / "progress"
+
+    choices = iter(["1", "0"])
+    main(["--progress-file", str(progress_file)], input_fn=lambda: next(choices))
+    main(
+        [
+            "migrate-progress",
+            "--progress-file",
+            str(progress_file),
+            "--progress-dir",
+            str(progress_dir),
+        ]
+    )
+    choices = iter(["1", "0"])
+    main(["--progress-dir", str(progress_dir)], input_fn=lambda: next(choices))
+
+    output = capsys.readouterr().out
+    assert "Migrated progress for 1 users" in output
+    assert "Completed lesson: Loops" in output
@@ -0,0 +1,99 @@
+"""Unit tests for the heap-backed practice due queue."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+
+from python_learning_orchestrated.domain.due_queue import DueQueue
+from python_learning_orchestrated.domain.practice import (
+    AttemptOutcome,
+    ItemStatus,
+    LearningItem,
+    select_next_item,
+    update_schedule,
+)
+
+FIXED_NOW = datetime(2025, 1, 1, 9, 0, 0)
+
+
+def test_due_queue_prefers_earliest_due_review_then_new_order() -> None:
+    queue = DueQueue(
+        [
+            LearningItem(id="new-2", prompt="N2", status="new", order=2),
+            LearningItem(id="new-1", prompt="N1", status="new", order=1),
+            LearningItem(
+                id="review-b",
+                prompt="B",
+                status="review",
+                order=9,
+                due_at=FIXED_NOW - timedelta(minutes=5),
+            ),
+            LearningItem(
+                id="review-a",
+                prompt="A",
+                status="review",
+                order=9,
+                due_at=FIXED_NOW - timedelta(minutes=5),
+            ),
+            LearningItem(
+                id="review-later",
+                prompt="L",
+                status="review",
+                order=0,
+                due_at=FIXED_NOW + timedelta(days=1),
+            ),
+        ]
+    )
+
+    popped = [queue.pop_next(FIXED_NOW) for _ in range(5)]
+
+    assert [item.id if item else None for item in popped] == [
+        "review-a",
+        "review-b",
+        "new-1",
+        "new-2",
+        None,
+    ]
+    assert "review-later" in queue
+
+
+def test_due_queue_update_reorders_items() -> None:
+    item = LearningItem(id="new-1", prompt="N1", status="new", order=1)
+    other = LearningItem(id="new-2", prompt="N2", status="new", order=2)
+    queue = DueQueue([item, other])
+
+    queue.update(update_schedule(item, "correct", FIXED_NOW))
+
+    assert queue.peek_next(FIXED_NOW) == other
+    assert queue.peek_next(FIXED_NOW + timedelta(days=2)) == queue.get("new-1")
+
+
+def test_due_queue_matches_select_next_item_for_random_updates() -> None:
+    rng = random.Random(7)
+    statuses: list[ItemStatus] = ["new", "review"]
+    outcomes: list[AttemptOutcome] = ["correct", "incorrect", "skip"]
+    items = [
+        LearningItem(
+            id=f"item-{index:03d}",
+            prompt="p",
+            status=rng.choice(statuses),
+            order=rng.randint(0, 10),
+            due_at=FIXED_NOW + timedelta(minutes=rng.randint(-60, 60)),
+        )
+        for index in range(120)
+    ]
+    queue = DueQueue(items)
+    by_id = {item.id: item for item in items}
+    now = FIXED_NOW
+
+    for _ in range(400):
+        expected = select_next_item(list(by_id.values()), now)
+        assert queue.peek_next(now) == expected
+        if expected is None:
+            break
+        outcome = rng.choice(outcomes)
+        updated = update_schedule(expected, outcome, now)
+        by_id[updated.id] = updated
+        queue.push(updated)
+        now += timedelta(minutes=rng.randint(0, 30))
@@ -0,0 +1,34 @@
+"""Tests for bounded-memory stream sorting."""
+
+from __future__ import annotations
+
+import random
+from typing import NoReturn
+
+from python_learning_orchestrated.adapters.external_sort import iter_sorted
+
+
+def test_iter_sorted_merges_spilled_runs_stably() -> None:
+    rng = random.Random(7)
+    records = [{"key": rng.randrange(50), "seq": seq} for seq in range(1000)]
+
+    result = list(
+        iter_sorted(
+            records,
+            lambda record: record["key"],
+            encode=lambda record: record,
+            decode=lambda payload: payload,
+            run_size=64,
+        )
+    )
+
+    assert result == sorted(records, key=lambda record: record["key"])
+
+
+def test_iter_sorted_keeps_short_input_in_memory() -> None:
+    def fail(_value: object) -> NoReturn:
+        raise AssertionError("short input was spilled")
+
+    assert list(
+        iter_sorted([3, 1, 2], lambda value: value, encode=fail, decode=fail)
+    ) == [1, 2, 3]
@@ -1,17 +1,264 @@
-from python_learning_orchestrated.adapters.json_file_practice_repository import _to_int
+import json
+from datetime import datetime
+
+import pytest
+
+from python_learning_orchestrated.adapters.json_file_practice_repository import (
+    JsonFilePracticeRepository,
+)
+from python_learning_orchestrated.adapters.snapshot_codec import to_int
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 
 
 def test_to_int_with_valid_string_returns_int():
-    assert _to_int("123", 42) == 123
+    assert to_int("123", 42) == 123
 
 
 def test_to_int_with_invalid_string_returns_default():
-    assert _to_int("abc", 42) == 42
+    assert to_int("abc", 42) == 42
 
 
 def test_to_int_with_integer_returns_integer():
-    assert _to_int(123, 42) == 123
+    assert to_int(123, 42) == 123
 
 
 def test_to_int_with_none_returns_default():
-    assert _to_int(None, 42) == 42
+    assert to_int(None, 42) == 42
+
+
+def test_apply_changes_writes_items_and_attempts_once(tmp_path, monkeypatch):
+    repository = JsonFilePracticeRepository(
+        tmp_path / "session.json",
+        [LearningItem(id="a", prompt="A", status="new", order=1)],
+    )
+    writes = []
+    save_storage = repository._save_storage
+    monkeypatch.setattr(
+        repository,
+        "_save_storage",
+        lambda storage: writes.append(storage) or save_storage(storage),
+    )
+    now = datetime(2025, 1, 1, 9, 0, 0)
+
+    with repository.begin() as unit_of_work:
+        unit_of_work.stage_attempt(Attempt(item_id="a", timestamp=now, outcome="skip"))
+        unit_of_work.stage_item(
+            LearningItem(id="a", prompt="A", status="review", order=1, due_at=now)
+        )
+
+    assert len(writes) == 1
+    assert repository.list_items()[0].due_at == now
+    assert repository.list_attempts() == [
+        Attempt(item_id="a", timestamp=now, outcome="skip")
+    ]
+
+
+def test_unit_of_work_discards_changes_on_error(tmp_path):
+    repository = JsonFilePracticeRepository(tmp_path / "session.json", [])
+    now = datetime(2025, 1, 1, 9, 0, 0)
+
+    try:
+        with repository.begin() as unit_of_work:
+            unit_of_work.stage_attempt(
+                Attempt(item_id="a", timestamp=now, outcome="skip")
+            )
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    assert repository.list_attempts() == []
+
+
+def test_unit_of_work_keeps_changes_when_commit_fails(tmp_path, monkeypatch):
+    repository = JsonFilePracticeRepository(tmp_path / "session.json", [])
+    attempt = Attempt(
+        item_id="a", timestamp=datetime(2025, 1, 1, 9, 0, 0), outcome="skip"
+    )
+    save_storage = repository._save_storage
+
+    def fail_once(storage: dict[str, object]) -> None:
+        monkeypatch.setattr(repository, "_save_storage", save_storage)
+        raise OSError("disk full")
+
+    monkeypatch.setattr(repository, "_save_storage", fail_once)
+    unit_of_work = repository.begin()
+    unit_of_work.stage_attempt(attempt)
+
+    with pytest.raises(OSError, match="disk full"):
+        unit_of_work.commit()
+    assert unit_of_work.has_changes
+
+    unit_of_work.commit()
+
+    assert not unit_of_work.has_changes
+    assert repository.list_attempts() == [attempt]
+
+
+def test_attempts_log_appends_lines_and_keeps_document_compact(tmp_path):
+    session_file = tmp_path / "session.json"
+    attempts_log = tmp_path / "attempts.jsonl"
+    repository = JsonFilePracticeRepository(
+        session_file,
+        [LearningItem(id="a", prompt="A", status="new", order=1)],
+        attempts_log=attempts_log,
+    )
+    first = Attempt(
+        item_id="a", timestamp=datetime(2025, 1, 1, 9, 0, 0), outcome="correct"
+    )
+    second = Attempt(
+        item_id="a", timestamp=datetime(2025, 1, 1, 9, 5, 0), outcome="skip"
+    )
+
+    repository.record_attempt(first)
+    repository.record_attempt(second)
+
+    assert json.loads(session_file.read_text(encoding="utf-8")) == {
+        "items": [
+            {
+                "id": "a",
+                "prompt": "A",
+                "status": "new",
+                "order": 1,
+                "due_at": None,
+                "review_level": 0,
+                "interval_minutes": 0,
+            }
+        ]
+    }
+    assert len(attempts_log.read_text(encoding="utf-8").splitlines()) == 2
+    assert repository.list_attempts() == [first, second]
+
+
+def test_attempts_log_skips_torn_lines_and_keeps_appending(tmp_path):
+    attempts_log = tmp_path / "attempts.jsonl"
+    attempts_log.write_text(
+        '{"item_id": "a", "timestamp": "2025-01-01T09:00:00", "outcome": "correct"}\n'
+        '{"item_id": "a", "timest',
+        encoding="utf-8",
+    )
+    repository = JsonFilePracticeRepository(
+        tmp_path / "session.json", [], attempts_log=attempts_log
+    )
+    later = Attempt(
+        item_id="b", timestamp=datetime(2025, 1, 2, 9, 0, 0), outcome="incorrect"
+    )
+
+    repository.record_attempt(later)
+
+    attempts = repository.iter_attempts()
+    assert next(attempts).item_id == "a"
+    assert list(attempts) == [later]
+
+
+def test_attempts_log_migrates_single_file_layout_once(tmp_path):
+    session_file = tmp_path / "session.json"
+    attempts_log = tmp_path / "attempts.jsonl"
+    legacy = JsonFilePracticeRepository(
+        session_file, [LearningItem(id="a", prompt="A", status="new", order=1)]
+    )
+    attempt = Attempt(
+        item_id="a", timestamp=datetime(2025, 1, 1, 9, 0, 0), outcome="correct"
+    )
+    legacy.record_attempt(attempt)
+    legacy_document = json.loads(session_file.read_text(encoding="utf-8"))
+    attempts_log.write_text(
+        json.dumps(legacy_document["attempts"][0]) + "\n", encoding="utf-8"
+    )
+
+    migrated = JsonFilePracticeRepository(session_file, [], attempts_log=attempts_log)
+    reopened = JsonFilePracticeRepository(session_file, [], attempts_log=attempts_log)
+
+    assert "attempts" not in json.loads(session_file.read_text(encoding="utf-8"))
+    assert migrated.list_items() == legacy.list_items()
+    assert reopened.list_attempts() == [attempt]
+
+
+def test_upgrade_schema_rewrites_timestamps_as_epoch_micros(tmp_path):
+    session_file = tmp_path / "session.json"
+    attempts_log = tmp_path / "attempts.jsonl"
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    item = LearningItem(id="a", prompt="A", status="review", order=1, due_at=now)
+    repository = JsonFilePracticeRepository(
+        session_file, [item], attempts_log=attempts_log
+    )
+    first = Attempt(item_id="a", timestamp=now, outcome="correct")
+    repository.record_attempt(first)
+
+    repository.upgrade_schema()
+    second = Attempt(item_id="a", timestamp=now.replace(minute=5), outcome="skip")
+    repository.record_attempt(second)
+
+    document = json.loads(session_file.read_text(encoding="utf-8"))
+    log_entries = [json.loads(line) for line in attempts_log.read_text().splitlines()]
+    assert document["schema_version"] == 2
+    assert document["items"][0]["due_at"] == 1_735_722_000_000_000
+    assert [entry["timestamp"] for entry in log_entries] == [
+        1_735_722_000_000_000,
+        1_735_722_300_000_000,
+    ]
+    reopened = JsonFilePracticeRepository(session_file, [], attempts_log=attempts_log)
+    assert reopened.list_items() == [item]
+    assert reopened.list_attempts() == [first, second]
+
+
+def test_replace_contents_writes_each_file_once(tmp_path, monkeypatch):
+    session_file = tmp_path / "session.json"
+    attempts_log = tmp_path / "attempts.jsonl"
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    repository = JsonFilePracticeRepository(
+        session_file,
+        [LearningItem(id="a", prompt="A", status="new", order=1)],
+        attempts_log=attempts_log,
+    )
+    repository.record_attempt(Attempt(item_id="a", timestamp=now, outcome="skip"))
+    repository.upgrade_schema()
+    writes = []
+    write_storage = repository._write_storage
+    monkeypatch.setattr(
+        repository,
+        "_write_storage",
+        lambda storage: writes.append(storage) or write_storage(storage),
+    )
+    item = LearningItem(id="b", prompt="B", status="review", order=1, due_at=now)
+    attempt = Attempt(item_id="b", timestamp=now, outcome="correct")
+
+    repository.replace_contents([item], iter([attempt]))
+
+    assert len(writes) == 1
+    assert writes[0]["schema_version"] == 2
+    reopened = JsonFilePracticeRepository(session_file, [], attempts_log=attempts_log)
+    assert reopened.list_items() == [item]
+    assert reopened.list_attempts() == [attempt]
+
+
+def test_replace_contents_renames_nothing_when_a_write_fails(tmp_path, monkeypatch):
+    session_file = tmp_path / "session.json"
+    attempts_log = tmp_path / "attempts.jsonl"
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    repository = JsonFilePracticeRepository(
+        session_file,
+        [LearningItem(id="a", prompt="A", status="new", order=1)],
+        attempts_log=attempts_log,
+    )
+    repository.record_attempt(Attempt(item_id="a", timestamp=now, outcome="skip"))
+    document_before = session_file.read_bytes()
+    log_before = attempts_log.read_bytes()
+
+    def fail_document_write(storage):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(repository, "_write_storage", fail_document_write)
+    replacement = Attempt(item_id="b", timestamp=now, outcome="correct")
+
+    with pytest.raises(OSError, match="disk full"):
+        repository.replace_contents(
+            [LearningItem(id="b", prompt="B", status="new", order=1)],
+            iter([replacement]),
+        )
+
+    assert session_file.read_bytes() == document_before
+    assert attempts_log.read_bytes() == log_before
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "attempts.jsonl",
+        "session.json",
+    ]
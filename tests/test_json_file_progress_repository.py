@@ -69,3 +69,17 @@ def test_reset_progress_removes_only_target_user(tmp_path) -> None:
 
     assert repository.get_progress("user-1") == {}
     assert repository.get_progress("user-2") == {"completed_lessons": ["lesson-2"]}
+
+
+def test_apply_changes_saves_and_resets_users_in_one_document(tmp_path) -> None:
+    """Batched changes should save and reset several users together."""
+    progress_file = tmp_path / "progress.json"
+    repository = JsonFileProgressRepository(progress_file)
+    repository.save_progress("user-1", {"completed_lessons": ["lesson-1"]})
+
+    repository.apply_changes(
+        {"user-1": None, "user-2": {"completed_lessons": ["lesson-2"]}}
+    )
+
+    parsed = json.loads(progress_file.read_text(encoding="utf-8"))
+    assert parsed == {"user-2": {"completed_lessons": ["lesson-2"]}}
@@ -2,23 +2,171 @@
 
 from __future__ import annotations
 
+import json
+from datetime import datetime
+
+import pytest
+
 from python_learning_orchestrated.adapters.json_file_progress_snapshot_store import (
-    _to_int,
+    JsonFileProgressSnapshotStore,
 )
+from python_learning_orchestrated.adapters.snapshot_codec import to_int
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
 
 
 def test_to_int_with_valid_int() -> None:
-    assert _to_int(42, default=0) == 42
+    assert to_int(42, default=0) == 42
 
 
 def test_to_int_with_valid_string() -> None:
-    assert _to_int("42", default=0) == 42
+    assert to_int("42", default=0) == 42
 
 
 def test_to_int_with_invalid_string_raises_value_error_returns_default() -> None:
-    assert _to_int("not_an_int", default=10) == 10
+    assert to_int("not_an_int", default=10) == 10
 
 
 def test_to_int_with_invalid_type_returns_default() -> None:
-    assert _to_int(None, default=5) == 5
-    assert _to_int(["42"], default=5) == 5
+    assert to_int(None, default=5) == 5
+    assert to_int(["42"], default=5) == 5
+
+
+def test_iter_records_streams_items_and_attempts(tmp_path) -> None:
+    snapshot_file = tmp_path / "snapshot.json"
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    snapshot = ProgressSnapshot(
+        version=1,
+        exported_at=now,
+        items=[LearningItem(id="item-1", prompt="P", status="new", order=1)],
+        attempts=[Attempt(item_id="item-1", timestamp=now, outcome="correct")],
+    )
+    store = JsonFileProgressSnapshotStore(snapshot_file, max_bytes=1)
+    store.save(snapshot)
+
+    assert list(store.iter_records()) == [*snapshot.items, *snapshot.attempts]
+    with pytest.raises(ValueError, match="exceeds 1 byte size limit"):
+        JsonFileProgressSnapshotStore(snapshot_file, max_bytes=1).load()
+    assert JsonFileProgressSnapshotStore(snapshot_file, max_bytes=None).load() == (
+        snapshot
+    )
+
+
+def test_iter_records_rejects_malformed_json(tmp_path) -> None:
+    snapshot_file = tmp_path / "snapshot.json"
+    snapshot_file.write_text('{"items": [', encoding="utf-8")
+
+    with pytest.raises(ValueError, match="not valid JSON"):
+        list(JsonFileProgressSnapshotStore(snapshot_file).iter_records())
+
+
+def test_iter_records_rejects_unparseable_attempt_timestamps(tmp_path) -> None:
+    snapshot_file = tmp_path / "snapshot.json"
+    snapshot_file.write_text(
+        json.dumps(
+            {"attempts": [{"item_id": "a", "timestamp": "nope", "outcome": "skip"}]}
+        ),
+        encoding="utf-8",
+    )
+    store = JsonFileProgressSnapshotStore(snapshot_file)
+
+    with pytest.raises(ValueError, match="invalid timestamp 'nope'"):
+        list(store.iter_records())
+    with pytest.raises(ValueError, match="invalid timestamp 'nope'"):
+        store.load()
+
+
+def test_columnar_snapshot_is_detected_by_load_and_stream(tmp_path) -> None:
+    snapshot_file = tmp_path / "snapshot.json"
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    snapshot = ProgressSnapshot(
+        version=1,
+        exported_at=now,
+        items=[LearningItem(id="item-1", prompt="P", status="new", order=1)],
+        attempts=[Attempt(item_id="item-1", timestamp=now, outcome="correct")],
+    )
+    JsonFileProgressSnapshotStore(snapshot_file, columnar=True).save(snapshot)
+
+    reader = JsonFileProgressSnapshotStore(snapshot_file)
+
+    assert json.loads(snapshot_file.read_text(encoding="utf-8"))["layout"] == (
+        "columnar"
+    )
+    assert reader.load() == snapshot
+    assert reader.load_streamed() == snapshot
+    assert list(reader.iter_records()) == [*snapshot.items, *snapshot.attempts]
+
+
+def test_key_sorted_columnar_snapshot_streams_as_columns(tmp_path) -> None:
+    snapshot_file = tmp_path / "snapshot.json"
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    snapshot = ProgressSnapshot(
+        version=1,
+        exported_at=now,
+        items=[
+            LearningItem(id="item-1", prompt="P", status="new", order=1),
+            LearningItem(id="item-2", prompt="Q", status="review", order=2),
+        ],
+        attempts=[
+            Attempt(item_id="item-1", timestamp=now, outcome="correct"),
+            Attempt(item_id="item-2", timestamp=now, outcome="skip"),
+        ],
+    )
+    JsonFileProgressSnapshotStore(snapshot_file, columnar=True).save(snapshot)
+    payload = json.loads(snapshot_file.read_text(encoding="utf-8"))
+    snapshot_file.write_text(json.dumps(payload, sort_keys=True), encoding="utf-8")
+
+    reader = JsonFileProgressSnapshotStore(snapshot_file)
+
+    assert snapshot_file.read_text(encoding="utf-8").index('"layout"') > (
+        snapshot_file.read_text(encoding="utf-8").index('"items"')
+    )
+    assert reader.load() == snapshot
+    assert reader.load_streamed() == snapshot
+    # Sorted keys put the attempts section first.
+    assert list(reader.iter_records()) == [*snapshot.attempts, *snapshot.items]
+
+
+@pytest.mark.parametrize(
+    ("suffix", "magic"),
+    [(".gz", b"\x1f\x8b"), (".bz2", b"BZh"), (".xz", b"\xfd7zXZ"), (".lzma", b"]")],
+)
+def test_compressed_snapshot_round_trip(tmp_path, suffix: str, magic: bytes) -> None:
+    snapshot_file = tmp_path / f"snapshot.json{suffix}"
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    snapshot = ProgressSnapshot(
+        version=1,
+        exported_at=now,
+        items=[LearningItem(id="item-1", prompt="P", status="new", order=1)],
+        attempts=[Attempt(item_id="item-1", timestamp=now, outcome="correct")],
+    )
+    JsonFileProgressSnapshotStore(snapshot_file).save(snapshot)
+
+    reader = JsonFileProgressSnapshotStore(snapshot_file)
+
+    assert snapshot_file.read_bytes().startswith(magic)
+    assert reader.load() == snapshot
+    assert list(reader.iter_records()) == [*snapshot.items, *snapshot.attempts]
+
+
+def test_compressed_snapshot_load_limits_decompressed_size(tmp_path) -> None:
+    snapshot_file = tmp_path / "snapshot.json.gz"
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    snapshot = ProgressSnapshot(
+        version=1,
+        exported_at=now,
+        items=[
+            LearningItem(id=f"item-{index}", prompt="P" * 100, status="new", order=1)
+            for index in range(100)
+        ],
+        attempts=[],
+    )
+    JsonFileProgressSnapshotStore(snapshot_file, max_bytes=None).save(snapshot)
+    limit = snapshot_file.stat().st_size + 1
+
+    with pytest.raises(ValueError, match="size limit"):
+        JsonFileProgressSnapshotStore(snapshot_file, max_bytes=limit).load()
+    assert (
+        JsonFileProgressSnapshotStore(snapshot_file, max_bytes=limit).load_streamed()
+        == snapshot
+    )
@@ -0,0 +1,50 @@
+"""Tests for the incremental JSON object tokenizer."""
+
+from __future__ import annotations
+
+import io
+import json
+
+import pytest
+
+from python_learning_orchestrated.adapters.json_stream import iter_object_members
+
+DOCUMENT = {
+    "version": 12345,
+    "exported_at": "2025-01-01T09:00:00",
+    "items": [{"id": "a", "order": 1}, {"id": "b", "nested": [1, {"x": "]"}]}],
+    "meta": {"items": [1, 2]},
+    "attempts": [],
+    "tail": -0.5e3,
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64 * 1024])
+def test_iter_object_members_streams_selected_arrays(chunk_size: int) -> None:
+    source = io.StringIO(json.dumps(DOCUMENT, indent=2))
+
+    members = list(
+        iter_object_members(
+            source, stream_keys=("items", "attempts"), chunk_size=chunk_size
+        )
+    )
+
+    assert members == [
+        ("version", 12345),
+        ("exported_at", "2025-01-01T09:00:00"),
+        ("items", {"id": "a", "order": 1}),
+        ("items", {"id": "b", "nested": [1, {"x": "]"}]}),
+        ("meta", {"items": [1, 2]}),
+        ("tail", -500.0),
+    ]
+
+
+def test_iter_object_members_handles_empty_object() -> None:
+    assert list(iter_object_members(io.StringIO(" { } "))) == []
+
+
+def test_iter_object_members_rejects_truncated_documents() -> None:
+    source = io.StringIO('{"items": [{"id": "a"}, {"id"')
+
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_object_members(source, stream_keys=("items",), chunk_size=4))
@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import random
+from datetime import UTC, datetime, timedelta
+
+import pytest
 
 from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 from python_learning_orchestrated.domain.practice_progress import (
     ProgressSnapshot,
+    attempt_order_key,
+    canonical_snapshot,
+    combine_snapshots,
+    iter_merged_attempts,
     merge_progress,
 )
 
@@ -104,3 +111,91 @@ def test_merge_progress_prefers_more_meaningful_item_progress_and_unions_attempt
         ("a", now),
         ("a", now + timedelta(minutes=5)),
     }
+
+
+def test_streaming_merge_matches_merge_progress() -> None:
+    rng = random.Random(7)
+    start = datetime(2025, 1, 1, 9, 0, 0)
+
+    def random_attempts(count: int) -> list[Attempt]:
+        return [
+            Attempt(
+                item_id=f"item-{rng.randint(0, 5)}",
+                timestamp=start + timedelta(minutes=rng.randint(0, 60)),
+                outcome=rng.choice(["correct", "incorrect"]),
+            )
+            for _ in range(count)
+        ]
+
+    for _ in range(50):
+        current_attempts, imported_attempts = random_attempts(80), random_attempts(80)
+        _, expected_attempts = merge_progress(
+            [],
+            current_attempts,
+            ProgressSnapshot(
+                version=1,
+                exported_at=start,
+                items=[],
+                attempts=imported_attempts,
+            ),
+        )
+
+        merged_attempts = iter_merged_attempts(
+            sorted(current_attempts, key=attempt_order_key),
+            sorted(imported_attempts, key=attempt_order_key),
+        )
+
+        assert list(merged_attempts) == expected_attempts
+
+
+def test_streaming_merge_is_lazy_and_rejects_unsorted_input() -> None:
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    attempts = (
+        Attempt(item_id="a", timestamp=start + timedelta(seconds=index), outcome="skip")
+        for index in range(1_000_000_000)
+    )
+
+    merged = iter_merged_attempts(attempts, [])
+
+    assert next(merged).timestamp == start
+
+    unsorted = [
+        Attempt(item_id="a", timestamp=start + timedelta(minutes=1), outcome="skip"),
+        Attempt(item_id="a", timestamp=start, outcome="skip"),
+    ]
+    with pytest.raises(ValueError, match="not sorted"):
+        list(iter_merged_attempts([], unsorted))
+
+
+def test_combine_snapshots_mixes_naive_and_aware_timestamps() -> None:
+    naive = datetime(2025, 1, 1, 9, 0, 0)
+    aware = datetime(2025, 1, 1, 10, 0, 0, tzinfo=UTC)
+    first = ProgressSnapshot(
+        version=1,
+        exported_at=aware,
+        items=[],
+        attempts=[
+            Attempt(item_id="a", timestamp=aware, outcome="correct"),
+            Attempt(item_id="a", timestamp=naive, outcome="correct"),
+        ],
+    )
+    second = ProgressSnapshot(
+        version=1,
+        exported_at=naive + timedelta(hours=2),
+        items=[],
+        attempts=[
+            Attempt(
+                item_id="a", timestamp=naive + timedelta(minutes=30), outcome="skip"
+            ),
+            Attempt(item_id="a", timestamp=naive + timedelta(hours=1), outcome="skip"),
+        ],
+    )
+
+    combined = combine_snapshots(canonical_snapshot(first), canonical_snapshot(second))
+
+    assert combined.exported_at == naive + timedelta(hours=2)
+    assert [(entry.timestamp, entry.outcome) for entry in combined.attempts] == [
+        (naive, "correct"),
+        (naive + timedelta(minutes=30), "skip"),
+        (aware, "correct"),
+    ]
@@ -8,8 +8,11 @@ from datetime import datetime, timedelta
 from python_learning_orchestrated.adapters.in_memory_practice_repository import (
     InMemoryPracticeRepository,
 )
-from python_learning_orchestrated.application.practice_session import RunPracticeSession
-from python_learning_orchestrated.domain.practice import LearningItem
+from python_learning_orchestrated.application.practice_session import (
+    CommitPolicy,
+    RunPracticeSession,
+)
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
 from python_learning_orchestrated.ports.session_io import SessionIO
 
 
@@ -75,3 +78,112 @@ def test_run_practice_session_prefers_due_then_new_and_persists_attempts() -> No
     assert items_by_id["new-1"].status == "new"
     assert "Activity review-1: due review" in io.lines
     assert "Activity new-1: first new" in io.lines
+
+
+class CountingPracticeRepository(InMemoryPracticeRepository):
+    def __init__(self, items: list[LearningItem]) -> None:
+        super().__init__(items)
+        self.list_items_calls = 0
+
+    def list_items(self) -> list[LearningItem]:
+        self.list_items_calls += 1
+        return super().list_items()
+
+
+def test_run_practice_session_loads_items_once_and_tracks_updates() -> None:
+    fixed_now = datetime(2025, 1, 1, 12, 0, 0)
+    repository = CountingPracticeRepository(
+        [
+            LearningItem(id="new-1", prompt="first new", status="new", order=1),
+            LearningItem(id="new-2", prompt="second new", status="new", order=2),
+        ]
+    )
+    io = FakeSessionIO(["incorrect", "correct"])
+
+    session = RunPracticeSession(
+        repository=repository,
+        io=io,
+        now_provider=lambda: fixed_now + timedelta(minutes=len(io.lines)),
+    )
+
+    session.run()
+
+    assert repository.list_items_calls == 1
+    assert [attempt.item_id for attempt in repository.list_attempts()] == [
+        "new-1",
+        "new-2",
+    ]
+    items_by_id = {item.id: item for item in repository.list_items()}
+    assert items_by_id["new-1"].status == "review"
+    assert items_by_id["new-2"].review_level == 1
+    assert io.lines[-1] == "No due review or new items available. Session complete."
+
+
+class CommitCountingPracticeRepository(InMemoryPracticeRepository):
+    def __init__(self, items: list[LearningItem]) -> None:
+        super().__init__(items)
+        self.commits: list[tuple[int, int]] = []
+
+    def apply_changes(self, items: list[LearningItem], attempts: list[Attempt]) -> None:
+        self.commits.append((len(items), len(attempts)))
+        super().apply_changes(items, attempts)
+
+
+def test_run_practice_session_commits_one_write_per_round_by_default() -> None:
+    fixed_now = datetime(2025, 1, 1, 12, 0, 0)
+    repository = CommitCountingPracticeRepository(
+        [
+            LearningItem(id="new-1", prompt="first new", status="new", order=1),
+            LearningItem(id="new-2", prompt="second new", status="new", order=2),
+        ]
+    )
+    io = FakeSessionIO(["correct", "correct"])
+
+    RunPracticeSession(
+        repository=repository, io=io, now_provider=lambda: fixed_now
+    ).run()
+
+    assert repository.commits == [(1, 1), (1, 1)]
+
+
+def test_run_practice_session_batches_rounds_with_commit_policy() -> None:
+    fixed_now = datetime(2025, 1, 1, 12, 0, 0)
+    repository = CommitCountingPracticeRepository(
+        [
+            LearningItem(id=f"new-{index}", prompt="p", status="new", order=index)
+            for index in range(5)
+        ]
+    )
+    io = FakeSessionIO(["correct", "skip", "correct", "correct", "quit"])
+
+    RunPracticeSession(
+        repository=repository,
+        io=io,
+        now_provider=lambda: fixed_now,
+        commit_policy=CommitPolicy(every_rounds=3),
+    ).run()
+
+    assert repository.commits == [(2, 3), (1, 1)]
+    assert len(repository.list_attempts()) == 4
+
+
+def test_run_practice_session_commits_when_interval_elapses() -> None:
+    fixed_now = datetime(2025, 1, 1, 12, 0, 0)
+    repository = CommitCountingPracticeRepository(
+        [
+            LearningItem(id=f"new-{index}", prompt="p", status="new", order=index)
+            for index in range(3)
+        ]
+    )
+    io = FakeSessionIO(["correct", "correct", "correct"])
+    ticks = iter([0.0, 1.0, 6.0, 6.5, 7.0])
+
+    RunPracticeSession(
+        repository=repository,
+        io=io,
+        now_provider=lambda: fixed_now,
+        commit_policy=CommitPolicy(every_rounds=100, every_seconds=5.0),
+        clock=lambda: next(ticks),
+    ).run()
+
+    assert repository.commits == [(2, 2), (1, 1)]
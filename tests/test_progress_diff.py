@@ -0,0 +1,45 @@
+"""Tests for streaming progress comparison."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.progress_diff import (
+    AttemptChange,
+    ItemChange,
+    diff_attempts,
+    diff_items,
+)
+
+
+def test_diff_items_reports_added_removed_and_changed() -> None:
+    kept = LearningItem(id="a", prompt="A", status="new", order=1)
+    removed = LearningItem(id="b", prompt="B", status="new", order=2)
+    before_c = LearningItem(id="c", prompt="C", status="new", order=3)
+    after_c = LearningItem(id="c", prompt="C", status="review", order=3)
+    added = LearningItem(id="d", prompt="D", status="new", order=4)
+
+    changes = list(diff_items([kept, removed, before_c], [kept, after_c, added]))
+
+    assert changes == [
+        ItemChange("removed", removed, None),
+        ItemChange("changed", before_c, after_c),
+        ItemChange("added", None, added),
+    ]
+
+
+def test_diff_attempts_pairs_by_timestamp_and_item_id() -> None:
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    first = Attempt(item_id="a", timestamp=start, outcome="correct")
+    second = Attempt(item_id="b", timestamp=start, outcome="skip")
+    retried = Attempt(item_id="b", timestamp=start, outcome="incorrect")
+    later = Attempt(item_id="a", timestamp=start + timedelta(minutes=1), outcome="skip")
+
+    changes = list(diff_attempts([first, second], [retried, later]))
+
+    assert changes == [
+        AttemptChange("removed", first, None),
+        AttemptChange("changed", second, retried),
+        AttemptChange("added", None, later),
+    ]
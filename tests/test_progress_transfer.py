@@ -2,16 +2,23 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta, timezone
 
 from python_learning_orchestrated.adapters.in_memory_practice_repository import (
     InMemoryPracticeRepository,
 )
+from python_learning_orchestrated.adapters.json_file_practice_repository import (
+    JsonFilePracticeRepository,
+)
 from python_learning_orchestrated.application.progress_transfer import (
     ExportProgress,
     ImportProgress,
+    ImportSummary,
+    ReplaceProgress,
 )
 from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
 
 
 def test_export_import_round_trip_with_in_memory_repository() -> None:
@@ -54,3 +61,201 @@ def test_export_import_round_trip_with_in_memory_repository() -> None:
         source.list_items(), key=lambda item: item.id
     )
     assert target.list_attempts() == source.list_attempts()
+
+
+def test_import_run_records_merges_stream_in_batches() -> None:
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    item = LearningItem(id="item-1", prompt="P", status="new", order=1)
+    progressed = LearningItem(
+        id="item-1",
+        prompt="P",
+        status="review",
+        order=1,
+        due_at=now + timedelta(days=1),
+        review_level=1,
+        interval_minutes=1440,
+    )
+    existing_attempt = Attempt(item_id="item-1", timestamp=now, outcome="skip")
+    target = InMemoryPracticeRepository([item])
+    target.record_attempt(existing_attempt)
+    batches: list[int] = []
+    record_attempts = target.record_attempts
+
+    def spy_record_attempts(attempts: list[Attempt]) -> None:
+        batches.append(len(attempts))
+        record_attempts(attempts)
+
+    target.record_attempts = spy_record_attempts  # type: ignore[method-assign]
+    records: list[LearningItem | Attempt] = [
+        progressed,
+        LearningItem(id="item-2", prompt="Q", status="new", order=2),
+        existing_attempt,
+        *(
+            Attempt(
+                item_id="item-1",
+                timestamp=now + timedelta(minutes=index),
+                outcome="correct",
+            )
+            for index in range(1, 6)
+        ),
+    ]
+
+    summary = ImportProgress(target, batch_size=2).run_records(iter(records))
+
+    assert summary == ImportSummary(
+        items_read=2,
+        attempts_read=6,
+        items_changed=2,
+        attempts_added=5,
+        total_items=2,
+        total_attempts=6,
+    )
+    assert batches == [2, 2, 1]
+    assert {item.id: item for item in target.list_items()}["item-1"] == progressed
+    assert len(target.list_attempts()) == 6
+
+    repeated = ImportProgress(target, batch_size=2).run_records(iter(records))
+
+    assert repeated.items_changed == 0
+    assert repeated.attempts_added == 0
+
+
+def test_import_run_records_writes_a_session_document_once(
+    tmp_path, monkeypatch
+) -> None:
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    item = LearningItem(id="item-1", prompt="P", status="new", order=1)
+    target = JsonFilePracticeRepository(tmp_path / "session.json", [item])
+    writes: list[dict[str, object]] = []
+    save_storage = target._save_storage
+
+    def spy_save_storage(storage: dict[str, object]) -> None:
+        writes.append(storage)
+        save_storage(storage)
+
+    monkeypatch.setattr(target, "_save_storage", spy_save_storage)
+    records: list[LearningItem | Attempt] = [
+        Attempt(
+            item_id="item-1", timestamp=now + timedelta(minutes=index), outcome="skip"
+        )
+        for index in range(5)
+    ]
+
+    summary = ImportProgress(target, batch_size=2).run_records(
+        iter([*records, replace(item, status="review", review_level=1)])
+    )
+
+    assert len(writes) == 1
+    assert summary.attempts_added == 5
+    assert summary.items_changed == 1
+    assert target.list_attempts() == records
+    assert target.list_items()[0].review_level == 1
+
+
+def test_export_delta_since_watermark_applies_cleanly() -> None:
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    items = [
+        LearningItem(id=f"item-{index}", prompt="P", status="new", order=index)
+        for index in range(3)
+    ]
+    source = InMemoryPracticeRepository(items)
+    source.record_attempt(Attempt(item_id="item-0", timestamp=start, outcome="correct"))
+    baseline = ExportProgress(source, now_provider=lambda: start).run()
+    target = InMemoryPracticeRepository([])
+    ImportProgress(target).run(baseline)
+
+    later = start + timedelta(hours=1)
+    source.record_attempt(Attempt(item_id="item-1", timestamp=later, outcome="skip"))
+    reviewed = LearningItem(
+        id="item-2", prompt="P", status="review", order=2, review_level=1
+    )
+    source.save_item(reviewed)
+    export = ExportProgress(source, now_provider=lambda: later)
+
+    by_time = export.run(since=start + timedelta(minutes=1))
+    by_baseline = export.run(baseline=baseline)
+
+    assert by_time.delta_since == start + timedelta(minutes=1)
+    assert [item.id for item in by_time.items] == ["item-1"]
+    assert [attempt.item_id for attempt in by_time.attempts] == ["item-1"]
+    assert by_baseline.delta_since == start
+    assert [item.id for item in by_baseline.items] == ["item-0", "item-1", "item-2"]
+    assert len(by_baseline.attempts) == 2
+
+    ImportProgress(target).run(by_baseline)
+
+    assert sorted(target.list_items(), key=lambda item: item.id) == sorted(
+        source.list_items(), key=lambda item: item.id
+    )
+    assert sorted(target.list_attempts(), key=lambda a: a.timestamp) == sorted(
+        source.list_attempts(), key=lambda a: a.timestamp
+    )
+
+
+def test_export_delta_compares_naive_attempts_with_an_aware_watermark() -> None:
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    source = InMemoryPracticeRepository(
+        [LearningItem(id="a", prompt="A", status="new", order=1)]
+    )
+    source.record_attempt(Attempt(item_id="a", timestamp=start, outcome="skip"))
+    source.record_attempt(
+        Attempt(item_id="a", timestamp=start + timedelta(hours=1), outcome="correct")
+    )
+    export = ExportProgress(source, now_provider=lambda: start)
+
+    delta = export.run(
+        since=datetime(2025, 1, 1, 11, 30, tzinfo=timezone(timedelta(hours=2)))
+    )
+
+    assert [attempt.outcome for attempt in delta.attempts] == ["correct"]
+    assert (
+        export.run(since=start.replace(tzinfo=UTC)).attempts == source.list_attempts()
+    )
+
+
+def test_import_matches_naive_and_aware_timestamps_by_instant() -> None:
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    item = LearningItem(id="a", prompt="A", status="new", order=1)
+    stored = Attempt(item_id="a", timestamp=now, outcome="correct")
+    imported = Attempt(
+        item_id="a",
+        timestamp=datetime(2025, 1, 1, 10, 0, tzinfo=timezone(timedelta(hours=1))),
+        outcome="correct",
+    )
+    snapshot = ProgressSnapshot(
+        version=1, exported_at=now, items=[item], attempts=[imported]
+    )
+
+    repository = InMemoryPracticeRepository([item])
+    repository.record_attempt(stored)
+    merged = ImportProgress(repository).run(snapshot)
+
+    assert len(merged.attempts) == 1
+    assert repository.list_attempts() == [stored]
+
+    streamed = InMemoryPracticeRepository([item])
+    streamed.record_attempt(stored)
+    summary = ImportProgress(streamed).run_records([item, imported])
+
+    assert summary.attempts_added == 0
+    assert summary.total_attempts == 1
+    assert streamed.list_attempts() == [stored]
+
+
+def test_replace_progress_drops_existing_state() -> None:
+    now = datetime(2025, 1, 1, 9, 0, 0)
+    repository = InMemoryPracticeRepository(
+        [LearningItem(id="old", prompt="O", status="review", order=1, review_level=3)]
+    )
+    repository.record_attempt(Attempt(item_id="old", timestamp=now, outcome="correct"))
+    item = LearningItem(id="new", prompt="N", status="new", order=1)
+    attempts = [
+        Attempt(item_id="new", timestamp=now + timedelta(minutes=index), outcome="skip")
+        for index in range(3)
+    ]
+
+    summary = ReplaceProgress(repository).run([item], iter(attempts))
+
+    assert repository.list_items() == [item]
+    assert repository.list_attempts() == attempts
+    assert (summary.total_items, summary.total_attempts) == (1, 3)
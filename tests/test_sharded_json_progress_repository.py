@@ -0,0 +1,91 @@
+"""Unit tests for the sharded JSON progress repository."""
+
+from __future__ import annotations
+
+import json
+
+import pytest
+
+from python_learning_orchestrated.adapters.json_file_progress_repository import (
+    JsonFileProgressRepository,
+)
+from python_learning_orchestrated.adapters.sharded_json_progress_repository import (
+    ShardedJsonFileProgressRepository,
+    migrate_progress_file_to_shards,
+)
+
+
+def test_per_user_files_keep_users_isolated(tmp_path) -> None:
+    """Each user should be stored in their own file."""
+    repository = ShardedJsonFileProgressRepository(tmp_path / "progress")
+
+    repository.save_progress("user-1", {"completed_lessons": ["variables"]})
+    repository.save_progress("User 2", {"completed_lessons": ["loops"]})
+
+    files = sorted((tmp_path / "progress").glob("*-*.json"))
+    assert len(files) == 2
+    assert [json.loads(path.read_text(encoding="utf-8")) for path in files] == [
+        {"user-1": {"completed_lessons": ["variables"]}},
+        {"User 2": {"completed_lessons": ["loops"]}},
+    ]
+    assert repository.get_progress("User 2") == {"completed_lessons": ["loops"]}
+    assert json.loads((tmp_path / "progress" / "layout.json").read_text()) == {
+        "version": 1,
+        "mode": "per-user",
+        "shard_count": None,
+    }
+
+
+def test_reset_progress_unlinks_user_file(tmp_path) -> None:
+    """Reset in per-user mode should remove the user's file."""
+    repository = ShardedJsonFileProgressRepository(tmp_path)
+    repository.save_progress("user-1", {"completed_lessons": ["variables"]})
+    repository.save_progress("user-2", {"completed_lessons": ["loops"]})
+
+    repository.reset_progress("user-1")
+
+    assert len(list(tmp_path.glob("*-*.json"))) == 1
+    assert repository.get_progress("user-1") == {}
+    assert repository.get_progress("user-2") == {"completed_lessons": ["loops"]}
+
+
+def test_hash_buckets_spread_users_over_shard_files(tmp_path) -> None:
+    """Bucketed mode should use at most shard_count files."""
+    repository = ShardedJsonFileProgressRepository(tmp_path, shard_count=4)
+
+    repository.apply_changes(
+        {f"user-{index}": {"lesson_id": f"lesson-{index}"} for index in range(40)}
+    )
+    repository.reset_progress("user-3")
+
+    assert 1 < len(list(tmp_path.glob("shard-*.json"))) <= 4
+    assert repository.get_progress("user-7") == {"lesson_id": "lesson-7"}
+    assert repository.get_progress("user-3") == {}
+
+
+def test_reopening_uses_the_saved_layout_and_rejects_another(tmp_path) -> None:
+    """A bucketed directory should not read back empty under another layout."""
+    ShardedJsonFileProgressRepository(tmp_path, shard_count=4).save_progress(
+        "user-1", {"lesson_id": "loops"}
+    )
+
+    reopened = ShardedJsonFileProgressRepository(tmp_path)
+
+    assert reopened.get_progress("user-1") == {"lesson_id": "loops"}
+    with pytest.raises(ValueError, match="holds 4 hash-bucket shards"):
+        ShardedJsonFileProgressRepository(tmp_path, shard_count=8)
+
+
+def test_migrate_progress_file_to_shards_copies_every_user(tmp_path) -> None:
+    """Migration should copy all users from the monolithic file."""
+    source_file = tmp_path / "progress.json"
+    source = JsonFileProgressRepository(source_file)
+    source.save_progress("user-1", {"completed_lessons": ["variables"]})
+    source.save_progress("user-2", {"completed_lessons": ["loops"]})
+
+    migrated = migrate_progress_file_to_shards(source_file, tmp_path / "shards")
+
+    target = ShardedJsonFileProgressRepository(tmp_path / "shards")
+    assert migrated == 2
+    assert target.get_progress("user-1") == {"completed_lessons": ["variables"]}
+    assert target.get_progress("user-2") == {"completed_lessons": ["loops"]}
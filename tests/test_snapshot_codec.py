@@ -0,0 +1,227 @@
+"""Tests for the shared snapshot JSON codec."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta, timezone
+
+import pytest
+
+from python_learning_orchestrated.adapters.snapshot_codec import (
+    attempt_from_dict,
+    decode_attempts,
+    decode_timestamp,
+    encode_timestamp,
+    item_from_dict,
+    item_to_dict,
+    parse_timestamp,
+    snapshot_from_payload,
+    snapshot_to_payload,
+)
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+
+FIXED_NOW = datetime(2025, 1, 1, 9, 0, 0)
+
+
+def test_snapshot_payload_round_trip() -> None:
+    snapshot = ProgressSnapshot(
+        version=1,
+        exported_at=FIXED_NOW,
+        items=[
+            LearningItem(id="a", prompt="A", status="new", order=1),
+            LearningItem(
+                id="b",
+                prompt="B",
+                status="review",
+                order=2,
+                due_at=datetime(2025, 1, 2, tzinfo=UTC),
+                review_level=1,
+                interval_minutes=1440,
+            ),
+        ],
+        attempts=[Attempt(item_id="b", timestamp=FIXED_NOW, outcome="incorrect")],
+    )
+
+    assert snapshot_from_payload(snapshot_to_payload(snapshot)) == snapshot
+
+
+def test_v2_payload_stores_epoch_microseconds_and_reads_both_versions() -> None:
+    due_at = datetime(2025, 1, 2, 3, 4, 5, 678901)
+    snapshot = ProgressSnapshot(
+        version=2,
+        exported_at=FIXED_NOW,
+        items=[
+            LearningItem(id="a", prompt="A", status="review", order=1, due_at=due_at)
+        ],
+        attempts=[Attempt(item_id="a", timestamp=FIXED_NOW, outcome="correct")],
+    )
+
+    payload = snapshot_to_payload(snapshot)
+
+    assert payload["exported_at"] == 1_735_722_000_000_000
+    assert payload["attempts"] == [
+        {"item_id": "a", "timestamp": 1_735_722_000_000_000, "outcome": "correct"}
+    ]
+    assert snapshot_from_payload(payload) == snapshot
+    aware_snapshot = replace(
+        snapshot,
+        attempts=[
+            Attempt(
+                item_id="a",
+                timestamp=datetime(
+                    2025, 1, 1, 4, 0, tzinfo=timezone(-timedelta(hours=5))
+                ),
+                outcome="correct",
+            )
+        ],
+    )
+    assert (
+        snapshot_from_payload(snapshot_to_payload(aware_snapshot, columnar=True))
+        == aware_snapshot
+    )
+    v1_payload = snapshot_to_payload(replace(snapshot, version=1))
+    assert snapshot_from_payload(v1_payload) == replace(snapshot, version=1)
+
+
+def test_timestamps_keep_their_utc_offset() -> None:
+    aware = datetime(2025, 1, 1, 10, 0, tzinfo=timezone(timedelta(hours=1)))
+
+    encoded = encode_timestamp(aware)
+
+    assert encoded == "2025-01-01T10:00:00+01:00"
+    decoded = decode_timestamp(encoded)
+    assert decoded == aware
+    assert decoded is not None and decoded.utcoffset() == timedelta(hours=1)
+    assert decode_timestamp(None) is None
+
+
+def test_epoch_timestamps_keep_their_utc_offset() -> None:
+    aware = datetime(2025, 1, 1, 10, 0, tzinfo=timezone(timedelta(hours=1)))
+
+    encoded = encode_timestamp(aware, epoch_timestamps=True)
+
+    assert encoded == [1_735_722_000_000_000, 60]
+    decoded = decode_timestamp(encoded)
+    assert decoded == aware
+    assert decoded is not None and decoded.utcoffset() == timedelta(hours=1)
+    assert decode_timestamp(encode_timestamp(FIXED_NOW, epoch_timestamps=True)) == (
+        FIXED_NOW
+    )
+    with pytest.raises(ValueError):
+        decode_timestamp([1_735_722_000_000_000])
+
+
+def test_item_from_dict_falls_back_to_lenient_decoding() -> None:
+    assert item_from_dict(
+        {"id": 7, "order": "4", "status": "archived", "review_level": None}
+    ) == LearningItem(id="7", prompt="", status="new", order=4)
+    assert item_from_dict(
+        {**item_to_dict(LearningItem(id="a", prompt="A", status="new", order=1))}
+    ) == LearningItem(id="a", prompt="A", status="new", order=1)
+
+
+def test_attempt_decoding_skips_invalid_entries() -> None:
+    entries: list[object] = [
+        {"item_id": "a", "timestamp": FIXED_NOW.isoformat(), "outcome": "bogus"},
+        {"item_id": "a", "timestamp": "not-a-date", "outcome": "correct"},
+        {"timestamp": FIXED_NOW.isoformat()},
+        "not-an-object",
+    ]
+
+    assert list(decode_attempts(entries)) == [
+        Attempt(item_id="a", timestamp=FIXED_NOW, outcome="skip")
+    ]
+    assert attempt_from_dict({"item_id": "a", "timestamp": [1]}) is None
+    assert attempt_from_dict({"item_id": "a", "timestamp": True}) is None
+
+
+def test_snapshot_decoding_rejects_unparseable_attempt_timestamps() -> None:
+    row_payload: dict[str, object] = {
+        "attempts": [{"item_id": "a", "timestamp": "garbage", "outcome": "skip"}]
+    }
+    columnar_payload: dict[str, object] = {
+        "layout": "columnar",
+        "attempts": {
+            "item": [0],
+            "timestamp": ["garbage"],
+            "outcome": [0],
+            "item_ids": ["a"],
+            "outcomes": ["skip"],
+        },
+    }
+
+    for payload in (row_payload, columnar_payload):
+        with pytest.raises(ValueError, match="'a' has invalid timestamp 'garbage'"):
+            snapshot_from_payload(payload)
+    with pytest.raises(ValueError):
+        parse_timestamp("yesterday")
+
+
+def test_columnar_payload_round_trips_and_is_detected() -> None:
+    snapshot = ProgressSnapshot(
+        version=2,
+        exported_at=FIXED_NOW,
+        items=[
+            LearningItem(id="a", prompt="A", status="new", order=1),
+            LearningItem(
+                id="b", prompt="B", status="review", order=2, due_at=FIXED_NOW
+            ),
+        ],
+        attempts=[
+            Attempt(item_id="b", timestamp=FIXED_NOW, outcome="correct"),
+            Attempt(item_id="a", timestamp=FIXED_NOW, outcome="skip"),
+            Attempt(item_id="b", timestamp=FIXED_NOW, outcome="correct"),
+        ],
+    )
+
+    payload = snapshot_to_payload(snapshot, columnar=True)
+
+    assert payload["layout"] == "columnar"
+    assert payload["attempts"] == {
+        "item": [0, 1, 0],
+        "timestamp": [1_735_722_000_000_000] * 3,
+        "outcome": [0, 1, 0],
+        "item_ids": ["b", "a"],
+        "outcomes": ["correct", "skip"],
+    }
+    assert snapshot_from_payload(payload) == snapshot
+
+
+def test_columnar_decoding_skips_malformed_rows() -> None:
+    payload: dict[str, object] = {
+        "items": {"id": ["a", "b"], "order": [1]},
+        "attempts": {
+            "item": [0, 5, "x", 0],
+            "timestamp": ["2025-01-01T09:00:00", "2025-01-01T09:00:00", None, None],
+            "outcome": [9],
+            "item_ids": ["a"],
+            "outcomes": ["correct"],
+        },
+    }
+
+    snapshot = snapshot_from_payload(payload)
+
+    assert snapshot.items == [
+        LearningItem(id="a", prompt="", status="new", order=1),
+        LearningItem(id="b", prompt="", status="new", order=0),
+    ]
+    assert snapshot.attempts == [
+        Attempt(item_id="a", timestamp=FIXED_NOW, outcome="skip")
+    ]
+
+
+def test_delta_marker_round_trips() -> None:
+    snapshot = ProgressSnapshot(
+        version=2,
+        exported_at=FIXED_NOW,
+        items=[],
+        attempts=[],
+        delta_since=FIXED_NOW - timedelta(days=1),
+    )
+
+    payload = snapshot_to_payload(snapshot)
+
+    assert payload["delta_since"] == 1_735_635_600_000_000
+    assert snapshot_from_payload(payload) == snapshot
+    assert "delta_since" not in snapshot_to_payload(replace(snapshot, delta_since=None))
@@ -0,0 +1,84 @@
+"""Tests for merging many snapshot files on a process pool."""
+
+from __future__ import annotations
+
+import random
+from datetime import datetime, timedelta
+
+import pytest
+
+from python_learning_orchestrated.adapters.in_memory_practice_repository import (
+    InMemoryPracticeRepository,
+)
+from python_learning_orchestrated.adapters.json_file_progress_snapshot_store import (
+    JsonFileProgressSnapshotStore,
+)
+from python_learning_orchestrated.adapters.snapshot_reduce import (
+    merge_snapshot_files,
+)
+from python_learning_orchestrated.application.progress_transfer import (
+    ImportProgress,
+)
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.practice_progress import ProgressSnapshot
+
+
+def test_merge_snapshot_files_matches_importing_files_in_order(tmp_path) -> None:
+    rng = random.Random(3)
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    paths = []
+    for index in range(5):
+        snapshot = ProgressSnapshot(
+            version=1,
+            exported_at=start + timedelta(days=index),
+            items=[
+                LearningItem(
+                    id=f"item-{item}",
+                    prompt=f"P{index}",
+                    status=rng.choice(["new", "review"]),
+                    order=item,
+                    review_level=rng.randint(0, 2),
+                )
+                for item in rng.sample(range(10), 6)
+            ],
+            attempts=[
+                Attempt(
+                    item_id=f"item-{rng.randint(0, 9)}",
+                    timestamp=start + timedelta(minutes=rng.randint(0, 40)),
+                    outcome=rng.choice(["correct", "incorrect"]),
+                )
+                for _ in range(30)
+            ],
+        )
+        path = tmp_path / f"snapshot-{index}.json"
+        JsonFileProgressSnapshotStore(path).save(snapshot)
+        paths.append(str(path))
+    sequential = InMemoryPracticeRepository()
+    for path in paths:
+        ImportProgress(sequential).run_records(
+            JsonFileProgressSnapshotStore(path).iter_records()
+        )
+
+    merged = merge_snapshot_files(paths, _load_json, max_workers=2)
+    combined = InMemoryPracticeRepository()
+    ImportProgress(combined).run_records([*merged.items, *merged.attempts])
+
+    assert merged.exported_at == start + timedelta(days=4)
+    assert merge_snapshot_files(paths, _load_json, max_workers=1) == merged
+    assert sorted(combined.list_items(), key=lambda item: item.id) == sorted(
+        sequential.list_items(), key=lambda item: item.id
+    )
+    assert sorted(
+        combined.list_attempts(), key=lambda entry: (entry.timestamp, entry.item_id)
+    ) == sorted(
+        sequential.list_attempts(), key=lambda entry: (entry.timestamp, entry.item_id)
+    )
+
+
+def test_merge_snapshot_files_requires_files() -> None:
+    with pytest.raises(ValueError, match="no snapshot files"):
+        merge_snapshot_files([], _load_json)
+
+
+def _load_json(path: str) -> ProgressSnapshot:
+    return JsonFileProgressSnapshotStore(path).load()
@@ -0,0 +1,128 @@
+"""Tests for the SQLite practice repository adapter."""
+
+from __future__ import annotations
+
+import sqlite3
+from dataclasses import replace
+from datetime import datetime, timedelta
+
+from python_learning_orchestrated.adapters.sqlite_practice_repository import (
+    SqlitePracticeRepository,
+)
+from python_learning_orchestrated.domain.practice import (
+    Attempt,
+    LearningItem,
+    select_next_item,
+)
+
+FIXED_NOW = datetime(2025, 1, 1, 9, 0, 0)
+
+
+def _items() -> list[LearningItem]:
+    return [
+        LearningItem(id="new-2", prompt="N2", status="new", order=2),
+        LearningItem(id="new-1", prompt="N1", status="new", order=1),
+        LearningItem(
+            id="review-b",
+            prompt="B",
+            status="review",
+            order=5,
+            due_at=FIXED_NOW - timedelta(minutes=5),
+            review_level=1,
+            interval_minutes=1440,
+        ),
+        LearningItem(
+            id="review-a",
+            prompt="A",
+            status="review",
+            order=6,
+            due_at=FIXED_NOW - timedelta(minutes=5, microseconds=-1),
+        ),
+    ]
+
+
+def test_seed_items_round_trip_and_persist_across_connections(tmp_path) -> None:
+    db_path = tmp_path / "state" / "session.db"
+    repository = SqlitePracticeRepository(db_path, _items())
+    repository.close()
+
+    reopened = SqlitePracticeRepository(db_path, [])
+
+    assert reopened.list_items() == _items()
+
+
+def test_next_item_matches_select_next_item(tmp_path) -> None:
+    repository = SqlitePracticeRepository(tmp_path / "session.db", _items())
+
+    for now in [
+        FIXED_NOW - timedelta(hours=1),
+        FIXED_NOW - timedelta(minutes=5),
+        FIXED_NOW,
+    ]:
+        assert repository.next_item(now) == select_next_item(_items(), now)
+
+
+def test_next_item_uses_status_indexes(tmp_path) -> None:
+    db_path = tmp_path / "session.db"
+    SqlitePracticeRepository(db_path, _items()).close()
+
+    connection = sqlite3.connect(db_path)
+    plan = " ".join(
+        str(row)
+        for row in connection.execute(
+            "EXPLAIN QUERY PLAN SELECT id FROM items WHERE status = 'review' "
+            "AND due_at IS NOT NULL AND due_at <= ? ORDER BY due_at, id LIMIT 1",
+            ("2025-01-01T09:00:00.000000",),
+        )
+    )
+
+    assert "items_status_due_at" in plan
+    assert connection.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+
+
+def test_apply_changes_updates_items_and_streams_attempts(tmp_path) -> None:
+    repository = SqlitePracticeRepository(tmp_path / "session.db", _items())
+    updated = LearningItem(
+        id="new-1",
+        prompt="N1",
+        status="review",
+        order=1,
+        due_at=FIXED_NOW + timedelta(days=1),
+        review_level=1,
+        interval_minutes=1440,
+    )
+    attempts = [
+        Attempt(item_id="new-1", timestamp=FIXED_NOW, outcome="correct"),
+        Attempt(item_id="new-2", timestamp=FIXED_NOW, outcome="skip"),
+    ]
+
+    repository.apply_changes([updated], attempts)
+
+    assert [item.id for item in repository.list_items()] == [
+        "new-2",
+        "new-1",
+        "review-b",
+        "review-a",
+    ]
+    assert repository.list_items()[1] == updated
+    assert list(repository.iter_attempts()) == attempts
+
+
+def test_replace_contents_swaps_in_a_new_database(tmp_path) -> None:
+    db_path = tmp_path / "practice.db"
+    repository = SqlitePracticeRepository(db_path, _items())
+    repository.record_attempt(
+        Attempt(item_id="new-1", timestamp=FIXED_NOW, outcome="correct")
+    )
+    replacement = [LearningItem(id="only", prompt="O", status="new", order=1)]
+    attempt = Attempt(item_id="only", timestamp=FIXED_NOW, outcome="skip")
+
+    repository.replace_contents(replacement, iter([attempt]))
+    repository.record_attempt(replace(attempt, outcome="correct"))
+    repository.close()
+
+    reopened = SqlitePracticeRepository(db_path, [])
+    assert reopened.list_items() == replacement
+    assert reopened.list_attempts() == [attempt, replace(attempt, outcome="correct")]
+    assert not (tmp_path / "practice.db.restore.tmp").exists()
+    reopened.close()
@@ -0,0 +1,58 @@
+"""Unit tests for the SQLite progress repository."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from python_learning_orchestrated.adapters.sqlite_progress_repository import (
+    SqliteProgressRepository,
+)
+
+
+def test_get_progress_missing_user_returns_empty(tmp_path) -> None:
+    """Unknown users should have empty progress."""
+    repository = SqliteProgressRepository(tmp_path / "state" / "progress.db")
+
+    assert repository.get_progress("user-123") == {}
+
+
+def test_save_and_get_progress_roundtrip_across_instances(tmp_path) -> None:
+    """Saved progress can be read by another repository instance."""
+    db_path = tmp_path / "progress.db"
+    first = SqliteProgressRepository(db_path)
+
+    first.save_progress("user-123", {"completed_lessons": ["variables"]})
+    first.save_progress("user-123", {"completed_lessons": ["variables", "loops"]})
+
+    second = SqliteProgressRepository(db_path)
+    assert second.get_progress("user-123") == {
+        "completed_lessons": ["variables", "loops"]
+    }
+
+
+def test_reset_progress_removes_only_target_user(tmp_path) -> None:
+    """Reset should delete one user's row and keep other users."""
+    repository = SqliteProgressRepository(tmp_path / "progress.db")
+    repository.save_progress("user-1", {"completed_lessons": ["lesson-1"]})
+    repository.save_progress("user-2", {"completed_lessons": ["lesson-2"]})
+
+    repository.reset_progress("user-1")
+
+    assert repository.get_progress("user-1") == {}
+    assert repository.get_progress("user-2") == {"completed_lessons": ["lesson-2"]}
+
+
+def test_shared_connection_handles_concurrent_users(tmp_path) -> None:
+    """Threads writing different users through one repository do not collide."""
+    repository = SqliteProgressRepository(tmp_path / "progress.db")
+
+    def record(index: int) -> None:
+        repository.save_progress(f"user-{index}", {"lesson_id": f"lesson-{index}"})
+        assert repository.get_progress(f"user-{index}") == {
+            "lesson_id": f"lesson-{index}"
+        }
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(record, range(20)))
+
+    assert repository.get_progress("user-19") == {"lesson_id": "lesson-19"}
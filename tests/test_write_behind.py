@@ -0,0 +1,123 @@
+"""Tests for write-behind repository decorators."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime
+from itertools import chain, repeat
+
+from python_learning_orchestrated.adapters.in_memory_practice_repository import (
+    InMemoryPracticeRepository,
+)
+from python_learning_orchestrated.adapters.in_memory_progress_repository import (
+    InMemoryProgressRepository,
+)
+from python_learning_orchestrated.adapters.write_behind import (
+    WriteBehindPracticeRepository,
+    WriteBehindProgressRepository,
+)
+from python_learning_orchestrated.domain.practice import Attempt, LearningItem
+from python_learning_orchestrated.domain.progress import LessonProgress
+
+FIXED_NOW = datetime(2025, 1, 1, 9, 0, 0)
+
+
+class RecordingPracticeRepository(InMemoryPracticeRepository):
+    def __init__(self, items: list[LearningItem]) -> None:
+        super().__init__(items)
+        self.commits: list[tuple[list[LearningItem], list[Attempt]]] = []
+
+    def apply_changes(self, items: list[LearningItem], attempts: list[Attempt]) -> None:
+        self.commits.append((list(items), list(attempts)))
+        super().apply_changes(items, attempts)
+
+
+class RecordingProgressRepository(InMemoryProgressRepository):
+    def __init__(self) -> None:
+        super().__init__()
+        self.commits: list[dict[str, LessonProgress | None]] = []
+
+    def apply_changes(self, changes: Mapping[str, LessonProgress | None]) -> None:
+        self.commits.append(dict(changes))
+        super().apply_changes(changes)
+
+
+def test_practice_writes_are_coalesced_into_one_group_commit() -> None:
+    inner = RecordingPracticeRepository(
+        [LearningItem(id="a", prompt="A", status="new", order=1)]
+    )
+    repository = WriteBehindPracticeRepository(
+        inner, max_unflushed_writes=10, max_delay_seconds=None
+    )
+    first = LearningItem(id="a", prompt="A", status="review", order=1, due_at=FIXED_NOW)
+    latest = LearningItem(id="a", prompt="A", status="review", order=1, review_level=2)
+    attempt = Attempt(item_id="a", timestamp=FIXED_NOW, outcome="correct")
+
+    repository.save_item(first)
+    repository.record_attempt(attempt)
+    repository.save_item(latest)
+
+    assert inner.commits == []
+    assert repository.list_items() == [latest]
+    assert repository.list_attempts() == [attempt]
+
+    repository.flush()
+
+    assert inner.commits == [([latest], [attempt])]
+    assert repository.unflushed_writes == 0
+    repository.close()
+
+
+def test_practice_buffer_flushes_when_bounded_loss_limit_is_reached() -> None:
+    inner = RecordingPracticeRepository([])
+    repository = WriteBehindPracticeRepository(
+        inner, max_unflushed_writes=2, max_delay_seconds=None
+    )
+
+    repository.record_attempt(Attempt(item_id="a", timestamp=FIXED_NOW, outcome="skip"))
+    assert inner.commits == []
+    repository.record_attempt(Attempt(item_id="b", timestamp=FIXED_NOW, outcome="skip"))
+
+    assert len(inner.commits) == 1
+    assert len(inner.list_attempts()) == 2
+    repository.close()
+
+
+def test_progress_buffer_flushes_after_max_delay() -> None:
+    inner = RecordingProgressRepository()
+    ticks = chain([0.0, 1.0, 10.0, 10.0], repeat(11.0))
+    repository = WriteBehindProgressRepository(
+        inner,
+        max_unflushed_writes=100,
+        max_delay_seconds=5.0,
+        clock=lambda: next(ticks),
+    )
+
+    repository.save_progress("user-1", {"completed_lessons": ["variables"]})
+    repository.reset_progress("user-2")
+    repository.save_progress("user-1", {"completed_lessons": ["variables", "loops"]})
+
+    assert inner.commits == [
+        {"user-1": {"completed_lessons": ["variables"]}, "user-2": None}
+    ]
+    assert repository.get_progress("user-1") == {
+        "completed_lessons": ["variables", "loops"]
+    }
+    assert inner.get_progress("user-1") == {"completed_lessons": ["variables"]}
+    repository.close()
+
+
+def test_progress_close_flushes_pending_changes() -> None:
+    inner = RecordingProgressRepository()
+    inner.save_progress("user-2", {"completed_lessons": ["variables"]})
+    repository = WriteBehindProgressRepository(inner, max_delay_seconds=None)
+
+    repository.save_progress("user-1", {"lesson_id": "loops"})
+    repository.reset_progress("user-2")
+    assert repository.get_progress("user-2") == {}
+
+    repository.close()
+
+    assert inner.get_progress("user-1") == {"lesson_id": "loops"}
+    assert inner.get_progress("user-2") == {}
+    assert len(inner.commits) == 1